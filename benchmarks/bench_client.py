@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Client overhead benchmark
+
+Time requests answering the player fixture:
+  requests        requests.Session GET and json decode, against a local
+                  server (same json decoder as Api)
+  Api.get         Api.get, same request
+  Api.get_player  Api.get_player (response object built, fields lazy)
+  overhead        Api.get time minus requests.Session GET and json decode,
+                  both on a transport answering without network: median
+                  of the differences by request pair, spread between
+                  their quartiles
+
+Usage: PYTHONPATH=. benchmarks/bench_client.py [-n 500] [--pairs 3000]
+                                               [--json] [-o FILE]
+"""
+
+import os
+import requests
+import statistics
+import time
+
+from requests.adapters import BaseAdapter
+
+from common import FIXTURES, best_of, parser, report
+
+from hypyxel import Api
+from hypyxel.utils import json_decoder
+from tests.utils import StubServer
+
+
+class FixtureAdapter(BaseAdapter):
+    """
+    Transport answering every request with the same body, without network
+    """
+
+    def __init__(self, body: bytes) -> None:
+        super().__init__()
+        self._body = body
+
+    def send(self, request, **kwargs) -> requests.Response:
+        r = requests.Response()
+        r.status_code = 200
+        r.headers['Content-Type'] = 'application/json'
+        r._content = self._body
+        r.url = request.url
+        r.request = request
+        return r
+
+    def close(self) -> None:
+        pass
+
+
+def overhead(body: bytes, loads, pairs: int) -> dict:
+    """
+    Time Api.get against a bare session, on a transport without network
+    Both run alternately, in turn first, without reading the proxies of
+    the environment (the main source of noise)
+    :param body: Response body
+    :param loads: Json decoder of both clients
+    :param pairs: Number of request pairs
+    :return: Result dict (median difference and interquartile range)
+    """
+    host = 'http://fixture'
+    session = requests.Session()
+    api = Api(host=host, key='bench', decoder=loads)
+
+    for i in (session, api._session):
+        i.mount(host, FixtureAdapter(body))
+        i.trust_env = False
+
+    params = {'uuid': 'bench', 'key': 'bench'}
+
+    def bare():
+        loads(session.get(f'{host}/player', params=params).content)
+
+    def client():
+        api.get('/player', {'uuid': 'bench'})
+
+    clock = time.perf_counter
+    samples = []
+    for i in range(pairs):
+        first, second = (client, bare) if i % 2 else (bare, client)
+
+        start = clock()
+        first()
+        middle = clock()
+        second()
+        end = clock()
+
+        if i % 2:
+            samples.append((middle - start) - (end - middle))
+        else:
+            samples.append((end - middle) - (middle - start))
+
+    api.close()
+    session.close()
+
+    q1, median, q3 = statistics.quantiles(samples, n=4)
+    return {'time': median, 'spread': q3 - q1}
+
+
+def main() -> None:
+    p = parser(__doc__)
+    p.add_argument('-n', '--number', type=int, default=500,
+                   help="Requests by run")
+    p.add_argument('--pairs', type=int, default=3000,
+                   help="Request pairs of the overhead measure")
+    args = p.parse_args()
+
+    with open(os.path.join(FIXTURES, 'player.get'), 'rb') as f:
+        body = f.read()
+
+    loads = json_decoder()
+
+    with StubServer((200, {'Content-Type': 'application/json'}, body)) as s:
+        session = requests.Session()
+        api = Api(host=s.host, key='bench', decoder=loads)
+        url = f'{s.host}/player'
+        params = {'uuid': 'bench', 'key': 'bench'}
+
+        cases = {
+            'requests': lambda: loads(session.get(url,
+                                                  params=params).content),
+            'Api.get': lambda: api.get('/player', {'uuid': 'bench'}),
+            'Api.get_player': lambda: api.get_player('bench'),
+        }
+
+        results = {}
+        for k, v in cases.items():
+            v()  # Open the connection
+            s.requests.clear()
+            results[k] = {'time': best_of(v, args.number, 3)}
+
+        api.close()
+        session.close()
+
+    results['overhead'] = overhead(body, loads, args.pairs)
+
+    report('client', results, args, (
+        ('time', 'seconds', '.2e'),
+        ('spread', 'spread', '.2e'),
+    ))
+
+
+if __name__ == '__main__':
+    main()
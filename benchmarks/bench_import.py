@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Import time benchmark
+
+Time fresh interpreters running each statement, minus an empty one.
+'from hypyxel import Api, AsyncApi' costs what 'import hypyxel' used to
+cost before the lazy loading.
+
+Usage: PYTHONPATH=. benchmarks/bench_import.py [-n 20] [--json] [-o FILE]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+from common import parser, report
+
+STATEMENTS = (
+    'import hypyxel',
+    'from hypyxel import KeyPool',
+    'from hypyxel import Api',
+    'from hypyxel import Api, AsyncApi',
+)
+
+# Print the modules loaded by the statement
+_MODULES = "import sys; print(len(sys.modules))"
+
+
+def run(statement: str, repeat: int) -> dict:
+    """
+    Time a statement in fresh interpreters
+    :param statement: Python statement
+    :param repeat: Number of interpreters
+    :return: Median time (seconds) and number of loaded modules
+    """
+    cmd = [sys.executable, '-c', f'{statement}\n{_MODULES}']
+    times, modules = [], 0
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = subprocess.run(cmd, check=True, stdout=subprocess.PIPE)
+        times.append(time.perf_counter() - start)
+        modules = int(out.stdout)
+
+    return {'time': statistics.median(times), 'modules': modules}
+
+
+def main() -> None:
+    p = parser(__doc__)
+    p.add_argument('-n', '--repeat', type=int, default=20,
+                   help="Interpreters by statement")
+    args = p.parse_args()
+
+    base = run('pass', args.repeat)
+    results = {}
+    for i in STATEMENTS:
+        r = run(i, args.repeat)
+        results[i] = {'time': r['time'] - base['time'],
+                      'modules': r['modules'] - base['modules']}
+
+    report('import', results, args, (('time', 'seconds', '.4f'),
+                                     ('modules', 'modules', 'd')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Response parsing benchmark
+
+For every response class, on the tests/test_server fixture and on
+synthetic payloads (tests/payloads.py) scaled up 10x, 100x..., measure:
+  decode  seconds to decode the json body
+  init    seconds to build the response object (fields parse lazily)
+  parse   seconds to build it and parse every field
+  memory  bytes allocated by the parsed objects (json object excluded)
+  raw     bytes allocated by the decoded json object
+
+Usage: PYTHONPATH=. benchmarks/bench_parse.py [--scales 1,10,100] [--seed 0]
+                                              [-k Guild] [--json] [-o FILE]
+"""
+
+import json
+import os
+import tracemalloc
+
+from common import FIXTURES, best_of, parser, report
+
+from hypyxel import response
+from tests.payloads import Payloads
+
+# Response class by endpoint
+CLASSES = {
+    '/boosters': 'BoostersResponse',
+    '/friends': 'FriendResponse',
+    '/gameCounts': 'GameCountsResponse',
+    '/guild': 'GuildResponse',
+    '/key': 'KeyResponse',
+    '/player': 'PlayerResponse',
+    '/recentGames': 'RecentGamesResponse',
+    '/leaderboards': 'LeaderboardResponse',
+    '/status': 'StatusResponse',
+    '/watchdogstats': 'WatchdogResponse',
+    '/resources/achievements': 'AchievementsResourceResponse',
+    '/resources/challenges': 'ChallengesResourceResponse',
+    '/resources/quests': 'QuestsResourceResponse',
+    '/resources/guilds/achievements': 'GuildAchievementsResourceResponse',
+    '/resources/guilds/permissions': 'PermissionsResourceResponse',
+    '/resources/skyblock/collections': 'SkyblockCollectionsResponse',
+    '/resources/skyblock/skills': 'SkyblockSkillsResponse',
+}
+
+
+def fixture(path: str) -> bytes:
+    """
+    Get the tests/test_server fixture of an endpoint
+    :param path: REST endpoint
+    :return: Json body, None if the endpoint has no fixture
+    """
+    name = path.strip('/').replace('/', '.')
+    try:
+        with open(os.path.join(FIXTURES, f'{name}.get'), 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def measure(cls, body: bytes) -> dict:
+    """
+    Benchmark the parsing of one payload
+    :param cls: Response class
+    :param body: Json body
+    :return: Result dict
+    """
+    raw = json.loads(body)
+    number = max(1, 20000 // len(body))
+
+    def parse():
+        cls(raw)._parse_all()
+
+    r = {
+        'size': len(body),
+        'decode': best_of(lambda: json.loads(body), number),
+        'init': best_of(lambda: cls(raw), number),
+        'parse': best_of(parse, number),
+    }
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        raw = json.loads(body)
+        r['raw'] = tracemalloc.get_traced_memory()[0] - before
+
+        before = tracemalloc.get_traced_memory()[0]
+        obj = cls(raw)
+        obj._parse_all()
+        r['memory'] = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    del obj
+    return r
+
+
+def main() -> None:
+    p = parser(__doc__)
+    p.add_argument('--scales', default='1,10,100',
+                   help="Synthetic payload scales, comma separated")
+    p.add_argument('--seed', type=int, default=0,
+                   help="Synthetic payload seed")
+    p.add_argument('-k', '--filter', default='',
+                   help="Only benchmark classes containing this string")
+    args = p.parse_args()
+
+    results = {}
+    for path, cls_name in CLASSES.items():
+        if args.filter not in cls_name:
+            continue
+
+        cls = getattr(response, cls_name)
+
+        body = fixture(path)
+        if body is not None:
+            results[f'{cls_name}.fixture'] = measure(cls, body)
+
+        for i in map(float, args.scales.split(',')):
+            payload = Payloads(args.seed).endpoint(path, i)
+            body = json.dumps(payload).encode()
+            results[f'{cls_name}.x{i:g}'] = measure(cls, body)
+
+    report('parse', results, args, (
+        ('size', 'bytes', 'd'),
+        ('decode', 'decode (s)', '.2e'),
+        ('init', 'init (s)', '.2e'),
+        ('parse', 'parse (s)', '.2e'),
+        ('memory', 'memory', 'd'),
+        ('raw', 'raw', 'd'),
+    ))
+
+
+if __name__ == '__main__':
+    main()
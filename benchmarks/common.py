@@ -0,0 +1,87 @@
+"""
+Helpers shared by the benchmarks: timing, command line and results
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Fixtures served by tests/test_server
+FIXTURES = os.path.join(ROOT, 'tests', 'test_server', 'response')
+
+
+def best_of(fn, number: int, repeat: int = 5) -> float:
+    """
+    Time a function, keeping the best of several runs
+    :param fn: Function without parameters
+    :param number: Calls by run
+    :param repeat: Number of runs
+    :return: Seconds by call
+    """
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best / number
+
+
+def parser(doc: str) -> argparse.ArgumentParser:
+    """
+    Build the command line parser of a benchmark
+    :param doc: Benchmark module docstring
+    :return: ArgumentParser with the output options
+    """
+    p = argparse.ArgumentParser(
+        description=doc.strip().split('\n')[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=doc
+    )
+    p.add_argument('--json', action='store_true',
+                   help="Print results as json")
+    p.add_argument('-o', '--output', help="Write json results to a file")
+    return p
+
+
+def report(name: str, results: dict, args, columns=()) -> None:
+    """
+    Output the results of a benchmark
+    :param name: Benchmark name
+    :param results: Result dict by case
+    :param args: Parsed command line
+    :param columns: (key, title, format) of the table columns
+    """
+    from hypyxel.__version__ import __version__
+
+    doc = {
+        'benchmark': name,
+        'hypyxel': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(doc, f, indent=2)
+
+    if args.json:
+        json.dump(doc, sys.stdout, indent=2)
+        print()
+        return
+
+    width = max(map(len, results), default=0)
+    print(' ' * width, *(f'{t:>12}' for _, t, _ in columns))
+    for k, v in results.items():
+        print(f'{k:<{width}}',
+              *(format(v[c], f).rjust(12) if c in v else ' ' * 12
+                for c, _, f in columns))
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Run every benchmark, collecting their json results in one document
+
+Compare releases by diffing the documents written by -o.
+
+Usage: PYTHONPATH=. benchmarks/run.py [-o FILE] [bench_parse ...]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+BENCHMARKS = ('bench_import', 'bench_parse', 'bench_client')
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    p.add_argument('-o', '--output', help="Write the results to a file")
+    p.add_argument('benchmarks', nargs='*', default=BENCHMARKS,
+                   help="Benchmarks to run (default: every one)")
+    args = p.parse_args()
+
+    results = {}
+    for i in args.benchmarks:
+        print(f"Running {i}...", file=sys.stderr)
+        out = subprocess.run(
+            [sys.executable, os.path.join(HERE, f'{i}.py'), '--json'],
+            check=True, stdout=subprocess.PIPE
+        ).stdout
+        results[i] = json.loads(out)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -8,4 +8,56 @@ Not affiliated with Hypixel, Inc
 
 from .__version__ import *
 
-from .api import Api
+from importlib import import_module
+
+import sys
+
+# Public names, by module: loaded on first access so that import hypyxel
+# stays cheap (requests, aiohttp and the response classes load with Api)
+_LAZY = {
+    'Api': 'api',
+    'AsyncApi': 'async_api',
+    'ResponseCache': 'cache',
+    'SQLiteCache': 'cache',
+    'KeyPool': 'keys',
+    'Metrics': 'metrics',
+    'RateLimiter': 'ratelimit',
+    'RetryPolicy': 'retry',
+    'CompactUUID': 'uuids',
+    'compact_uuids': 'uuids',
+}
+
+# Submodules, also loaded on first access (ex: hypyxel.response)
+_MODULES = ('api', 'async_api', 'cache', 'fields', 'keys', 'metrics',
+            'ratelimit', 'response', 'response_objects', 'retry',
+            'singleflight', 'utils', 'uuids')
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY and name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = import_module(f'.{_LAZY.get(name, name)}', __name__)
+    except ImportError as e:  # aiohttp is an optional dependency
+        raise AttributeError(f"{name} is not available: {e}") from e
+
+    if name in _MODULES:
+        return module
+
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_MODULES))
+
+
+if sys.version_info < (3, 7):  # No module __getattr__ (PEP 562)
+    for _name in _LAZY:
+        try:
+            __getattr__(_name)
+        except AttributeError:
+            pass
@@ -1,7 +1,23 @@
+import itertools
 import requests
 import json
+import time
 
+from requests.adapters import HTTPAdapter
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, Union
+
+from .cache import BaseCache, ResponseCache
+from .keys import KeyPool, KeyStats
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
 from .response import *
+from .utils import json_decoder, request_key
+from .uuids import CompactUUID
 
 
 class Guild:
@@ -26,8 +42,9 @@ class Guild:
         Perform GET request on /resources/guild/achievements endpoint
         :return: GuildAchievementsResponse object
         """
-        return GuildAchievementsResourceResponse(
-            self.root.get('/resources/guilds/achievements', public=True)
+        return self.root._resource(
+            GuildAchievementsResourceResponse,
+            '/resources/guilds/achievements'
         )
 
     @property
@@ -36,8 +53,9 @@ class Guild:
         Perform GET request on /resources/guild/permissions endpoint
         :return: GuildPermissionResponse object
         """
-        return PermissionsResourceResponse(
-            self.root.get('/resources/guilds/permissions', public=True)
+        return self.root._resource(
+            PermissionsResourceResponse,
+            '/resources/guilds/permissions'
         )
 
 
@@ -63,8 +81,9 @@ class Skyblock:
         Perform GET request on /resources/skyblock/collections endpoint
         :return: SyblockCollectionsResponse object
         """
-        return SkyblockCollectionsResponse(
-            self.root.get('/resources/skyblock/collections', public=True)
+        return self.root._resource(
+            SkyblockCollectionsResponse,
+            '/resources/skyblock/collections'
         )
 
     @property
@@ -73,8 +92,9 @@ class Skyblock:
         Perform GET requests on /resources/skyblock/skills endpoint
         :return: SkyblockSkillsResponse object
         """
-        return SkyblockSkillsResponse(
-            self.root.get('/resources/skyblock/skills', public=True)
+        return self.root._resource(
+            SkyblockSkillsResponse,
+            '/resources/skyblock/skills'
         )
 
 
@@ -100,8 +120,9 @@ class Resources:
         Perform GET request on /resources/achievements endpoint
         :return: AchievementsResourceResponse object
         """
-        return AchievementsResourceResponse(
-            self.root.get("/resources/achievements", public=True)
+        return self.root._resource(
+            AchievementsResourceResponse,
+            "/resources/achievements"
         )
 
     @property
@@ -110,8 +131,9 @@ class Resources:
         Perform GET request on /resources/challenges endpoint
         :return: ChallengesResourceResponse object
         """
-        return ChallengesResourceResponse(
-            self.root.get("/resources/challenges", public=True)
+        return self.root._resource(
+            ChallengesResourceResponse,
+            "/resources/challenges"
         )
 
     @property
@@ -120,8 +142,9 @@ class Resources:
         Perform GET request on /resources/quests endpoint
         :return: QuestsResourceResponse object
         """
-        return QuestsResourceResponse(
-            self.root.get("/resources/quests", public=True)
+        return self.root._resource(
+            QuestsResourceResponse,
+            "/resources/quests"
         )
 
     @property
@@ -141,34 +164,159 @@ class Resources:
         return Skyblock(self._root)
 
 
-class Api:
+class BaseApi:
     """
-    Main Hypyxel object
-    Managing all connections with requests library
+    Common Hypyxel object
+    Describing every endpoint, independently of the HTTP library used
     """
 
-    class ApiException(BaseException):
+    class ApiException(Exception):
         pass
 
-    def __init__(self, key, host="https://api.hypixel.net") -> None:
-        self._session = requests.Session()
+    def __init__(self, key, host="https://api.hypixel.net",
+                 rate_limit=None,
+                 adaptive=True,
+                 cache=None,
+                 decoder=None,
+                 retry: RetryPolicy = None,
+                 coalesce: bool = True,
+                 retention: str = 'keep',
+                 compact_uuids: bool = None,
+                 metrics=None,
+                 on_request=None,
+                 on_response=None,
+                 on_error=None) -> None:
+        """
+        :param key: API key, or several keys (list or KeyPool) sharing
+                    the requests
+        :param host: API host
+        :param rate_limit: RateLimiter (can be shared between Api objects)
+                           or number of request allowed per minute,
+                           applied to every keyed request
+        :param adaptive: Follow the quota headers sent by the server,
+                         creating a rate limiter (one by key) if needed
+        :param cache: ResponseCache, SQLiteCache (can be shared between
+                      Api objects) or True for a default in memory one
+        :param decoder: Function decoding json bytes, or name of the json
+                        library to use (fastest installed one by default)
+        :param retry: RetryPolicy for failed requests (default: RetryPolicy())
+        :param coalesce: Share one request between identical concurrent
+                         requests (same endpoint and parameters)
+        :param retention: What responses do with their raw json object once
+                          parsed: 'keep' it, 'compress' it (raw is rebuilt
+                          on access) or 'drop' it (raw raises ValueError).
+                          Cached json objects stay in the cache.
+        :param compact_uuids: Parse the UUIDs of the responses as
+                              CompactUUID, None for the process wide
+                              setting (see hypyxel.compact_uuids)
+        :param metrics: Metrics recording the activity of each endpoint
+                        (can be shared between Api objects) or True for
+                        a new one
+        :param on_request: Called before sending each HTTP request:
+                           on_request(path, params, attempt)
+        :param on_response: Called once a response body is received:
+                            on_response(path, status, size, elapsed)
+        :param on_error: Called on every failed attempt (connection
+                         failures, timeouts and failed responses, retried
+                         or not): on_error(path, exception)
+        """
+        if retention not in RETENTION_POLICIES:
+            raise ValueError(f"Unknown retention policy: {retention}")
+
         self._host = host
-        self._key = key
+
+        if isinstance(key, (list, tuple, set)):
+            key = KeyPool(key)
+
+        self._keys = key if isinstance(key, KeyPool) else None
+        self._key = None if self._keys else key
+
+        self._retry = retry if retry is not None else RetryPolicy()
+        self._coalesce = coalesce
+        self._retention = retention
+        self._compact = compact_uuids
+
+        self._loads = decoder if callable(decoder) else json_decoder(decoder)
+
+        self._cache = ResponseCache() if cache is True else cache
+
+        self._metrics = Metrics() if metrics is True else metrics
+        self._on_request = on_request
+        self._on_response = on_response
+        self._on_error = on_error
+
+        # Last resources catalogs, with their ETag / Last-Modified
+        self._catalogs = {}
+        self._validators = {}
+
+        self._limiter = None
+        self._adaptive = adaptive
+        self.rate_limiter = rate_limit
 
         self._resources = Resources(self)
 
-    def get(self, path: str,
-            params: dict = None,
-            public=False,
-            except_on_failure=True) -> json:
+    @property
+    def cache(self) -> BaseCache:
         """
-        Perform a GET request on the REST API
+        Get the response cache
+        :return: Cache object or None
+        """
+        return self._cache
+
+    @property
+    def metrics(self) -> Metrics:
+        """
+        Get the metrics recorded by endpoint
+        :return: Metrics object or None if disabled
+        """
+        return self._metrics
 
+    @property
+    def key_pool(self) -> KeyPool:
+        """
+        Get the key pool
+        :return: KeyPool object or None when using a single key
+        """
+        return self._keys
+
+    @property
+    def key_stats(self) -> Dict[str, KeyStats]:
+        """
+        Get the usage of every key of the pool
+        :return: KeyStats by key (empty when using a single key)
+        """
+        return self._keys.stats if self._keys is not None else {}
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """
+        Get the rate limiter applied to keyed requests
+        :return: RateLimiter object or None
+        """
+        return self._limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, limiter) -> None:
+        """
+        Set the rate limiter applied to keyed requests
+        ex: api.rate_limiter = RateLimiter.from_key(api.key)
+        :param limiter: RateLimiter, requests per minute or None
+        """
+        if isinstance(limiter, int):
+            limiter = RateLimiter(limiter)
+
+        if limiter is not None and not isinstance(limiter, RateLimiter):
+            raise ValueError("rate_limit should be a RateLimiter or an int")
+
+        self._limiter = limiter
+
+    def _prepare(self, path: str, params: dict, public: bool) -> tuple:
+        """
+        Check the request arguments and build the URL and its parameters
         :param path: REST endpoint to GET
         :param params: Parameters needed for the request
         :param public: Precise if the Endpoint require a key or not
-        :param except_on_failure: Raise an Exception on failure
-        :return: Json object obtain from the request response
+        :return: URL and parameters for the request
         """
         if type(path) is not str:
             raise ValueError("get(): path should be a string")
@@ -176,23 +324,355 @@ class Api:
         if params and type(params) is not dict:
             raise ValueError("get(): params should be a dictionary")
 
-        if not params:
-            params = {}
+        # CompactUUID is an int: send it as the hex string the API expects
+        params = {k: v.hex if isinstance(v, CompactUUID) else v
+                  for k, v in params.items()} if params else {}
 
-        if not public:
-            params["key"] = self._key
+        return f"{self._host}{path}", params
 
-        r = self._session.get(f"{self._host}{path}", params=params)
-        if except_on_failure and r.status_code != 200:
-            try:
-                j = json.loads(r.text)
-                raise self.ApiException(
-                    f"Hypyxel: {j.get('message', 'Unknown Error')}"
-                )
-            except json.JSONDecodeError:
+    def _select_key(self, public: bool) -> str:
+        """
+        Choose the API key of a request
+        :param public: Precise if the Endpoint require a key or not
+        :return: API key, None for public endpoints
+        """
+        if public:
+            return None
+
+        if self._keys is None:
+            return self._key
+
+        key = self._keys.acquire()
+        if key is None:
+            raise self.ApiException("Hypyxel: No valid API key left")
+
+        return key
+
+    def _key_limiter(self, key: str) -> RateLimiter:
+        """
+        Get the rate limiter following the server quota of a key
+        :param key: API key
+        :return: RateLimiter object or None
+        """
+        if self._keys is None:
+            return self._limiter
+
+        return self._keys.limiter(key)
+
+    def _limiters(self, key: str) -> tuple:
+        """
+        Get the rate limiters a request has to go through
+        :param key: API key, None for public endpoints
+        :return: RateLimiter objects
+        """
+        if key is None:
+            return ()
+
+        if self._keys is None:
+            return (self._limiter,) if self._limiter is not None else ()
+
+        return tuple(i for i in (self._limiter, self._keys.limiter(key))
+                     if i is not None)
+
+    def _throttle(self, status: int, headers, key: str) -> float:
+        """
+        Update the rate limiter and key usage from the response headers
+        :param status: HTTP status code
+        :param headers: Response headers
+        :param key: API key used, None for public endpoints
+        :return: Delay before sending the request again if throttled,
+                 None otherwise
+        """
+        if key is None:
+            quota = None
+        else:
+            quota = RateLimiter.parse_headers(headers)
+
+            if self._keys is not None:
+                self._keys.record(key, status, quota)
+
+        limiter = self._key_limiter(key) if key is not None else None
+
+        if quota and self._adaptive:
+            limit, remaining, reset = quota
+            if limiter is None:
+                # Reset is the time left in the window, not its length:
+                # start slow, the period shortens once a window resets
+                limiter = RateLimiter(limit, max(reset, 60.0), learn=True)
+
+                if self._keys is None:
+                    self._limiter = limiter
+                else:
+                    limiter = self._keys.set_limiter(key, limiter)
+
+            limiter.update(remaining, reset)
+
+        if status != 429:
+            return None
+
+        try:
+            delay = float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            delay = quota[2] if quota else 1.0
+
+        if limiter is not None:
+            limiter.update(0, delay)
+
+        return delay
+
+    def _retry_delay(self, policy: RetryPolicy, attempt: int,
+                     deadline: float, key: str,
+                     status: int = None, headers=None) -> float:
+        """
+        Update the rate limiter and decide if a request should be sent again
+        :param policy: RetryPolicy of the endpoint
+        :param attempt: Number of the attempt (starting at 0)
+        :param deadline: Time budget end (time.monotonic())
+        :param key: API key used, None for public endpoints
+        :param status: HTTP status code, None on connection failure
+        :param headers: Response headers
+        :return: Delay before the next attempt, None to stop
+        """
+        if status is None:
+            delay = policy.delay(attempt)
+        else:
+            delay = self._throttle(status, headers, key)
+
+            # Invalid key: take it out of rotation and use another one
+            if status == 403 and key is not None and self._keys is not None:
+                self._keys.disable(key)
+                return 0.0 if self._keys.active else None
+
+            if not policy.retry_status(status):
+                return None
+
+            if delay is None:
+                delay = policy.delay(attempt, headers.get('Retry-After'))
+
+        if attempt + 1 >= policy.attempts or \
+                time.monotonic() + delay > deadline:
+            return None
+
+        # Throttled keyed requests wait for the rate limiter instead
+        if status == 429 and key is not None and \
+                self._key_limiter(key) is not None:
+            return 0.0
+
+        return delay
+
+    def _sent(self, path: str, params: dict, attempt: int) -> float:
+        """
+        Record a request about to be sent
+        :param path: REST endpoint
+        :param params: Request parameters (API key excluded)
+        :param attempt: Number of the attempt (starting at 0)
+        :return: Start time, for _received()
+        """
+        if self._metrics is not None:
+            self._metrics._record(path, 'sent')
+        if self._on_request is not None:
+            self._on_request(path, params, attempt)
+
+        return time.perf_counter()
+
+    def _received(self, path: str, start: float, status: int,
+                  body: bytes) -> None:
+        """
+        Record a received response
+        :param path: REST endpoint
+        :param start: Request start time, from _sent()
+        :param status: HTTP status code
+        :param body: Response body
+        """
+        elapsed = time.perf_counter() - start
+
+        if self._metrics is not None:
+            self._metrics._record(path, 'received', status, len(body),
+                                  elapsed)
+        if self._on_response is not None:
+            self._on_response(path, status, len(body), elapsed)
+
+    def _failed(self, path: str, error: Exception) -> None:
+        """
+        Record a failed request
+        :param path: REST endpoint
+        :param error: Exception raised
+        """
+        if self._metrics is not None:
+            self._metrics._record(path, 'failed')
+        if self._on_error is not None:
+            self._on_error(path, error)
+
+    def _retrying(self, path: str, status: int) -> None:
+        """
+        Record a failed response, about to be sent again
+        :param path: REST endpoint
+        :param status: HTTP status code
+        """
+        if self._metrics is not None or self._on_error is not None:
+            self._failed(path, self.ApiException(
+                f"Hypyxel: HTTP {status}, sending the request again"
+            ))
+
+    def _decode(self, status: int, body: bytes,
+                except_on_failure: bool) -> json:
+        """
+        Decode a response body, raising ApiException on failure
+        The body is parsed once, error path included
+        :param status: HTTP status code
+        :param body: Response body
+        :param except_on_failure: Raise an Exception on failure
+        :return: Json object
+        """
+        failed = except_on_failure and status != 200
+
+        try:
+            j = self._loads(body)
+        except ValueError:
+            if failed:
                 raise self.ApiException("Hypyxel: Unknown Error")
+            raise
+
+        if failed:
+            raise self.ApiException(
+                f"Hypyxel: {j.get('message', 'Unknown Error')}"
+            )
+
+        return j
 
-        return json.loads(r.text)
+    def _conditional(self, path: str, public: bool) -> dict:
+        """
+        Get the conditional headers for a previously fetched resource
+        :param path: REST endpoint
+        :param public: Precise if the Endpoint require a key or not
+        :return: Request headers or None
+        """
+        v = self._validators.get(path) if public else None
+        if v is None:
+            return None
+
+        etag, modified, _ = v
+        h = {}
+        if etag:
+            h['If-None-Match'] = etag
+        if modified:
+            h['If-Modified-Since'] = modified
+
+        return h
+
+    def _finish(self, path: str, params: dict, public: bool,
+                status: int, headers, body: bytes,
+                except_on_failure: bool) -> json:
+        """
+        Build the json object of a response, storing it for later requests
+        :param path: REST endpoint
+        :param params: Request parameters
+        :param public: Precise if the Endpoint require a key or not
+        :param status: HTTP status code
+        :param headers: Response headers
+        :param body: Response body
+        :param except_on_failure: Raise an Exception on failure
+        :return: Json object
+        """
+        if status == 304 and path in self._validators:
+            data = self._validators[path][2]
+        else:
+            start = time.perf_counter()
+            try:
+                data = self._decode(status, body, except_on_failure)
+            except (self.ApiException, ValueError) as e:
+                self._failed(path, e)
+                raise
+
+            if self._metrics is not None:
+                self._metrics._record(path, 'decoded',
+                                      time.perf_counter() - start)
+
+            etag = headers.get('ETag')
+            modified = headers.get('Last-Modified')
+            if public and status == 200 and (etag or modified):
+                self._validators[path] = (etag, modified, data)
+
+        if self._cache is not None and status in (200, 304):
+            self._cache.set(path, params, data,
+                            body if status == 200 else None)
+
+        return data
+
+    def get(self, path: str,
+            params: dict = None,
+            public=False,
+            except_on_failure=True) -> json:
+        """
+        Perform a GET request on the REST API
+        Implemented by the HTTP library specific objects
+        """
+        raise NotImplementedError
+
+    def _request(self, wrap, path: str, params: dict = None, public=False):
+        """
+        Perform a GET request and wrap its result
+        :param wrap: Callable building the result from the json object
+        :param path: REST endpoint to GET
+        :param params: Parameters needed for the request
+        :param public: Precise if the Endpoint require a key or not
+        :return: Object built by wrap
+        """
+        return self._wrap(wrap, self.get(path, params, public=public), path)
+
+    def _wrap(self, wrap, data, path: str = None):
+        """
+        Build the result of a request, applying the retention policy
+        :param wrap: Callable building the result from the json object
+        :param data: Json object
+        :param path: REST endpoint, for the metrics
+        :return: Object built by wrap
+        """
+        r = wrap(data)
+
+        if isinstance(r, APIResponse):
+            if self._compact is not None:
+                r._compact = self._compact
+
+            # Fields parse on access (or in _retain), recording their time
+            if self._metrics is not None and path is not None:
+                r._metrics = self._metrics
+                r._path = path
+
+            r._retain(self._retention)
+
+        return r
+
+    def _catalog(self, cls, path: str, raw: dict) -> ResourceResponse:
+        """
+        Build a resource response, reusing the last one if the catalog
+        did not change (same lastUpdated and version)
+        :param cls: ResourceResponse class
+        :param path: REST endpoint
+        :param raw: Json object
+        :return: ResourceResponse object
+        """
+        stamp = (raw.get('lastUpdated'), raw.get('version'))
+        last = self._catalogs.get(path)
+
+        if last is not None and stamp[0] is not None and last[0] == stamp:
+            return last[1]
+
+        r = cls(raw)
+        if stamp[0] is not None and r.success:
+            self._catalogs[path] = (stamp, r)
+
+        return r
+
+    def _resource(self, cls, path: str):
+        """
+        Perform a GET request on a /resources/* endpoint
+        :param cls: ResourceResponse class
+        :param path: REST endpoint to GET
+        :return: ResourceResponse object
+        """
+        return self._request(partial(self._catalog, cls, path), path,
+                             public=True)
 
     def post(self, path: str) -> json:
         """
@@ -217,8 +697,8 @@ class Api:
         :param uuid: Player UUID
         :return: Status Response
         """
-        return StatusResponse(
-            self.get('/status', params={'uuid': uuid})
+        return self._request(
+            StatusResponse, '/status', params={'uuid': uuid}
         )
 
     @property
@@ -227,8 +707,8 @@ class Api:
         Get Watchdog Status
         :return: Watchdog object
         """
-        return WatchdogResponse(
-            self.get('/watchdogstats')
+        return self._request(
+            WatchdogResponse, '/watchdogstats'
         )
 
     @property
@@ -237,8 +717,8 @@ class Api:
         Get Key Info
         :return: Key object
         """
-        return KeyResponse(
-            self.get('/key')
+        return self._request(
+            KeyResponse, '/key'
         )
 
     @property
@@ -247,8 +727,9 @@ class Api:
         Get the number of online player
         :return: Online player
         """
-        r = self.get('/playerCount')
-        return r.get('playerCount')
+        return self._request(
+            lambda r: r.get('playerCount'), '/playerCount'
+        )
 
     def find_guild(self, name: str = None, uuid: str = None) -> str:
         """
@@ -261,8 +742,9 @@ class Api:
             raise ValueError("One of uuid or name need to be set")
 
         p = {'byName': name} if name else {'byUuid': uuid}
-        r = self.get('/findGuild', params=p)
-        return r.get('guild', None)
+        return self._request(
+            lambda r: r.get('guild', None), '/findGuild', params=p
+        )
 
     @property
     def boosters(self) -> BoostersResponse:
@@ -270,19 +752,21 @@ class Api:
         Get booster list
         :return: BoostersResponse
         """
-        return BoostersResponse(
-            self.get('/boosters')
+        return self._request(
+            BoostersResponse, '/boosters'
         )
 
     def guild(self, id: str = None,
               player: str = None,
-              name: str = None) -> GuildResponse:
+              name: str = None,
+              fields: Iterable[str] = None) -> GuildResponse:
         """
         Get Guild information
         Only one of the three parameter can be set
         :param id: Find guild by ID
         :param player: Find guild by player name
         :param name: Find guild by its name
+        :param fields: Properties to parse, every one if None
         :return: GuildResponse object
         """
         if not bool(id) ^ bool(player) ^ bool(name):
@@ -294,18 +778,21 @@ class Api:
                 p = {k: v}
                 break
 
-        return GuildResponse(
-            self.get('/guild', params=p)
+        return self._request(
+            partial(GuildResponse, fields=fields), '/guild', params=p
         )
 
-    def friends(self, uuid: str) -> FriendResponse:
+    def friends(self, uuid: str,
+                fields: Iterable[str] = None) -> FriendResponse:
         """
         Get player's friends list
         :param uuid: Player UUID
+        :param fields: Properties to parse, every one if None
         :return: FriendResponse object
         """
-        return FriendResponse(
-            self.get('/friends', params={'uuid': uuid})
+        return self._request(
+            partial(FriendResponse, fields=fields), '/friends',
+            params={'uuid': uuid}
         )
 
     @property
@@ -314,8 +801,8 @@ class Api:
         Get the number of player online for each game
         :return: GameCountsResponse
         """
-        return GameCountsResponse(
-            self.get('/gameCounts')
+        return self._request(
+            GameCountsResponse, '/gameCounts'
         )
 
     def recent_games(self, uuid: str) -> RecentGamesResponse:
@@ -324,8 +811,8 @@ class Api:
         :param uuid: Player UUID
         :return: RecentGamesResponse
         """
-        return RecentGamesResponse(
-            self.get('/recentGames', params={'uuid': uuid})
+        return self._request(
+            RecentGamesResponse, '/recentGames', params={'uuid': uuid}
         )
 
     @property
@@ -334,16 +821,176 @@ class Api:
         Get Leaderboards information
         :return: LeaderboardResponse object
         """
-        return LeaderboardResponse(
-            self.get('/leaderboards')
+        return self._request(
+            LeaderboardResponse, '/leaderboards'
         )
 
-    def get_player(self, uuid: str) -> PlayerResponse:
+    def get_player(self, uuid: str,
+                   fields: Iterable[str] = None) -> PlayerResponse:
         """
         Get Player info
         :param uuid: Player's UUID
+        :param fields: Properties to parse, every one if None
+                       ("stats.<game>" to parse only some games stats)
+                       ex: ['uuid', 'network_exp', 'stats.SkyBlock']
         :return: Player info
         """
-        return PlayerResponse(
-            self.get('/player', {'uuid': uuid})
+        return self._request(
+            partial(PlayerResponse, fields=fields), '/player', {'uuid': uuid}
         )
+
+
+class Api(BaseApi):
+    """
+    Main Hypyxel object
+    Managing all connections with requests library
+    """
+
+    def __init__(self, key, host="https://api.hypixel.net",
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 keep_alive: bool = True,
+                 timeout=None,
+                 **kwargs) -> None:
+        """
+        :param key: API key
+        :param host: API host
+        :param pool_connections: Number of host connection pools to keep
+        :param pool_maxsize: Maximum number of connections kept by host
+        :param pool_block: Wait for a free connection instead of opening
+                           (and throwing away) extra ones
+        :param keep_alive: Reuse connections between requests
+        :param timeout: Timeout in seconds, or (connect, read) tuple
+        :param kwargs: See BaseApi
+        """
+        super().__init__(key, host, **kwargs)
+
+        self._pool_maxsize = pool_maxsize
+        self._timeout = timeout
+
+        self._session = requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=pool_block)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        if not keep_alive:
+            self._session.headers['Connection'] = 'close'
+
+        self._flights = SingleFlight() if self._coalesce else None
+
+    def get(self, path: str,
+            params: dict = None,
+            public=False,
+            except_on_failure=True) -> json:
+        """
+        Perform a GET request on the REST API
+
+        :param path: REST endpoint to GET
+        :param params: Parameters needed for the request
+        :param public: Precise if the Endpoint require a key or not
+        :param except_on_failure: Raise an Exception on failure
+        :return: Json object obtain from the request response
+        """
+        url, params = self._prepare(path, params, public)
+
+        if self._cache is not None:
+            data = self._cache.get(path, params)
+            if data is not None:
+                return data
+
+        if self._flights is None:
+            return self._fetch(url, path, params, public, except_on_failure)
+
+        return self._flights.do(
+            (request_key(path, params), except_on_failure),
+            self._fetch, url, path, params, public, except_on_failure
+        )
+
+    def _fetch(self, url: str, path: str, params: dict, public: bool,
+               except_on_failure: bool) -> json:
+        """
+        Send a GET request, following the rate limiter and RetryPolicy
+        :param url: Request URL
+        :param path: REST endpoint
+        :param params: Request parameters
+        :param public: Precise if the Endpoint require a key or not
+        :param except_on_failure: Raise an Exception on failure
+        :return: Json object
+        """
+        policy = self._retry.for_path(path)
+        deadline = time.monotonic() + policy.budget
+
+        for attempt in itertools.count():
+            key = self._select_key(public)
+            for limiter in self._limiters(key):
+                limiter.acquire()
+
+            start = self._sent(path, params, attempt)
+            try:
+                r = self._session.get(
+                    url, params=params if public else dict(params, key=key),
+                    headers=self._conditional(path, public),
+                    timeout=self._timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._failed(path, e)
+                delay = self._retry_delay(policy, attempt, deadline, key)
+                if delay is None:
+                    raise
+            else:
+                self._received(path, start, r.status_code, r.content)
+                delay = self._retry_delay(policy, attempt, deadline, key,
+                                          r.status_code, r.headers)
+                if delay is None:
+                    break
+                self._retrying(path, r.status_code)
+
+            time.sleep(delay)
+
+        return self._finish(path, params, public, r.status_code, r.headers,
+                            r.content, except_on_failure)
+
+    def warmup(self, connections: int = None) -> None:
+        """
+        Open connections to the API host ahead of the first requests,
+        so they do not pay for the TCP / TLS handshakes
+        :param connections: Number of connections (default: pool_maxsize)
+        """
+        n = connections or self._pool_maxsize
+
+        def connect(_):
+            self._session.head(self._host, timeout=self._timeout)
+
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            list(pool.map(connect, range(n)))
+
+    def get_players(self, uuids: Iterable[str], concurrency: int = 8,
+                    fields: Iterable[str] = None) \
+            -> Dict[str, Union[PlayerResponse, Exception]]:
+        """
+        Get several players info concurrently
+        Duplicated UUIDs are requested once, the rate limiter still applies
+        :param uuids: Players' UUID
+        :param concurrency: Maximum number of request in flight
+        :param fields: Properties to parse, every one if None
+        :return: Player info by UUID, or the exception raised for this UUID
+        """
+        def fetch(uuid):
+            try:
+                return self.get_player(uuid, fields)
+            except Exception as e:
+                return e
+
+        uuids = list(dict.fromkeys(uuids))
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return dict(zip(uuids, pool.map(fetch, uuids)))
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session
+        """
+        self._session.close()
@@ -0,0 +1,213 @@
+import aiohttp
+import asyncio
+import itertools
+import json
+import time
+
+from typing import Dict, Iterable, Union
+
+from .api import BaseApi
+from .response import PlayerResponse
+from .singleflight import AsyncSingleFlight
+from .utils import request_key
+
+
+class AsyncApi(BaseApi):
+    """
+    Asynchronous Hypyxel object
+    Managing all connections with aiohttp library
+
+    Expose the same endpoints as Api, every one of them
+    returning an awaitable (ex: await api.get_player(uuid))
+    """
+
+    def __init__(self, key, host="https://api.hypixel.net",
+                 limit: int = 100,
+                 limit_per_host: int = 0,
+                 keep_alive: bool = True,
+                 keepalive_timeout: float = 15,
+                 timeout=None,
+                 **kwargs) -> None:
+        """
+        :param key: API key
+        :param host: API host
+        :param limit: Maximum number of simultaneous connections
+        :param limit_per_host: Maximum number of simultaneous connections
+                               to the same host (0 for no limit)
+        :param keep_alive: Reuse connections between requests
+        :param keepalive_timeout: Time to keep an idle connection open
+        :param timeout: Timeout in seconds, or (connect, read) tuple
+        :param kwargs: See BaseApi
+        """
+        super().__init__(key, host, **kwargs)
+
+        self._connector_options = {
+            'limit': limit,
+            'limit_per_host': limit_per_host,
+            'force_close': not keep_alive,
+        }
+        if keep_alive:
+            self._connector_options['keepalive_timeout'] = keepalive_timeout
+
+        if isinstance(timeout, tuple):
+            self._timeout = aiohttp.ClientTimeout(connect=timeout[0],
+                                                  sock_read=timeout[1])
+        else:
+            self._timeout = aiohttp.ClientTimeout(total=timeout)
+
+        self._flights = AsyncSingleFlight() if self._coalesce else None
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session, created on first use inside the event loop
+        :return: aiohttp ClientSession
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._connector_options),
+                timeout=self._timeout
+            )
+
+        return self._session
+
+    async def get(self, path: str,
+                  params: dict = None,
+                  public=False,
+                  except_on_failure=True) -> json:
+        """
+        Perform a GET request on the REST API
+
+        :param path: REST endpoint to GET
+        :param params: Parameters needed for the request
+        :param public: Precise if the Endpoint require a key or not
+        :param except_on_failure: Raise an Exception on failure
+        :return: Json object obtain from the request response
+        """
+        url, params = self._prepare(path, params, public)
+
+        if self._cache is not None:
+            data = self._cache.get(path, params)
+            if data is not None:
+                return data
+
+        if self._flights is None:
+            return await self._fetch(url, path, params, public,
+                                     except_on_failure)
+
+        return await self._flights.do(
+            (request_key(path, params), except_on_failure),
+            self._fetch, url, path, params, public, except_on_failure
+        )
+
+    async def _fetch(self, url: str, path: str, params: dict, public: bool,
+                     except_on_failure: bool) -> json:
+        """
+        Send a GET request, following the rate limiter and RetryPolicy
+        :param url: Request URL
+        :param path: REST endpoint
+        :param params: Request parameters
+        :param public: Precise if the Endpoint require a key or not
+        :param except_on_failure: Raise an Exception on failure
+        :return: Json object
+        """
+        policy = self._retry.for_path(path)
+        deadline = time.monotonic() + policy.budget
+
+        for attempt in itertools.count():
+            key = self._select_key(public)
+            for limiter in self._limiters(key):
+                await limiter.acquire_async()
+
+            start = self._sent(path, params, attempt)
+            try:
+                async with self.session.get(
+                        url,
+                        params=params if public else dict(params, key=key),
+                        headers=self._conditional(path, public)) as r:
+                    body = await r.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self._failed(path, e)
+                delay = self._retry_delay(policy, attempt, deadline, key)
+                if delay is None:
+                    raise
+            else:
+                self._received(path, start, r.status, body)
+                delay = self._retry_delay(policy, attempt, deadline, key,
+                                          r.status, r.headers)
+                if delay is None:
+                    break
+                self._retrying(path, r.status)
+
+            await asyncio.sleep(delay)
+
+        return self._finish(path, params, public, r.status, r.headers,
+                            body, except_on_failure)
+
+    async def _request(self, wrap, path: str,
+                       params: dict = None, public=False):
+        """
+        Perform a GET request and wrap its result
+        :param wrap: Callable building the result from the json object
+        :param path: REST endpoint to GET
+        :param params: Parameters needed for the request
+        :param public: Precise if the Endpoint require a key or not
+        :return: Object built by wrap
+        """
+        data = await self.get(path, params, public=public)
+        return self._wrap(wrap, data, path)
+
+    async def warmup(self, connections: int = None) -> None:
+        """
+        Open connections to the API host ahead of the first requests,
+        so they do not pay for the TCP / TLS handshakes
+        :param connections: Number of connections
+                            (default: limit_per_host or limit)
+        """
+        n = connections or self._connector_options['limit_per_host'] \
+            or self._connector_options['limit']
+
+        async def connect():
+            async with self.session.head(self._host):
+                pass
+
+        await asyncio.gather(*(connect() for _ in range(n)))
+
+    async def get_players(self, uuids: Iterable[str],
+                          concurrency: int = 8,
+                          fields: Iterable[str] = None) \
+            -> Dict[str, Union[PlayerResponse, Exception]]:
+        """
+        Get several players info concurrently
+        Duplicated UUIDs are requested once, the rate limiter still applies
+        :param uuids: Players' UUID
+        :param concurrency: Maximum number of request in flight
+        :param fields: Properties to parse, every one if None
+        :return: Player info by UUID, or the exception raised for this UUID
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(uuid):
+            async with sem:
+                try:
+                    return await self.get_player(uuid, fields)
+                except Exception as e:
+                    return e
+
+        uuids = list(dict.fromkeys(uuids))
+        return dict(zip(uuids, await asyncio.gather(*map(fetch, uuids))))
+
+    async def close(self) -> None:
+        """
+        Close the underlying HTTP session
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
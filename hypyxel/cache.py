@@ -0,0 +1,290 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+
+from .utils import request_key
+
+
+class BaseCache:
+    """
+    Common cache object
+    Managing keys, TTL by endpoint and statistics of every cache backend
+    """
+
+    # Time to live (in seconds) by endpoint prefix, longest prefix wins
+    DEFAULT_TTL = {
+        '/resources/': 6 * 3600,
+        '/status': 10,
+        '/gameCounts': 10,
+        '/playerCount': 10,
+        '/watchdogstats': 30,
+        '/boosters': 60,
+        '/recentGames': 60,
+        '/player': 60,
+        '/friends': 300,
+        '/guild': 300,
+        '/findGuild': 300,
+        '/leaderboards': 600,
+        '/key': 0,
+    }
+
+    def __init__(self, ttl: dict = None, default_ttl: float = 60) -> None:
+        """
+        :param ttl: TTL by endpoint prefix, overriding DEFAULT_TTL
+                    (0 disable caching for this prefix)
+        :param default_ttl: TTL for endpoint without prefix match
+        """
+        self._default_ttl = default_ttl
+        self._ttl = dict(self.DEFAULT_TTL, **(ttl or {}))
+
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        """
+        Get the number of request served from cache
+        :return: Number of hit
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Get the number of request not found in cache
+        :return: Number of miss
+        """
+        return self._misses
+
+    @staticmethod
+    def key(path: str, params: dict) -> str:
+        """
+        Build the cache key of a request, ignoring the API key
+        :param path: REST endpoint
+        :param params: Request parameters
+        :return: Cache key
+        """
+        return request_key(path, params)
+
+    def ttl(self, path: str) -> float:
+        """
+        Get the TTL of an endpoint
+        :param path: REST endpoint
+        :return: TTL in seconds
+        """
+        best = None
+        for prefix in self._ttl:
+            if path.startswith(prefix) and \
+                    (best is None or len(prefix) > len(best)):
+                best = prefix
+
+        return self._ttl[best] if best is not None else self._default_ttl
+
+    def get(self, path: str, params: dict):
+        """
+        Get a cached response
+        :param path: REST endpoint
+        :param params: Request parameters
+        :return: Json object or None if missing / expired
+        """
+        data = self._load(self.key(path, params))
+
+        with self._stats_lock:
+            if data is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        return data
+
+    def set(self, path: str, params: dict, data, body=None) -> None:
+        """
+        Store a response
+        :param path: REST endpoint
+        :param params: Request parameters
+        :param data: Json object
+        :param body: Raw response body, if available
+        """
+        ttl = self.ttl(path)
+        if ttl > 0:
+            self._store(self.key(path, params), ttl, data, body)
+
+    def _load(self, key: str):
+        raise NotImplementedError
+
+    def _store(self, key: str, ttl: float, data, body) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Drop every cached response
+        """
+        raise NotImplementedError
+
+
+class ResponseCache(BaseCache):
+    """
+    In memory LRU cache of decoded responses, with a TTL by endpoint
+    Can be shared between threads, asyncio tasks and Api objects
+
+    Cached json objects are shared by every response built from them,
+    they should be considered read-only.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: dict = None,
+                 default_ttl: float = 60) -> None:
+        """
+        :param maxsize: Maximum number of cached responses
+        :param ttl: TTL by endpoint prefix, overriding DEFAULT_TTL
+                    (0 disable caching for this prefix)
+        :param default_ttl: TTL for endpoint without prefix match
+        """
+        super().__init__(ttl, default_ttl)
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _store(self, key: str, ttl: float, data, body) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, data)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop every cached response
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(BaseCache):
+    """
+    Persistent cache of raw response bodies stored in a SQLite database
+    Survive restarts, and can be shared between threads and processes
+    of the same host (one connection by thread and process)
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS responses ("
+        " key TEXT PRIMARY KEY,"
+        " expires REAL NOT NULL,"
+        " accessed REAL NOT NULL,"
+        " body BLOB NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS responses_accessed"
+        " ON responses (accessed)",
+    )
+
+    def __init__(self, path: str, maxsize: int = 10000, ttl: dict = None,
+                 default_ttl: float = 60, loads=json.loads) -> None:
+        """
+        :param path: Database file
+        :param maxsize: Maximum number of cached responses
+        :param ttl: TTL by endpoint prefix, overriding DEFAULT_TTL
+                    (0 disable caching for this prefix)
+        :param default_ttl: TTL for endpoint without prefix match
+        :param loads: Function decoding the stored bodies
+        """
+        super().__init__(ttl, default_ttl)
+
+        self._path = path
+        self._maxsize = maxsize
+        self._loads = loads
+        self._local = threading.local()
+
+        with self._connection as c:
+            for i in self.SCHEMA:
+                c.execute(i)
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM responses"
+        ).fetchone()[0]
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get the connection of the current thread, reopened after a fork
+        :return: sqlite3 Connection
+        """
+        c = getattr(self._local, 'connection', None)
+
+        if c is None or c[0] != os.getpid():
+            db = sqlite3.connect(self._path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+
+            c = self._local.connection = (os.getpid(), db)
+
+        return c[1]
+
+    def _load(self, key: str):
+        now = time.time()
+
+        with self._connection as c:
+            row = c.execute(
+                "SELECT body FROM responses WHERE key = ? AND expires > ?",
+                (key, now)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            c.execute("UPDATE responses SET accessed = ? WHERE key = ?",
+                      (now, key))
+
+        return self._loads(row[0])
+
+    def _store(self, key: str, ttl: float, data, body) -> None:
+        if body is None:
+            body = json.dumps(data)
+        if isinstance(body, str):
+            body = body.encode()
+
+        now = time.time()
+
+        with self._connection as c:
+            c.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, now + ttl, now, sqlite3.Binary(body))
+            )
+
+            c.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+            c.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed LIMIT"
+                " max(0, (SELECT COUNT(*) FROM responses) - ?))",
+                (self._maxsize,)
+            )
+
+    def clear(self) -> None:
+        """
+        Drop every cached response
+        """
+        with self._connection as c:
+            c.execute("DELETE FROM responses")
@@ -0,0 +1,222 @@
+import sys
+
+from operator import attrgetter
+from typing import Dict
+
+from .utils import timestamp_to_datetime
+
+# Shared empty json object, for missing nested objects
+_EMPTY = {}
+
+
+class Field:
+    """
+    Declare a property read from a json object
+
+    Fields are class attributes of JsonObject subclasses (parsed by a
+    compiled __init__) or APIResponse subclasses (parsed lazily by a
+    compiled getter).
+    """
+
+    # Function applied to the stored value on every access (None: as is)
+    view = None
+
+    def __init__(self, key, default=None, convert=None,
+                 doc: str = None) -> None:
+        """
+        :param key: Json key, or tuple of keys for nested objects
+        :param default: Value if missing, shared by every object: use
+                        immutable values (ex: (), see also new_dict)
+        :param convert: Function applied to the value, default included
+        :param doc: Property docstring
+        """
+        self.key = key if isinstance(key, tuple) else (key,)
+        self.default = default
+        self.convert = convert
+        self.doc = doc
+
+    def expression(self, name: str, get: str, ns: dict) -> str:
+        """
+        Build the python expression reading this field
+        :param name: Field name
+        :param get: Expression of the get method of the json object
+                    holding the field
+        :param ns: Namespace of the compiled code, receiving the constants
+        :return: Python expression
+        """
+        ns['_EMPTY'] = _EMPTY
+        ns[f'_d_{name}'] = self.default
+
+        expr = get
+        for i in self.key[:-1]:
+            expr = f'{expr}({i!r}, _EMPTY).get'
+        expr = f'{expr}({self.key[-1]!r}, _d_{name})'
+
+        if self.convert is not None:
+            ns[f'_c_{name}'] = self.convert
+            expr = f'_c_{name}({expr})'
+
+        return expr
+
+    def accessor(self, attr: str) -> property:
+        """
+        Build the public property of this field
+        The view of the value is computed once, then stored in the
+        attribute attr + '_view'
+        :param attr: Attribute storing the parsed value
+        :return: property object
+        """
+        get = attrgetter(attr)
+
+        if self.view is None:
+            return property(get, doc=self.doc)
+
+        view = self.view
+        memo = f'{attr}_view'
+        get_memo = attrgetter(memo)
+
+        def fget(obj):
+            try:
+                return get_memo(obj)
+            except AttributeError:
+                value = view(get(obj))
+                setattr(obj, memo, value)
+                return value
+
+        return property(fget, doc=self.doc)
+
+
+class Timestamp(Field):
+    """
+    Field storing a Hypixel timestamp, exposed as a datetime object
+    (converted on first access)
+    """
+
+    view = staticmethod(timestamp_to_datetime)
+
+
+def interned(value):
+    """
+    Converter interning strings, for low cardinality values (game types,
+    modes, ranks...): equal values share one str object
+    :param value: Json value
+    :return: Interned str, other values as is
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def new_dict(value):
+    """
+    Converter for json objects defaulting to a dict of their own
+    :param value: Json value
+    :return: value, or a new empty dict if missing
+    """
+    return {} if value is None else value
+
+
+def tuple_of(cls):
+    """
+    Get a converter building a tuple of objects from a json list
+    :param cls: Object class
+    :return: Converter
+    """
+    return lambda data: tuple(map(cls, data))
+
+
+def dict_of(cls):
+    """
+    Get a converter building a dict of objects from a json object
+    :param cls: Object class
+    :return: Converter
+    """
+    return lambda data: {k: cls(v) for k, v in data.items()}
+
+
+def _compile(code: str, name: str, ns: dict):
+    exec(compile(code, f'<hypyxel.fields {name}>', 'exec'), ns)
+    return ns[name]
+
+
+def compile_parser(fields: Dict[str, Field], name: str = '_parse_fields'):
+    """
+    Compile a function storing every field of a json object in the
+    attributes of an object ('_' + field name)
+    :param fields: Field by name
+    :param name: Function name
+    :return: function(self, data)
+    """
+    ns = {}
+    lines = [f'def {name}(self, data):', '    get = data.get']
+
+    for k, f in fields.items():
+        lines.append(f'    self._{k} = {f.expression(k, "get", ns)}')
+
+    return _compile('\n'.join(lines), name, ns)
+
+
+def compile_getter(name: str, f: Field, source: str = None):
+    """
+    Compile a function reading one field from the raw json object of a
+    response
+    :param name: Field name
+    :param f: Field
+    :param source: Key of the json object holding the field (None: root)
+    :return: function(self)
+    """
+    ns = {'_EMPTY': _EMPTY}
+
+    get = 'self._raw.get'
+    if source is not None:
+        get = f'{get}({source!r}, _EMPTY).get'
+
+    code = f'def {name}(self):\n    return {f.expression(name, get, ns)}'
+
+    func = _compile(code, name, ns)
+    func.__doc__ = f.doc
+    return func
+
+
+class JsonObjectType(type):
+    """
+    Metaclass of JsonObject
+    Replace Field attributes by properties reading slots, and compile
+    the parser filling them
+    """
+
+    def __new__(mcs, name, bases, ns):
+        fields = {}
+        for b in reversed(bases):
+            fields.update(getattr(b, '_FIELDS', {}))
+
+        own = {k: v for k, v in ns.items() if isinstance(v, Field)}
+        fields.update(own)
+
+        for k, v in own.items():
+            ns[k] = v.accessor(f'_{k}')
+
+        ns['__slots__'] = tuple(ns.get('__slots__', ())) + \
+            tuple(f'_{k}' for k in own) + \
+            tuple(f'_{k}_view' for k, v in own.items() if v.view is not None)
+        ns['_FIELDS'] = fields
+        ns['_parse_fields'] = compile_parser(fields)
+
+        # Inherited custom __init__ call self._parse_fields(data) instead
+        inherited = bases[0].__init__ if bases else None
+        if '__init__' not in ns and \
+                (inherited is None or getattr(inherited, '_compiled', False)):
+            ns['__init__'] = compile_parser(fields, '__init__')
+            ns['__init__']._compiled = True
+
+        return super().__new__(mcs, name, bases, ns)
+
+
+class JsonObject(metaclass=JsonObjectType):
+    """
+    Base of the objects parsed from a json object
+
+    Properties are declared as Field class attributes. Classes taking
+    more than the json object define their own __init__, calling
+    self._parse_fields(data).
+    """
+
+    __slots__ = ()
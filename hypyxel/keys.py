@@ -0,0 +1,222 @@
+import itertools
+import threading
+import time
+
+from collections import deque
+from typing import Dict, Iterable
+
+from .ratelimit import RateLimiter
+
+
+class KeyStats:
+    """
+    Object representing the usage of an API key
+    """
+
+    def __init__(self, key: str) -> None:
+        self.__key = key
+        self.__active = True
+        self.__sent = deque()
+        self.__total_queries = 0
+        self.__errors = 0
+        self.__limit = None
+        self.__remaining = None
+
+    def _record(self, status: int, quota: tuple) -> None:
+        now = time.monotonic()
+
+        self.__sent.append(now)
+        while self.__sent[0] < now - 60:
+            self.__sent.popleft()
+
+        self.__total_queries += 1
+        if status != 200:
+            self.__errors += 1
+
+        if quota:
+            self.__limit, self.__remaining, _ = quota
+
+    def _disable(self) -> None:
+        self.__active = False
+
+    @property
+    def key(self) -> str:
+        """
+        Get the API key
+        :return: API key
+        """
+        return self.__key
+
+    @property
+    def active(self) -> bool:
+        """
+        Get if the key is still used (False once rejected by the server)
+        :return: bool
+        """
+        return self.__active
+
+    @property
+    def queries(self) -> int:
+        """
+        Get the number of query sent with this key for the last minute
+        :return: number of query
+        """
+        now = time.monotonic()
+        return sum(1 for i in self.__sent if i >= now - 60)
+
+    @property
+    def total_queries(self) -> int:
+        """
+        Get the number of query sent with this key by this pool
+        :return: number of query
+        """
+        return self.__total_queries
+
+    @property
+    def errors(self) -> int:
+        """
+        Get the number of unsuccessful response
+        :return: number of error
+        """
+        return self.__errors
+
+    @property
+    def limit(self) -> int:
+        """
+        Get the query limit reported by the server
+        :return: query limit or None if unknown
+        """
+        return self.__limit
+
+    @property
+    def remaining(self) -> int:
+        """
+        Get the remaining queries reported by the server
+        :return: remaining queries or None if unknown
+        """
+        return self.__remaining
+
+
+class KeyPool:
+    """
+    Pool of API keys sharing the requests of one or several Api objects
+
+    Each key has its own quota (RateLimiter), either configured here or
+    created from the server quota headers. Keys rejected by the server
+    are taken out of rotation.
+
+    Strategies:
+      * least_used: key with the most quota available, then the fewest
+                    queries sent in the last minute
+      * round_robin: every active key in turn
+    """
+
+    STRATEGIES = ('least_used', 'round_robin')
+
+    def __init__(self, keys: Iterable[str], rate_limit: int = None,
+                 strategy: str = 'least_used') -> None:
+        """
+        :param keys: API keys
+        :param rate_limit: Number of request allowed per minute for each
+                           key (None: learnt from the server headers)
+        :param strategy: One of STRATEGIES
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown key pool strategy: {strategy}")
+
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            raise ValueError("KeyPool: at least one key is needed")
+
+        self._lock = threading.Lock()
+        self._strategy = strategy
+        self._cycle = itertools.cycle(keys)
+
+        self._stats = {k: KeyStats(k) for k in keys}
+        self._limiters = {
+            k: RateLimiter(rate_limit) if rate_limit else None for k in keys
+        }
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    @property
+    def stats(self) -> Dict[str, KeyStats]:
+        """
+        Get the usage of every key
+        :return: KeyStats by key
+        """
+        return dict(self._stats)
+
+    @property
+    def active(self) -> int:
+        """
+        Get the number of key still in rotation
+        :return: Number of active key
+        """
+        return sum(1 for i in self._stats.values() if i.active)
+
+    def limiter(self, key: str) -> RateLimiter:
+        """
+        Get the rate limiter of a key
+        :param key: API key
+        :return: RateLimiter object or None
+        """
+        return self._limiters.get(key)
+
+    def set_limiter(self, key: str, limiter: RateLimiter) -> RateLimiter:
+        """
+        Set the rate limiter of a key, unless one is already set
+        :param key: API key
+        :param limiter: RateLimiter object
+        :return: The rate limiter of the key
+        """
+        with self._lock:
+            if self._limiters.get(key) is None:
+                self._limiters[key] = limiter
+
+            return self._limiters[key]
+
+    def _score(self, key: str) -> tuple:
+        limiter = self._limiters[key]
+        stats = self._stats[key]
+
+        return (
+            limiter.available if limiter is not None else float('inf'),
+            -stats.queries
+        )
+
+    def acquire(self) -> str:
+        """
+        Choose the key of the next request
+        :return: API key or None if every key was rejected
+        """
+        with self._lock:
+            if self._strategy == 'round_robin':
+                for _ in range(len(self._stats)):
+                    k = next(self._cycle)
+                    if self._stats[k].active:
+                        return k
+
+                return None
+
+            active = [k for k, v in self._stats.items() if v.active]
+            return max(active, key=self._score) if active else None
+
+    def record(self, key: str, status: int, quota: tuple = None) -> None:
+        """
+        Record a response obtained with a key
+        :param key: API key
+        :param status: HTTP status code
+        :param quota: (limit, remaining, reset) from the response headers
+        """
+        with self._lock:
+            self._stats[key]._record(status, quota)
+
+    def disable(self, key: str) -> None:
+        """
+        Take a key out of rotation
+        :param key: API key
+        """
+        with self._lock:
+            self._stats[key]._disable()
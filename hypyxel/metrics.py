@@ -0,0 +1,261 @@
+import bisect
+import threading
+
+from typing import Dict, Tuple
+
+
+class Histogram:
+    """
+    Distribution of durations (seconds) in fixed buckets
+    """
+
+    # Upper bounds of the buckets, the last bucket holds larger values
+    BOUNDS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+              0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, bounds: Tuple[float] = BOUNDS) -> None:
+        """
+        :param bounds: Sorted upper bounds of the buckets
+        """
+        self.__bounds = tuple(bounds)
+        self.__counts = [0] * (len(self.__bounds) + 1)
+        self.__total = 0.0
+
+    def _record(self, value: float) -> None:
+        self.__counts[bisect.bisect_left(self.__bounds, value)] += 1
+        self.__total += value
+
+    @property
+    def bounds(self) -> Tuple[float]:
+        """
+        Get the upper bounds of the buckets
+        :return: Bounds in seconds
+        """
+        return self.__bounds
+
+    @property
+    def counts(self) -> Tuple[int]:
+        """
+        Get the number of values by bucket
+        :return: One count by bound, plus one for larger values
+        """
+        return tuple(self.__counts)
+
+    @property
+    def count(self) -> int:
+        """
+        Get the number of values
+        :return: Number of values
+        """
+        return sum(self.__counts)
+
+    @property
+    def total(self) -> float:
+        """
+        Get the sum of the values
+        :return: Total in seconds
+        """
+        return self.__total
+
+    @property
+    def mean(self) -> float:
+        """
+        Get the mean value
+        :return: Mean in seconds, None if empty
+        """
+        n = self.count
+        return self.__total / n if n else None
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile (upper bound of its bucket)
+        :param q: Quantile, between 0 and 1 (ex: 0.99)
+        :return: Value in seconds, inf if past the last bound,
+                 None if empty
+        """
+        n = self.count
+        if not n:
+            return None
+
+        seen = 0
+        for bound, count in zip(self.__bounds + (float('inf'),),
+                                self.__counts):
+            seen += count
+            if seen >= q * n:
+                return bound
+
+    def as_dict(self) -> dict:
+        """
+        Get the histogram as a json object
+        :return: dict
+        """
+        return {'bounds': list(self.__bounds), 'counts': list(self.__counts),
+                'count': self.count, 'total': self.__total}
+
+
+class EndpointMetrics:
+    """
+    Object representing the activity of an endpoint
+    """
+
+    def __init__(self, path: str, bounds: Tuple[float]) -> None:
+        self.__path = path
+        self.__requests = 0
+        self.__statuses = {}
+        self.__errors = 0
+        self.__bytes = 0
+        self.__network = Histogram(bounds)
+        self.__decode = Histogram(bounds)
+        self.__parse = Histogram(bounds)
+
+    def _sent(self) -> None:
+        self.__requests += 1
+
+    def _received(self, status: int, size: int, elapsed: float) -> None:
+        self.__statuses[status] = self.__statuses.get(status, 0) + 1
+        self.__bytes += size
+        self.__network._record(elapsed)
+
+    def _failed(self) -> None:
+        self.__errors += 1
+
+    def _decoded(self, elapsed: float) -> None:
+        self.__decode._record(elapsed)
+
+    def _parsed(self, elapsed: float) -> None:
+        self.__parse._record(elapsed)
+
+    @property
+    def path(self) -> str:
+        """
+        Get the endpoint
+        :return: REST endpoint
+        """
+        return self.__path
+
+    @property
+    def requests(self) -> int:
+        """
+        Get the number of HTTP requests sent (retries included)
+        :return: Number of requests
+        """
+        return self.__requests
+
+    @property
+    def statuses(self) -> Dict[int, int]:
+        """
+        Get the number of responses by HTTP status code
+        :return: Count by status code
+        """
+        return dict(self.__statuses)
+
+    @property
+    def errors(self) -> int:
+        """
+        Get the number of failed attempts (connection failures, timeouts
+        and failed responses, retried or not)
+        :return: Number of errors
+        """
+        return self.__errors
+
+    @property
+    def bytes_received(self) -> int:
+        """
+        Get the size of the received bodies
+        :return: Number of bytes
+        """
+        return self.__bytes
+
+    @property
+    def network(self) -> Histogram:
+        """
+        Get the time from sending a request to its body received
+        :return: Histogram
+        """
+        return self.__network
+
+    @property
+    def decode(self) -> Histogram:
+        """
+        Get the json decode time of the bodies
+        :return: Histogram
+        """
+        return self.__decode
+
+    @property
+    def parse(self) -> Histogram:
+        """
+        Get the parse time of the response fields, recorded for each
+        field on first access (or when the retention policy parses the
+        whole response)
+        :return: Histogram
+        """
+        return self.__parse
+
+    def as_dict(self) -> dict:
+        """
+        Get the metrics as a json object
+        :return: dict
+        """
+        return {
+            'requests': self.__requests,
+            'statuses': {str(k): v for k, v in self.__statuses.items()},
+            'errors': self.__errors,
+            'bytes_received': self.__bytes,
+            'network': self.__network.as_dict(),
+            'decode': self.__decode.as_dict(),
+            'parse': self.__parse.as_dict(),
+        }
+
+
+class Metrics:
+    """
+    Activity of one or several Api objects, by endpoint
+
+    Can be shared between threads and Api objects.
+    """
+
+    def __init__(self, bounds: Tuple[float] = Histogram.BOUNDS) -> None:
+        """
+        :param bounds: Upper bounds of the latency histograms buckets
+        """
+        self._bounds = tuple(bounds)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _record(self, path: str, event: str, *args) -> None:
+        with self._lock:
+            m = self._endpoints.get(path)
+            if m is None:
+                m = self._endpoints[path] = EndpointMetrics(path,
+                                                            self._bounds)
+            getattr(m, f'_{event}')(*args)
+
+    def __getitem__(self, path: str) -> EndpointMetrics:
+        return self._endpoints[path]
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._endpoints
+
+    @property
+    def endpoints(self) -> Dict[str, EndpointMetrics]:
+        """
+        Get the metrics of every requested endpoint
+        :return: EndpointMetrics by REST endpoint
+        """
+        return dict(self._endpoints)
+
+    def reset(self) -> None:
+        """
+        Forget every recorded value
+        """
+        with self._lock:
+            self._endpoints = {}
+
+    def as_dict(self) -> dict:
+        """
+        Get the metrics as a json object (ex: to export them)
+        :return: Metrics by endpoint
+        """
+        with self._lock:
+            return {k: v.as_dict() for k, v in self._endpoints.items()}
@@ -0,0 +1,320 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket keeping requests under the API key quota
+    Can be shared between threads, asyncio tasks and Api objects
+
+    Requests are never rejected: each one reserves a token and waits
+    until the bucket had time to refill.
+
+    The bucket holds `burst` tokens and refills at (limit - burst) tokens
+    per period, so no window of `period` seconds can ever see more than
+    `limit` requests, even when the server counts on a sliding window.
+
+    Once the server reported its quota (see update), requests are also
+    booked in its windows: the remaining requests until the window
+    reset, then `limit` requests by period.
+    """
+
+    # Longest sleep of a waiting request before checking if its booking
+    # is still valid (the learned period changed)
+    RECHECK = 1.0
+
+    def __init__(self, limit: int, period: float = 60.0,
+                 burst: int = 1, learn: bool = False) -> None:
+        """
+        :param limit: Number of request allowed by period
+        :param period: Quota period in seconds
+        :param burst: Number of request allowed back to back
+        :param learn: Follow the server windows: lengthen the period up to
+                      the longest reset reported, shorten it to the time
+                      between two window resets
+        """
+        self._lock = threading.Lock()
+
+        self._limit = None
+        self._period = None
+        self._burst = None
+        self._rate = None
+        self._tokens = 0.0
+        self._updated = None
+
+        self._remaining = None
+        self._reset_at = None
+        self._reported = None
+        self._learn = learn
+        self._generation = 0
+
+        # Server window the next request is booked in: start, end and
+        # requests left
+        self._window = None
+
+        self.configure(limit, period, burst)
+
+    @classmethod
+    def from_key(cls, key, period: float = 60.0, burst: int = 1):
+        """
+        Build a limiter from a KeyResponse object
+        :param key: KeyResponse (ex: Api.key)
+        :param period: Quota period in seconds
+        :param burst: Number of request allowed back to back
+        :return: RateLimiter object
+        """
+        if key.limit is None or key.limit <= 0:
+            raise ValueError("Key response does not contain a limit")
+
+        return cls(key.limit, period, burst)
+
+    def configure(self, limit: int, period: float = None,
+                  burst: int = None) -> None:
+        """
+        Change the quota, keeping the tokens already available
+        :param limit: Number of request allowed by period
+        :param period: Quota period in seconds
+        :param burst: Number of request allowed back to back
+        """
+        period = self._period if period is None else period
+        burst = self._burst if burst is None else burst
+
+        if limit < 1 or period <= 0:
+            raise ValueError("RateLimiter: limit and period should be > 0")
+
+        if not 1 <= burst <= limit:
+            raise ValueError("RateLimiter: burst should be in [1, limit]")
+
+        with self._lock:
+            if self._limit is None:
+                self._tokens = float(burst)
+            else:
+                self._refill(time.monotonic())
+                self._tokens = min(self._tokens, burst)
+
+            self._limit = limit
+            self._burst = burst
+            self._set_period(period)
+            self._updated = time.monotonic()
+
+    def _set_period(self, period: float) -> None:
+        self._period = period
+        self._rate = max(self._limit - self._burst, 1) / period
+
+    @property
+    def limit(self) -> int:
+        """
+        Get the number of request allowed by period
+        :return: Request limit
+        """
+        return self._limit
+
+    @property
+    def period(self) -> float:
+        """
+        Get the quota period
+        :return: Period in seconds
+        """
+        return self._period
+
+    @property
+    def available(self) -> float:
+        """
+        Get the number of token available (negative when requests queue)
+        :return: Available tokens
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    @property
+    def remaining(self) -> int:
+        """
+        Get the remaining requests last reported by the server
+        :return: Remaining requests or None if unknown
+        """
+        return self._remaining
+
+    @property
+    def reset(self) -> float:
+        """
+        Get the time left before the server quota reset
+        :return: Seconds before reset or None if unknown
+        """
+        if self._reset_at is None:
+            return None
+
+        return max(self._reset_at - time.monotonic(), 0.0)
+
+    @staticmethod
+    def parse_headers(headers) -> tuple:
+        """
+        Read the quota headers sent by the server
+        :param headers: Response headers (case insensitive mapping)
+        :return: (limit, remaining, reset) or None if missing
+        """
+        try:
+            return (
+                int(headers['RateLimit-Limit']),
+                int(headers['RateLimit-Remaining']),
+                float(headers['RateLimit-Reset'])
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def update(self, remaining: int, reset: float) -> None:
+        """
+        Align the bucket on the quota reported by the server
+
+        The remaining requests are available until the server window
+        reset, then the quota refills to `limit`: requests wait for the
+        next window once the remaining ones are booked.
+        :param remaining: Requests left in the server window
+        :param reset: Seconds before the server window reset
+        """
+        with self._lock:
+            now = time.monotonic()
+            end = now + reset
+            last = (self._reported, self._reset_at, self._remaining)
+
+            self._remaining = remaining
+            self._reset_at = end
+            self._reported = now
+
+            if self._learn and self._relearn(now, end, remaining, *last):
+                return
+
+            # Reset headers are rounded to the second
+            if self._window is None or end >= self._window[1] + 1:
+                # New server window
+                self._window = [now, end, remaining]
+            elif end > self._window[1] - 1:
+                # Window in use: the server may count other clients
+                self._window[2] = min(self._window[2], remaining)
+            # Else requests are booked in a later window already
+
+    def _relearn(self, now: float, end: float, remaining: int,
+                 last: float, last_end: float, last_remaining: int) -> bool:
+        """
+        Adjust the period to a server window report
+        :param now: Report time (time.monotonic())
+        :param end: Reported window end
+        :param remaining: Requests left in the window
+        :param last: Time of the previous report, None if unknown
+        :param last_end: Previous reported window end
+        :param last_remaining: Previous requests left
+        :return: True if the period changed and the bookings were reset
+        """
+        period = self._period
+
+        # The window reset since the last report, so it started after it
+        # (reset headers are rounded up to the second)
+        if last is not None:
+            if end >= last_end + 1:
+                period = min(period, end - last_end + 1)
+            if remaining > last_remaining:
+                period = min(period, end - last + 1)
+
+        # Windows are at least as long as the time left in this one
+        period = max(period, end - now)
+
+        if period == self._period:
+            return False
+
+        self._refill(now)
+        self._set_period(period)
+
+        # Waiting requests book again, from the reported window
+        self._tokens = max(self._tokens, 0.0)
+        self._window = [now, end, remaining]
+        self._generation += 1
+        return True
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _book(self, at: float) -> float:
+        """
+        Book a request in the server windows
+        :param at: Earliest time to send it (time.monotonic())
+        :return: Time to send it
+        """
+        window = self._window
+        if window is None:
+            return at
+
+        if at >= window[1]:
+            # Skip the windows elapsed, their quota is full again
+            skipped = (at - window[1]) // self._period
+            window[0] = window[1] + skipped * self._period
+            window[1] = window[0] + self._period
+            window[2] = self._limit
+
+        if window[2] <= 0:
+            window[0] = window[1]
+            window[1] = window[0] + self._period
+            window[2] = self._limit
+
+        window[2] -= 1
+        return max(at, window[0])
+
+    def reserve(self) -> float:
+        """
+        Take a token
+        :return: Delay to wait (in seconds) before using it
+        """
+        return max(self._reserve()[0] - time.monotonic(), 0.0)
+
+    def _reserve(self) -> tuple:
+        """
+        Take a token
+        :return: (time to use it, generation of the booking)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            self._tokens -= 1
+            delay = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+            at = self._book(now + delay)
+            if at > now + delay:
+                # Following requests are paced from this one
+                self._tokens = -(at - now) * self._rate
+
+            return at, self._generation
+
+    def _delay(self, booking: tuple) -> tuple:
+        """
+        Check a booking, booking again if the period changed
+        :param booking: Result of _reserve()
+        :return: (delay before the next check, booking)
+        """
+        if booking[1] != self._generation:
+            booking = self._reserve()
+
+        delay = booking[0] - time.monotonic()
+        return (min(delay, self.RECHECK) if delay > 0 else 0.0), booking
+
+    def acquire(self) -> None:
+        """
+        Take a token, blocking the current thread until usable
+        """
+        delay, booking = self._delay(self._reserve())
+        while delay:
+            time.sleep(delay)
+            delay, booking = self._delay(booking)
+
+    async def acquire_async(self) -> None:
+        """
+        Take a token, suspending the current task until usable
+        """
+        import asyncio  # Loaded by the running event loop already
+
+        delay, booking = self._delay(self._reserve())
+        while delay:
+            await asyncio.sleep(delay)
+            delay, booking = self._delay(booking)
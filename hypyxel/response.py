@@ -1,50 +1,217 @@
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Tuple
+from .fields import Field, Timestamp, compile_getter, dict_of, interned, \
+    new_dict, tuple_of
 from .response_objects import *
-from .utils import timestamp_to_datetime, datetime
+from .utils import lazy_property
+from .uuids import _parsing, compact_enabled, uuid_value
 
 from datetime import timedelta
 
+import json
+import time
+import zlib
+
+# Raw json object retention policies, see APIResponse._retain()
+RETENTION_POLICIES = ('keep', 'compress', 'drop')
+
+
+class field(lazy_property):
+    """
+    Lazy property of a response, unavailable if the response was built
+    for other fields only
+
+    Parsed with the UUID setting of the response (see compact_uuids),
+    its parse time is recorded in the metrics of the response, if any.
+    """
+
+    def __init__(self, fget, name: str = None) -> None:
+        """
+        :param fget: Function parsing the field
+        :param name: Field name, if not the function name
+        """
+        super().__init__(fget)
+        self.field = name or self.__name__
+
+    def __get__(self, obj, cls=None):
+        if obj is not None and obj._fields is not None and \
+                self.field not in obj._fields:
+            raise AttributeError(
+                f"Hypyxel: field '{self.field}' was not requested"
+            )
+
+        if obj is None:
+            return self
+
+        token = _parsing.set(obj._compact)
+        try:
+            if obj._metrics is None:
+                return super().__get__(obj, cls)
+
+            start = time.perf_counter()
+            value = super().__get__(obj, cls)
+            obj._metrics._record(obj._path, 'parsed',
+                                 time.perf_counter() - start)
+            return value
+        finally:
+            _parsing.reset(token)
+
 
 class APIResponse:
     """
     BaseObject for API response
     Managing potential API error messages
+
+    Building a response only wraps the json object: every property is
+    parsed on first access, then cached.
     """
-    def __init__(self, raw: dict) -> None:
+
+    # Key of the json object holding the fields (None: root object)
+    _SOURCE = None
+
+    # Fields accepting a selection of their keys ("field.key")
+    _SELECTABLE = ()
+
+    # Metrics recording the field parse times, and the endpoint
+    _metrics = None
+    _path = None
+
+    # Fields exposed through a view (ex: Timestamp), by name
+    _VIEWS = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Replace Field attributes by lazy properties, reading the json
+        object with a compiled getter
+        """
+        super().__init_subclass__(**kwargs)
+
+        for k, v in list(vars(cls).items()):
+            if not isinstance(v, Field):
+                continue
+
+            if v.view is None:
+                setattr(cls, k, field(compile_getter(k, v, cls._SOURCE)))
+            else:
+                # Stored value, its view is computed by the accessor
+                attr = f'_{k}'
+                setattr(cls, attr,
+                        field(compile_getter(attr, v, cls._SOURCE), k))
+                setattr(cls, k, v.accessor(attr))
+                cls._VIEWS = cls._VIEWS | {k}
+
+    def __init__(self, raw: dict, fields: Iterable[str] = None) -> None:
+        """
+        :param raw: Json object
+        :param fields: Fields to parse, every field if None
+                       ex: ['uuid', 'stats.SkyBlock']
+        """
         self._raw = raw
-        self._success = False
-        self._error_message = None
+        self._packed = None
+        self._compact = compact_enabled()
+        self._fields = None if fields is None else self._projection(fields)
+
+    @classmethod
+    def _projection(cls, fields: Iterable[str]) -> dict:
+        """
+        Check the requested fields
+        :param fields: Field names, "field.key" for selectable fields
+        :return: Selected keys by field name (None: every key)
+        """
+        r = {}
+        for i in fields:
+            name, _, key = i.partition('.')
+            attr = getattr(cls, name, None)
 
-        self.__parse_data()
+            if name.startswith('_') or \
+                    not isinstance(attr, (property, lazy_property)):
+                raise ValueError(f"Unknown {cls.__name__} field: {name}")
 
-    def __parse_data(self) -> None:
+            # Properties computed from fields (ex: PlayerResponse.is_online)
+            if isinstance(attr, property) and name not in cls._VIEWS:
+                raise ValueError(f"{cls.__name__}.{name} is derived from "
+                                 f"other fields, request them instead")
 
-        self._success = self._raw.get("success")
-        self._error_message = self._raw.get('cause', None)
+            if key and name not in cls._SELECTABLE:
+                raise ValueError(f"{cls.__name__}.{name} keys can not be"
+                                 f" selected")
+
+            if not key:
+                r[name] = None
+            elif name not in r or r[name] is not None:
+                r.setdefault(name, set()).add(key)
+
+        return r
+
+    def _selection(self, name: str) -> set:
+        """
+        Get the keys requested for a selectable field
+        :param name: Field name
+        :return: Set of keys, None for every key
+        """
+        return self._fields.get(name) if self._fields is not None else None
 
     @property
     def raw(self) -> dict:
         """
         Get the response json object
+        (rebuilt on every call if compressed by the retention policy)
         :return: json object
         """
-        return self._raw
+        if self._raw is not None:
+            return self._raw
 
-    @property
+        if self._packed is not None:
+            return json.loads(zlib.decompress(self._packed))
+
+        raise ValueError(
+            "Hypyxel: raw json object dropped (retention policy: 'drop')"
+        )
+
+    def _parse_all(self) -> None:
+        """
+        Parse every lazy property (requested ones only, if any)
+        """
+        for cls in type(self).__mro__:
+            for k, v in vars(cls).items():
+                if isinstance(v, field) and self._fields is not None and \
+                        v.field not in self._fields:
+                    continue
+
+                if isinstance(v, lazy_property):
+                    getattr(self, k)
+
+    def _retain(self, policy: str) -> None:
+        """
+        Parse the whole response, then release its raw json object
+        :param policy: One of RETENTION_POLICIES
+        """
+        if policy == 'keep' or self._raw is None:
+            return
+
+        self._parse_all()
+
+        if policy == 'compress':
+            self._packed = zlib.compress(
+                json.dumps(self._raw, separators=(',', ':')).encode()
+            )
+
+        self._raw = None
+
+    @lazy_property
     def success(self) -> bool:
         """
         Get success
         :return: bool
         """
-        return self._success
+        return self._raw.get("success")
 
-    @property
+    @lazy_property
     def error_message(self) -> str:
         """
         Get error message in case of failure
         :return: Error message
         """
-        return self._error_message
+        return self._raw.get('cause', None)
 
 
 class ResourceResponse(APIResponse):
@@ -52,23 +219,7 @@ class ResourceResponse(APIResponse):
     Object managing update property for resources endpoints
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self._last_update = None
-
-        self.__parse_resource_data()
-
-    def __parse_resource_data(self) -> None:
-        self._last_update = self._raw.get('lastUpdated', None)
-
-    @property
-    def last_update(self) -> datetime:
-        """
-        Get the last update date
-        :return: datetime object or None in case of error
-        """
-        return timestamp_to_datetime(self._last_update)
+    last_update = Timestamp('lastUpdated', doc="Get the last update date")
 
 
 class GuildAchievementsResourceResponse(ResourceResponse):
@@ -76,41 +227,27 @@ class GuildAchievementsResourceResponse(ResourceResponse):
     Object parsing data for /resources/guild/achievements endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self._one_time = tuple()
-        self._tiered = tuple()
-
-        self.__parse_guild_achievements_data()
-
-    def __parse_guild_achievements_data(self) -> None:
-
-        self._one_time = tuple(
-            HypixelOneTimeAchievement(None, *i)
-            for i in self._raw.get('one_time').items()
-        )
-
-        self._tiered = tuple(
-            HypixelTieredAchievement(None, *i)
-            for i in self._raw.get('tiered').items()
-        )
-
-    @property
+    @field
     def one_time(self) -> Tuple[HypixelOneTimeAchievement]:
         """
         Get One Time Achievement list
         :return: List of HypixelOneTimeAchievement
         """
-        return self._one_time
+        return tuple(
+            HypixelOneTimeAchievement(None, *i)
+            for i in self._raw.get('one_time').items()
+        )
 
-    @property
+    @field
     def tiered(self) -> Tuple[HypixelTieredAchievement]:
         """
         Get Tiered Achievement list
         :return: List of HypixelTieredAchievement
         """
-        return self._tiered
+        return tuple(
+            HypixelTieredAchievement(None, *i)
+            for i in self._raw.get('tiered').items()
+        )
 
 
 class AchievementsResourceResponse(ResourceResponse):
@@ -118,75 +255,54 @@ class AchievementsResourceResponse(ResourceResponse):
     Object parsing data for /resources/achievements endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self._one_time = dict()
-        self._tiered = dict()
-
-        self._points = dict()
-        self._legacy_points = dict()
-
-        self.__parse_achievements_data()
-
-    def __parse_achievements_data(self) -> None:
-
-        self._one_time = {
-            j: [HypixelOneTimeAchievement(j, *i)
-                for i in self._raw["achievements"][j]["one_time"].items()]
-            for j in self._raw["achievements"].keys()
-        }
-
-        self._tiered = {
-            j: [HypixelTieredAchievement(j, *i)
-                for i in self._raw["achievements"][j]["tiered"].items()]
-            for j in self._raw["achievements"].keys()
-        }
-
-        self._points = {
-            j: self._raw["achievements"][j].get("total_points", -1)
-            for j in self._raw["achievements"].keys()
-        }
-
-        self._legacy_points = {
-            j: self._raw["achievements"][j].get("total_legacy_points", -1)
-            for j in self._raw["achievements"].keys()
-        }
-
-    @property
+    @field
     def one_time(self) -> Dict[str, HypixelOneTimeAchievement]:
         """
         Get One Time Achievement list
         :return: Dict of HypixelOneTimeAchievements as value
                  and GameType as key
         """
-        return self._one_time
+        return {
+            j: [HypixelOneTimeAchievement(j, *i)
+                for i in v["one_time"].items()]
+            for j, v in self._raw["achievements"].items()
+        }
 
-    @property
+    @field
     def tiered(self) -> Dict[str, HypixelTieredAchievement]:
         """
         Get Tiered Achievement list
         :return: Dict of HypixelTieredAchievement as value
                  and GameType as key
         """
-        return self._tiered
+        return {
+            j: [HypixelTieredAchievement(j, *i)
+                for i in v["tiered"].items()]
+            for j, v in self._raw["achievements"].items()
+        }
 
-    @property
+    @field
     def total_points(self) -> Dict[str, int]:
         """
         Get a dictionary containing game name as key & total points as value
         :return: Dictionary of gamename : points
         """
-        return self._points
+        return {
+            j: v.get("total_points", -1)
+            for j, v in self._raw["achievements"].items()
+        }
 
-    @property
+    @field
     def total_legacy_points(self) -> Dict[str, int]:
         """
         Get a dictionary containing game name as key &
         total legacy points as value
         :return: Dictionary of gamename : legacy points
         """
-        return self._legacy_points
+        return {
+            j: v.get("total_legacy_points", -1)
+            for j, v in self._raw["achievements"].items()
+        }
 
 
 class ChallengesResourceResponse(ResourceResponse):
@@ -194,26 +310,16 @@ class ChallengesResourceResponse(ResourceResponse):
     Object parsing data for /resources/challenges endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self._challenges = tuple()
-
-        self.__parse_challenges_data()
-
-    def __parse_challenges_data(self) -> None:
-        self._challenges = tuple(HypixelChallenge(j, i)
-                                 for j in self._raw.get('challenges').keys()
-                                 for i in self._raw.get('challenges')[j]
-                                 )
-
-    @property
+    @field
     def challenges(self) -> Tuple[HypixelChallenge]:
         """
         Get challenges list
         :return: Challenge list
         """
-        return self._challenges
+        return tuple(HypixelChallenge(j, i)
+                     for j, v in self._raw.get('challenges').items()
+                     for i in v
+                     )
 
 
 class QuestsResourceResponse(ResourceResponse):
@@ -221,26 +327,16 @@ class QuestsResourceResponse(ResourceResponse):
     Object parsing data for /resources/quests endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self._quests = tuple()
-
-        self.__parse_quests_data()
-
-    def __parse_quests_data(self) -> None:
-        self._quests = tuple(HypixelQuest(j, i)
-                             for j in self._raw.get('quests').keys()
-                             for i in self._raw.get('quests')[j]
-                             )
-
-    @property
+    @field
     def quests(self) -> Tuple[HypixelQuest]:
         """
         Get quests list
         :return: Quest list
         """
-        return self._quests
+        return tuple(HypixelQuest(j, i)
+                     for j, v in self._raw.get('quests').items()
+                     for i in v
+                     )
 
 
 class PermissionsResourceResponse(ResourceResponse):
@@ -248,24 +344,8 @@ class PermissionsResourceResponse(ResourceResponse):
     Object parsing data for /resources/permissions endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self._permissions = tuple()
-
-        self.__parse_permissions_data()
-
-    def __parse_permissions_data(self) -> None:
-        self._permissions = tuple(HypixelPermission(i)
-                                  for i in self._raw.get('permissions'))
-
-    @property
-    def permissions(self) -> Tuple[HypixelPermission]:
-        """
-        Get permission list
-        :return: Permission list
-        """
-        return self._permissions
+    permissions = Field('permissions', (), tuple_of(HypixelPermission),
+                        doc="Get permission list")
 
 
 class SkyblockResourceResponse(ResourceResponse):
@@ -273,23 +353,7 @@ class SkyblockResourceResponse(ResourceResponse):
     Object parsing data in common for /resources/skyblock/* endpoints
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__version = None
-
-        self.__parse_skyblock_data()
-
-    def __parse_skyblock_data(self) -> None:
-        self.__version = self._raw.get('version', None)
-
-    @property
-    def version(self) -> str:
-        """
-        Get Skyblock version
-        :return: skyblock version
-        """
-        return self.__version
+    version = Field('version', doc="Get Skyblock version")
 
 
 class SkyblockCollectionsResponse(SkyblockResourceResponse):
@@ -297,27 +361,16 @@ class SkyblockCollectionsResponse(SkyblockResourceResponse):
     Object parsing data for /resources/skyblock/collections endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__collections = dict()
-
-        self.__parse_collections_data()
-
-    def __parse_collections_data(self) -> None:
-
-        self.__collections = {
-            i: HypixelSkyblockCollection(i, self._raw.get('collections')[i])
-            for i in self._raw.get('collections', {}).keys()
-        }
-
-    @property
+    @field
     def collections(self) -> Dict[str, HypixelSkyblockCollection]:
         """
         Get Skyblock collections
         :return: Skyblock Collection as a dict (collection ID as key)
         """
-        return self.__collections
+        return {
+            k: HypixelSkyblockCollection(k, v)
+            for k, v in self._raw.get('collections', {}).items()
+        }
 
 
 class SkyblockSkillsResponse(SkyblockResourceResponse):
@@ -325,26 +378,16 @@ class SkyblockSkillsResponse(SkyblockResourceResponse):
     Object parsing data for /resources/skyblock/skills endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__skills = dict()
-
-        self.__parse_skills_data()
-
-    def __parse_skills_data(self) -> None:
-        self.__skills = {
-            i: HypixelSkyblockSkill(i, self._raw.get('collections')[i])
-            for i in self._raw.get('collections', {}).keys()
-        }
-
-    @property
+    @field
     def skills(self) -> Dict[str, HypixelSkyblockSkill]:
         """
         Get skills collections
         :return: Skyblock skill collections as a dict (skill ID as key)
         """
-        return self.__skills
+        return {
+            k: HypixelSkyblockSkill(k, v)
+            for k, v in self._raw.get('collections', {}).items()
+        }
 
 
 class StatusResponse(APIResponse):
@@ -352,55 +395,15 @@ class StatusResponse(APIResponse):
     Object parsing data for /status endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__online = None
-        self.__game_type = None
-        self.__mode = None
-        self.__map = None
-
-        self.__parse_status_data()
-
-    def __parse_status_data(self) -> None:
-        d = self._raw.get('session', {})
+    _SOURCE = 'session'
 
-        self.__online = d.get('online', False)
-        self.__game_type = d.get('gameType', None)
-        self.__mode = d.get('mode', None)
-        self.__map = d.get('map', None)
-
-    @property
-    def online(self) -> bool:
-        """
-        Get in player is online
-        :return: bool
-        """
-        return self.__online
-
-    @property
-    def game(self) -> str:
-        """
-        Get in which game the player is on
-        :return: gameType
-        """
-        return self.__game_type
-
-    @property
-    def mode(self) -> str:
-        """
-        Get in which mode (if available)
-        :return: game mode
-        """
-        return self.__mode
-
-    @property
-    def map(self) -> str:
-        """
-        Get on which map (if available)
-        :return: game map
-        """
-        return self.__map
+    online = Field('online', False, doc="Get in player is online")
+    game = Field('gameType', convert=interned,
+                 doc="Get in which game the player is on")
+    mode = Field('mode', convert=interned,
+                 doc="Get in which mode (if available)")
+    map = Field('map', convert=interned,
+                doc="Get on which map (if available)")
 
 
 class KeyResponse(APIResponse):
@@ -408,65 +411,15 @@ class KeyResponse(APIResponse):
     Object parsing /key endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__key = None
-        self.__owner = None
-        self.__limit = -1
-        self.__queries = -1
-        self.__total_queries = -1
-
-        self.__parse_key_data()
-
-    def __parse_key_data(self) -> None:
-        d = self._raw.get('record', {})
-
-        self.__key = d.get('key', None)
-        self.__owner = d.get('owner', None)
-        self.__limit = d.get('limit', -1)
-        self.__queries = d.get('queriesInPastMin', -1)
-        self.__total_queries = d.get('totalQueries', -1)
-
-    @property
-    def key(self) -> str:
-        """
-        Get the key ID
-        :return: key ID
-        """
-        return self.__key
-
-    @property
-    def owner(self) -> str:
-        """
-        Get the owner UUID
-        :return: Player UUID
-        """
-        return self.__owner
-
-    @property
-    def limit(self) -> int:
-        """
-        Get the query limit for this key
-        :return: query limit
-        """
-        return self.__limit
-
-    @property
-    def queries(self) -> int:
-        """
-        Get the number of query for the last minute
-        :return: number of query
-        """
-        return self.__queries
+    _SOURCE = 'record'
 
-    @property
-    def total_queries(self) -> int:
-        """
-        Get the number of query made with this key
-        :return: number of query
-        """
-        return self.__total_queries
+    key = Field('key', doc="Get the key ID")
+    owner = Field('owner', convert=uuid_value, doc="Get the owner UUID")
+    limit = Field('limit', -1, doc="Get the query limit for this key")
+    queries = Field('queriesInPastMin', -1,
+                    doc="Get the number of query for the last minute")
+    total_queries = Field('totalQueries', -1,
+                          doc="Get the number of query made with this key")
 
 
 class WatchdogResponse(APIResponse):
@@ -474,44 +427,11 @@ class WatchdogResponse(APIResponse):
     Object parsing /watchdogstats endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__last_minute = -1
-        self.__staff_rolling = -1
-        self.__total = -1
-        self.__rolling = -1
-        self.__staff_total = -1
-
-        self.__parse_watchdog_data()
-
-    def __parse_watchdog_data(self) -> None:
-
-        self.__last_minute = self.raw.get('watchdog_lastMinute', -1)
-        self.__staff_rolling = self.raw.get('staff_rollingDaily', -1)
-        self.__total = self.raw.get('watchdog_total', -1)
-        self.__rolling = self.raw.get('watchdog_rollingDaily', -1)
-        self.__staff_total = self.raw.get('staff_total', -1)
-
-    @property
-    def last_minute(self) -> int:
-        return self.__last_minute
-
-    @property
-    def staff_rolling(self) -> int:
-        return self.__staff_rolling
-
-    @property
-    def total(self) -> int:
-        return self.__total
-
-    @property
-    def rolling(self) -> int:
-        return self.__rolling
-
-    @property
-    def staff_total(self) -> int:
-        return self.__staff_total
+    last_minute = Field('watchdog_lastMinute', -1)
+    staff_rolling = Field('staff_rollingDaily', -1)
+    total = Field('watchdog_total', -1)
+    rolling = Field('watchdog_rollingDaily', -1)
+    staff_total = Field('staff_total', -1)
 
 
 class RecentGamesResponse(APIResponse):
@@ -519,26 +439,8 @@ class RecentGamesResponse(APIResponse):
     Object parsing /recentGames endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__games = tuple()
-
-        self.__parse_recent_game_data()
-
-    def __parse_recent_game_data(self) -> None:
-
-        self.__games = tuple(
-            RecentGame(i) for i in self.raw.get('games', ())
-        )
-
-    @property
-    def games(self) -> Tuple[RecentGame]:
-        """
-        Get the recent games list
-        :return: RecentGame list
-        """
-        return self.__games
+    games = Field('games', (), tuple_of(RecentGame),
+                  doc="Get the recent games list")
 
 
 class BoostersResponse(APIResponse):
@@ -546,33 +448,10 @@ class BoostersResponse(APIResponse):
     Object parsing /boosters endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__boosters = tuple()
-        self.__decrementing = None
-
-        self.__parse_boosters_data()
-
-    def __parse_boosters_data(self) -> None:
-        self.__boosters = tuple(Booster(i) for i in self.raw.get('boosters'))
-        self.__decrementing = self.raw.get('boosterState').get('decrementing')
-
-    @property
-    def boosters(self) -> Tuple[Booster]:
-        """
-        Get the current booster list
-        :return: Booster List
-        """
-        return self.__boosters
-
-    @property
-    def decrementing(self) -> bool:
-        """
-        Get decrementing booster status
-        :return: Bool
-        """
-        return self.__decrementing
+    boosters = Field('boosters', (), tuple_of(Booster),
+                     doc="Get the current booster list")
+    decrementing = Field(('boosterState', 'decrementing'),
+                         doc="Get decrementing booster status")
 
 
 class GuildResponse(APIResponse):
@@ -580,179 +459,33 @@ class GuildResponse(APIResponse):
     Object parsing /guild endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__id = None
-        self.__name = None
-        self.__coins = -1
-        self.__max_coins = -1
-        self.__created = -1
-        self.__members = tuple()
-        self.__tag = None
-        self.__achievements = dict()
-        self.__exp = -1
-        self.__legacy_ranking = -1
-        self.__ranks = tuple()
-        self.__chat_mute = -1
-        self.__pref_games = tuple()
-        self.__public_listed = None
-        self.__tag_color = None
-        self.__exp_by_game = dict()
-
-        self.__parse_guild_data()
-
-    def __parse_guild_data(self) -> None:
-        d = self.raw.get('guild', {})
-
-        self.__id = d.get('_id', None)
-        self.__name = d.get('name', None)
-        self.__coins = d.get('coins', -1)
-        self.__max_coins = d.get('coinsEver', -1)
-        self.__created = d.get('created', None)
-        self.__members = tuple(
-            GuildMember(i) for i in d.get('members', ())
-        )
-        self.__tag = d.get('tag', None)
-        self.__achievements = d.get('achievements', None)
-        self.__exp = d.get('exp', -1)
-        self.__legacy_ranking = d.get('legacyRanking', -1)
-        self.__ranks = tuple(
-            GuildRank(i) for i in d.get('ranks', ())
-        )
-        self.__chat_mute = d.get('chatMute', -1)
-        self.__pref_games = d.get('preferredGames', None)
-        self.__public_listed = d.get('publiclyListed', None)
-        self.__tag_color = d.get('tagColor', None)
-        self.__exp_by_game = d.get('guildExpByGameType', None)
-
-    @property
-    def id(self) -> str:
-        """
-        Get guild ID
-        :return: Guild ID
-        """
-        return self.__id
-
-    @property
-    def name(self) -> str:
-        """
-        Get guild name
-        :return: Guild name
-        """
-        return self.__name
-
-    @property
-    def coins(self) -> int:
-        """
-        Get current number of coins
-        :return: Guild's coins
-        """
-        return self.__coins
-
-    @property
-    def max_coins(self) -> int:
-        """
-        Get guild maximum number of coins
-        :return: Guild's max coins
-        """
-        return self.__max_coins
-
-    @property
-    def created(self) -> datetime:
-        """
-        Get guild's creation date
-        :return:
-        """
-        return timestamp_to_datetime(self.__created)
-
-    @property
-    def members(self) -> Tuple[GuildMember]:
-        """
-        Get guild's member list
-        :return: Member List
-        """
-        return self.__members
-
-    @property
-    def tag(self) -> str:
-        """
-        Get guild's tag
-        :return: guild tag
-        """
-        return self.__tag
-
-    @property
-    def achievements(self) -> Dict[str, int]:
-        """
-        Get guild's achievements stat
-        :return: Guild achievements stat
-        """
-        return self.__achievements
-
-    @property
-    def exp(self) -> int:
-        """
-        Get guild EXP
-        :return: Guild EXP
-        """
-        return self.__exp
-
-    @property
-    def legacy_rank(self) -> int:
-        """
-        Get guild's legacy rank
-        :return: legacy rank
-        """
-        return self.__legacy_ranking
-
-    @property
-    def ranks(self) -> Tuple[GuildRank]:
-        """
-        Get guild's rank list
-        :return: rank list
-        """
-        return self.__ranks
-
-    @property
-    def chat_mute(self) -> int:
-        """
-        Get guild's chat mute
-        :return: chat mute
-        """
-        return self.__chat_mute
-
-    @property
-    def preferred_games(self) -> Tuple[str]:
-        """
-        Get guild's preferred games list
-        :return: preferred games list
-        """
-        return self.__pref_games
-
-    @property
-    def publicly_listed(self) -> bool:
-        """
-        Get if the guild is publicly listed
-        :return: True if public
-        """
-        return self.__public_listed
-
-    @property
-    def tag_color(self) -> str:
-        """
-        Get guild's tag color
-        :return: Tag color as string
-        """
-        return self.__tag_color
-
-    @property
-    def exp_by_game(self) -> Dict[str, int]:
-        """
-        Get guild's exp dict by gametype
-        :return: EXP by gameType
-        """
-        return self.__exp_by_game
+    _SOURCE = 'guild'
+
+    id = Field('_id', doc="Get guild ID")
+    name = Field('name', doc="Get guild name")
+    coins = Field('coins', -1, doc="Get current number of coins")
+    max_coins = Field('coinsEver', -1,
+                      doc="Get guild maximum number of coins")
+    created = Timestamp('created', doc="Get guild's creation date")
+    members = Field('members', (), tuple_of(GuildMember),
+                    doc="Get guild's member list")
+    tag = Field('tag', doc="Get guild's tag")
+    achievements = Field('achievements',
+                         doc="Get guild's achievements stat")
+    exp = Field('exp', -1, doc="Get guild EXP")
+    legacy_rank = Field('legacyRanking', -1,
+                        doc="Get guild's legacy rank")
+    ranks = Field('ranks', (), tuple_of(GuildRank),
+                  doc="Get guild's rank list")
+    chat_mute = Field('chatMute', -1, doc="Get guild's chat mute")
+    preferred_games = Field('preferredGames',
+                            doc="Get guild's preferred games list")
+    publicly_listed = Field('publiclyListed',
+                            doc="Get if the guild is publicly listed")
+    tag_color = Field('tagColor', convert=interned,
+                      doc="Get guild's tag color")
+    exp_by_game = Field('guildExpByGameType',
+                        doc="Get guild's exp dict by gametype")
 
 
 class FriendResponse(APIResponse):
@@ -760,25 +493,8 @@ class FriendResponse(APIResponse):
     Object parsing /friend endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__friends = tuple()
-
-        self.__parse_friend_data()
-
-    def __parse_friend_data(self) -> None:
-        self.__friends = tuple(
-            Friend(i) for i in self.raw.get('records', ())
-        )
-
-    @property
-    def friends(self) -> Tuple[Friend]:
-        """
-        Get Friends list
-        :return: Friend list
-        """
-        return self.__friends
+    friends = Field('records', (), tuple_of(Friend),
+                    doc="Get Friends list")
 
 
 class GameCountsResponse(APIResponse):
@@ -786,35 +502,9 @@ class GameCountsResponse(APIResponse):
     Object parsing /gameCounts endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__games = None
-        self.__player_count = None
-
-        self.__parse_gamecounts_data()
-
-    def __parse_gamecounts_data(self) -> None:
-        self.__games = {
-            k: GameStatus(v) for k, v in self.raw.get('games', {}).items()
-        }
-        self.__player_count = self.raw.get('playerCount', None)
-
-    @property
-    def games(self) -> Dict[str, GameStatus]:
-        """
-        Get game status by gameType
-        :return: game status by gameType
-        """
-        return self.__games
-
-    @property
-    def player_count(self) -> int:
-        """
-        Get total player count
-        :return: player count
-        """
-        return self.__player_count
+    games = Field('games', {}, dict_of(GameStatus),
+                  doc="Get game status by gameType")
+    player_count = Field('playerCount', doc="Get total player count")
 
 
 class LeaderboardResponse(APIResponse):
@@ -822,150 +512,52 @@ class LeaderboardResponse(APIResponse):
     Object parsing /leaderboards endpoint
     """
 
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__boards = None
-
-        self.__parse_board_data()
-
-    def __parse_board_data(self) -> None:
-
-        b = self.raw.get('leaderboards', {})
-        self.__boards = {
-            k: Leaderboard(v) for k in b.keys() for v in b.get(k)
-        }
-
-    @property
+    @field
     def leaderboards(self) -> Dict[str, Tuple[Leaderboard]]:
         """
         Get the leaderboards for each gametype
         :return: leaderboards for each gameType
         """
-        return self.__boards
-
-
-class PlayerResponse(APIResponse):
-
-    def __init__(self, raw: dict) -> None:
-        super().__init__(raw)
-
-        self.__id = None
-        self.__display_name = None
-        self.__known_aliases = tuple()
-        self.__known_aliases_lower = tuple()
-        self.__player_name = None
-        self.__stats = dict()
-        self.__uuid = None
-        self.__last_login = None
-        self.__last_logout = None
-        self.__achievements_one_time = tuple()
-        self.__achievements_tracking = tuple()
-        self.__achievements_tiered = dict()
-        self.__achievement_points = None
-        self.__network_exp = None
-        self.__pet_consumable = dict()
-        self.__hypixel_level = None
-        self.__rank = None
-
-        self.__parse_player_data()
-
-    def __parse_player_data(self):
-        d = self._raw.get("player", {})
-
-        self.__id = d.get("_id", None)
-        self.__display_name = d.get('displayname')
-        self.__known_aliases = tuple(d.get("knownAliases", ()))
-        self.__known_aliases_lower = tuple(d.get('knownAliasesLower', ()))
-        self.__player_name = d.get('playername', None)
-        self.__uuid = d.get('uuid', None)
-        self.__last_login = d.get('lastLogin', None)
-        self.__last_logout = d.get('lastLogout', None)
-        self.__achievements_one_time = tuple(d.get('achievementsOneTime', ()))
-        self.__achievements_tracking = tuple(d.get('achievementTracking', ()))
-        self.__achievements_tiered = d.get('achievements', {})
-        self.__achievement_points = d.get('achievementPoints', None)
-        self.__network_exp = d.get('networkExp', None)
-        self.__pet_consumable = d.get('petConsumables', {})
-        self.__rank = d.get('newPackageRank', None)
-
-        # Parse Hypixel Level
-        levels = [int(i.split('_')[1]) for i in
-                  filter(lambda x: x.startswith('levelingReward_'), d.keys())]
-        self.__hypixel_level = max(levels) + 1
-
-        self.__stats = {
-            k: game_mode_to_player_stat_obj.get(k, NotImplementedPlayerStat)(v)
-            for k, v in d.get('stats', {}).items()
+        b = self.raw.get('leaderboards', {})
+        return {
+            k: Leaderboard(v) for k in b.keys() for v in b.get(k)
         }
 
-    @property
-    def id(self) -> str:
-        """
-        Get player ID
-        :return: Player ID
-        """
-        return self.__id
-
-    @property
-    def display_name(self) -> str:
-        """
-        Get player's display name
-        :return: Player's display name
-        """
-        return self.__display_name
-
-    @property
-    def known_aliases(self) -> Tuple[str]:
-        """
-        Get player's aliases list
-        :return: Aliases List
-        """
-        return self.__known_aliases
-
-    @property
-    def known_aliases_lower(self) -> Tuple[str]:
-        """
-        Get player's aliases list
-        :return: Aliases list (to lower)
-        """
-        return self.__known_aliases_lower
-
-    @property
-    def playername(self) -> str:
-        """
-        Get player name
-        :return: Player name
-        """
-        return self.__player_name
-
-    @property
-    def uuid(self) -> str:
-        """
-        Get player UUID
-        :return: UUID
-        """
-        return self.__uuid
 
-    @property
-    def last_login(self) -> datetime:
-        """
-        Get last login
-        :return: Last login
-        """
-        return timestamp_to_datetime(self.__last_login)
+class PlayerResponse(APIResponse):
 
-    @property
-    def last_logout(self) -> datetime:
-        """
-        Get last logout
-        :return: Last Logout
-        """
-        return timestamp_to_datetime(self.__last_logout)
+    _SOURCE = 'player'
+    _SELECTABLE = ('stats',)
+
+    id = Field('_id', doc="Get player ID")
+    display_name = Field('displayname', doc="Get player's display name")
+    known_aliases = Field('knownAliases', (), tuple,
+                          doc="Get player's aliases list")
+    known_aliases_lower = Field('knownAliasesLower', (), tuple,
+                                doc="Get player's aliases list (to lower)")
+    playername = Field('playername', doc="Get player name")
+    uuid = Field('uuid', convert=uuid_value, doc="Get player UUID")
+    last_login = Timestamp('lastLogin', doc="Get last login")
+    last_logout = Timestamp('lastLogout', doc="Get last logout")
+    achievements_one_time = Field('achievementsOneTime', (), tuple,
+                                  doc="Get player's one time achivements")
+    achievements_tiered = Field('achievements', convert=new_dict,
+                                doc="Get player tiered achievements data")
+    tracked_achievements = Field('achievementTracking', (), tuple,
+                                 doc="Get player tracked achievements list")
+    achievement_points = Field('achievementPoints',
+                               doc="Get player achievement points")
+    network_exp = Field('networkExp', doc="Get player network exp")
+    pet_consumable = Field('petConsumables', convert=new_dict,
+                           doc="Get pet consumable available")
+
+    @property
+    def _player(self) -> dict:
+        return self._raw.get("player", {})
 
     @property
     def is_online(self) -> bool:
-        return self.__last_login > self.__last_logout
+        return self._last_login > self._last_logout
 
     @property
     def last_session_duration(self) -> timedelta:
@@ -973,68 +565,37 @@ class PlayerResponse(APIResponse):
             raise ValueError("Session still in progress")
 
         return timedelta(
-            milliseconds=self.__last_logout - self.__last_login
+            milliseconds=self._last_logout - self._last_login
         )
 
-    @property
-    def achievements_one_time(self) -> Tuple[str]:
-        """
-        Get player's one time achivements
-        :return: One Time Achievements
-        """
-        return self.__achievements_one_time
-
-    @property
-    def achievements_tiered(self) -> Dict[str, int]:
-        """
-        Get player tiered achievements data
-        :return: Player tiered achievements data
-        """
-        return self.__achievements_tiered
-
-    @property
-    def tracked_achievements(self) -> Tuple[str]:
-        """
-        Get player tracked achievements list
-        :return: Tracked Achievements
-        """
-        return self.__achievements_tracking
-
-    @property
-    def achievement_points(self) -> int:
-        """
-        Get player achievement points
-        :return: Achievement Points
-        """
-        return self.__achievement_points
-
-    @property
-    def network_exp(self) -> int:
-        """
-        Get player network exp
-        :return: Network exp
-        """
-        return self.__network_exp
-
-    @property
+    @field
     def network_level(self) -> int:
-        return self.__hypixel_level
-
-    @property
-    def pet_consumable(self) -> Dict[str, int]:
-        """
-        Get pet consumable available
-        :return: Pet Consumable
-        """
-        return self.__pet_consumable
+        levels = [int(i.split('_')[1]) for i in
+                  filter(lambda x: x.startswith('levelingReward_'),
+                         self._player.keys())]
+        return max(levels) + 1
 
-    @property
+    @field
     def stats(self) -> Dict[str, object]:
         """
         Get stats by games
         :return: Stats
         """
-        return self.__stats
+        games = self._selection('stats')
+
+        return {
+            k: game_mode_to_player_stat_obj.get(k, NotImplementedPlayerStat)(v)
+            for k, v in self._player.get('stats', {}).items()
+            if games is None or k in games
+        }
+
+    def _retain(self, policy: str) -> None:
+        super()._retain(policy)
+
+        if policy != 'keep':
+            for i in vars(self).get('stats', {}).values():
+                if isinstance(i, PlayerStat):
+                    i._release()
 
     def is_achievement_unlocked(self, a: HypixelOneTimeAchievement) -> bool:
         if not isinstance(a, HypixelOneTimeAchievement):
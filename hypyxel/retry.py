@@ -0,0 +1,90 @@
+import random
+
+
+class RetryPolicy:
+    """
+    Describe how failed requests are sent again
+
+    Delays grow exponentially with full jitter (random value between 0 and
+    backoff * 2^attempt, capped by max_backoff) unless the server gives a
+    Retry-After header. Retries stop after `attempts` requests or when the
+    next one would start after `budget` seconds.
+    """
+
+    def __init__(self, attempts: int = 4,
+                 backoff: float = 0.5,
+                 max_backoff: float = 30.0,
+                 budget: float = 60.0,
+                 statuses=(429, 500, 502, 503, 504),
+                 endpoints: dict = None) -> None:
+        """
+        :param attempts: Maximum number of requests sent (1: no retry)
+        :param backoff: Base delay in seconds
+        :param max_backoff: Maximum delay in seconds
+        :param budget: Maximum time spent on a request, retries included
+        :param statuses: HTTP status codes worth a retry
+        :param endpoints: RetryPolicy by endpoint prefix, longest prefix wins
+        """
+        if attempts < 1:
+            raise ValueError("RetryPolicy: attempts should be >= 1")
+
+        self._attempts = attempts
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._budget = budget
+        self._statuses = frozenset(statuses)
+        self._endpoints = endpoints or {}
+
+    @property
+    def attempts(self) -> int:
+        """
+        Get the maximum number of requests sent
+        :return: Number of attempts
+        """
+        return self._attempts
+
+    @property
+    def budget(self) -> float:
+        """
+        Get the maximum time spent on a request, retries included
+        :return: Time budget in seconds
+        """
+        return self._budget
+
+    def for_path(self, path: str):
+        """
+        Get the policy applied to an endpoint
+        :param path: REST endpoint
+        :return: RetryPolicy object
+        """
+        best = None
+        for prefix in self._endpoints:
+            if path.startswith(prefix) and \
+                    (best is None or len(prefix) > len(best)):
+                best = prefix
+
+        return self._endpoints[best] if best is not None else self
+
+    def retry_status(self, status: int) -> bool:
+        """
+        Get if a response status is worth a retry
+        :param status: HTTP status code
+        :return: bool
+        """
+        return status in self._statuses
+
+    def delay(self, attempt: int, retry_after=None) -> float:
+        """
+        Get the delay before sending a request again
+        :param attempt: Number of the failed attempt (starting at 0)
+        :param retry_after: Retry-After header value, if any
+        :return: Delay in seconds
+        """
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            pass
+
+        return random.uniform(
+            0, min(self._max_backoff, self._backoff * 2 ** attempt)
+        )
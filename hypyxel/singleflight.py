@@ -0,0 +1,80 @@
+import threading
+
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls between threads
+    The first caller runs the call, the others wait for it and share
+    its result (or exception)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key, fn, *args):
+        """
+        Run fn(*args), unless a call with the same key is in flight
+        :param key: Call identifier
+        :param fn: Function to call
+        :param args: Function arguments
+        :return: Function result
+        """
+        with self._lock:
+            f = self._calls.get(key)
+            leader = f is None
+
+            if leader:
+                f = self._calls[key] = Future()
+
+        if not leader:
+            return f.result()
+
+        try:
+            r = fn(*args)
+        except BaseException as e:
+            f.set_exception(e)
+            raise
+        else:
+            f.set_result(r)
+            return r
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce identical concurrent calls between asyncio tasks
+    The call runs in its own task, so cancelling one of the callers does
+    not cancel the others
+    """
+
+    def __init__(self) -> None:
+        self._calls = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key, fn, *args):
+        """
+        Await fn(*args), unless a call with the same key is in flight
+        :param key: Call identifier
+        :param fn: Coroutine function to call
+        :param args: Function arguments
+        :return: Function result
+        """
+        import asyncio  # Loaded by the running event loop already
+
+        task = self._calls.get(key)
+
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn(*args))
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return await asyncio.shield(task)
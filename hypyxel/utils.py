@@ -1,4 +1,10 @@
 from datetime import datetime
+from importlib import import_module
+from operator import attrgetter
+from typing import Iterable
+from urllib.parse import urlencode
+
+import json
 
 
 def timestamp_to_datetime(t: int, b: int = 1000) -> datetime:
@@ -10,3 +16,75 @@ def timestamp_to_datetime(t: int, b: int = 1000) -> datetime:
     """
 
     return datetime.fromtimestamp(t / b) if t else None
+
+
+def timestamps_to_datetime64(objects: Iterable, name: str):
+    """
+    Convert a Timestamp field of many objects at once (requires numpy)
+    ex: timestamps_to_datetime64(guild.members, 'joined')
+    :param objects: Objects (or responses) declaring the field
+    :param name: Timestamp field name
+    :return: numpy array of datetime64[ms] (UTC, NaT if missing)
+    """
+    np = import_module('numpy')
+
+    get = attrgetter(f'_{name}')
+    nat = np.iinfo(np.int64).min
+    values = np.array([i or nat for i in map(get, objects)], np.int64)
+
+    return values.view('datetime64[ms]')
+
+
+class lazy_property:
+    """
+    Property computed on first access, then stored in the instance
+    (functools.cached_property for python < 3.8)
+    """
+
+    def __init__(self, fget) -> None:
+        self.fget = fget
+        self.__doc__ = fget.__doc__
+        self.__name__ = fget.__name__
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+
+        value = obj.__dict__[self.__name__] = self.fget(obj)
+        return value
+
+
+# Json libraries able to decode bytes, fastest first
+JSON_DECODERS = ('orjson', 'ujson', 'json')
+
+
+def json_decoder(name: str = None):
+    """
+    Get a function decoding json from bytes (or str)
+    :param name: One of JSON_DECODERS, fastest installed one if None
+    :return: loads function
+    """
+    if name is not None:
+        if name not in JSON_DECODERS:
+            raise ValueError(f"Unknown json decoder: {name}")
+
+        return import_module(name).loads
+
+    for i in JSON_DECODERS:
+        try:
+            return import_module(i).loads
+        except ImportError:
+            pass
+
+    return json.loads
+
+
+def request_key(path: str, params: dict) -> str:
+    """
+    Identify a request, whatever the API key used
+    :param path: REST endpoint
+    :param params: Request parameters
+    :return: Request identifier
+    """
+    p = sorted((k, v) for k, v in params.items() if k != 'key')
+    return f"{path}?{urlencode(p)}" if p else path
@@ -0,0 +1,136 @@
+import uuid
+
+from contextvars import ContextVar
+from typing import Iterable, Tuple, Union
+
+# Parse UUIDs as CompactUUID instead of hex strings (see compact_uuids)
+_compact = False
+
+# Setting of the response being parsed, None for the process wide one
+_parsing = ContextVar('hypyxel_compact_uuids', default=None)
+
+
+class CompactUUID(int):
+    """
+    Minecraft UUID stored as a 128-bit int
+
+    Smaller than the 32 characters hex string, hashed and compared as an
+    int. Compares equal to other CompactUUID (or ints) only: convert
+    strings with CompactUUID(value) before comparing them.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: Union[str, bytes, int, uuid.UUID]):
+        """
+        :param value: Hex string (dashes allowed), 16 bytes, int or UUID
+        """
+        if isinstance(value, str):
+            value = int(value.replace('-', ''), 16)
+        elif isinstance(value, (bytes, bytearray)):
+            if len(value) != 16:
+                raise ValueError(f"Hypyxel: invalid UUID bytes {value!r}")
+            value = int.from_bytes(value, 'big')
+        elif isinstance(value, uuid.UUID):
+            value = value.int
+
+        if not 0 <= value < 1 << 128:
+            raise ValueError(f"Hypyxel: invalid UUID {value!r}")
+
+        return super().__new__(cls, value)
+
+    def __str__(self) -> str:
+        return self.hex
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self.hex}')"
+
+    @property
+    def hex(self) -> str:
+        """
+        Get the UUID as returned by the API
+        :return: 32 characters hex string
+        """
+        return '%032x' % self
+
+    @property
+    def bytes(self) -> bytes:
+        """
+        Get the UUID as bytes
+        :return: 16 bytes, big endian
+        """
+        return self.to_bytes(16, 'big')
+
+    def to_uuid(self) -> uuid.UUID:
+        """
+        Get the UUID as a standard library object
+        :return: uuid.UUID
+        """
+        return uuid.UUID(int=self)
+
+
+def compact_uuids(enabled: bool = True) -> None:
+    """
+    Parse the UUIDs of every response as CompactUUID (process wide,
+    see also Api(compact_uuids=...))
+
+    Affect responses built after the call (their lazy fields follow the
+    setting of the time they were built) and objects parsed after it:
+    PlayerResponse.uuid, KeyResponse.owner, GuildMember.id,
+    Friend.sender / receiver, Booster.purchaser and Leaderboard.leaders.
+    :param enabled: False to go back to hex strings
+    """
+    global _compact
+    _compact = bool(enabled)
+
+
+def compact_enabled() -> bool:
+    """
+    Get if the UUIDs parsed now are CompactUUID
+    :return: Setting of the response being parsed, or the process wide
+             one
+    """
+    enabled = _parsing.get()
+    return _compact if enabled is None else enabled
+
+
+def uuid_value(value):
+    """
+    Converter of the UUID fields
+    :param value: Json value
+    :return: CompactUUID if enabled and valid, value as is otherwise
+    """
+    if type(value) is str and compact_enabled():
+        try:
+            return CompactUUID(value)
+        except ValueError:
+            pass
+    return value
+
+
+def uuid_tuple(data: Iterable) -> Tuple:
+    """
+    Converter of the UUID list fields
+    :param data: Json list
+    :return: tuple of UUIDs
+    """
+    return tuple(map(uuid_value, data)) if compact_enabled() \
+        else tuple(data)
+
+
+def to_compact(value) -> Union[CompactUUID, None]:
+    """
+    Convert an UUID from any representation
+    :param value: UUID (hex string, bytes, int, uuid.UUID) or None
+    :return: CompactUUID or None
+    """
+    return None if value is None else CompactUUID(value)
+
+
+def to_hex(value) -> Union[str, None]:
+    """
+    Convert an UUID from any representation to the API representation
+    :param value: UUID (hex string, bytes, int, uuid.UUID) or None
+    :return: 32 characters hex string or None
+    """
+    return None if value is None else CompactUUID(value).hex
@@ -23,6 +23,7 @@ setup(
     author_email=about['__author_email__'],
     url=about['__url__'],
     requires=["requests"],
+    extras_require={'async': ['aiohttp'], 'numpy': ['numpy']},
     test_requires=['flask'],
     packages=['hypyxel'],
     python_requires='>=3.6.0',
@@ -0,0 +1,389 @@
+"""
+Local stand-in of the Hypixel API, for load tests
+
+An asyncio HTTP/1.1 server (keep-alive, thousands of concurrent
+connections) answering synthetic payloads (tests/payloads.py) with:
+  * a latency distribution by endpoint
+  * injected errors (429, 5xx...) by endpoint
+  * API keys with a quota by window, sent in the RateLimit-* headers
+
+    with MockServer(keys={'key': 120},
+                    latency=Latency('lognormal', 0.05, 0.5),
+                    errors={'/player': {503: 0.01}}) as s:
+        Api(host=s.host, key='key').get_player('uuid')
+
+Runs in a background thread (MockServer.start / context manager) or in
+the foreground: python -m tests.mock_server --help
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+
+from collections import Counter
+from typing import Dict
+from urllib.parse import parse_qs, urlsplit
+
+from .payloads import ENDPOINTS, Payloads
+
+REASONS = {200: 'OK', 400: 'Bad Request', 403: 'Forbidden',
+           404: 'Not Found', 429: 'Too Many Requests',
+           500: 'Internal Server Error', 502: 'Bad Gateway',
+           503: 'Service Unavailable', 504: 'Gateway Timeout'}
+
+
+class Latency:
+    """
+    Distribution of the response delays, in seconds
+    """
+
+    KINDS = {
+        'constant': lambda r, value: value,
+        'uniform': lambda r, low, high: r.uniform(low, high),
+        'normal': lambda r, mean, sd: max(0.0, r.gauss(mean, sd)),
+        'lognormal': lambda r, median, sigma:
+            r.lognormvariate(math.log(median), sigma),
+        'exponential': lambda r, mean: r.expovariate(1 / mean),
+    }
+
+    def __init__(self, kind: str = 'constant', *params: float) -> None:
+        """
+        :param kind: One of KINDS
+        :param params: Distribution parameters (see KINDS), ex:
+                       Latency('lognormal', 0.05, 0.5): median 50ms
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution: {kind}")
+
+        self._sample = self.KINDS[kind]
+        self._params = params or (0.0,)
+
+        # Check the parameters
+        self.sample(random.Random())
+
+    @classmethod
+    def parse(cls, text: str):
+        """
+        Build a distribution from its description
+        :param text: "kind:param,...", ex: "uniform:0.01,0.2"
+        :return: Latency object
+        """
+        kind, _, params = text.partition(':')
+        return cls(kind, *(float(i) for i in params.split(',') if i))
+
+    def sample(self, r: random.Random) -> float:
+        """
+        Draw a delay
+        :param r: Random generator
+        :return: Delay in seconds
+        """
+        return self._sample(r, *self._params)
+
+
+class _Quota:
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.used = 0
+        self.reset_at = 0.0
+
+    def take(self, now: float) -> bool:
+        if now >= self.reset_at:
+            self.used = 0
+            self.reset_at = now + self.window
+
+        if self.used >= self.limit:
+            return False
+
+        self.used += 1
+        return True
+
+    def headers(self, now: float) -> dict:
+        return {
+            'RateLimit-Limit': str(self.limit),
+            'RateLimit-Remaining': str(max(0, self.limit - self.used)),
+            'RateLimit-Reset': str(max(0, math.ceil(self.reset_at - now))),
+        }
+
+
+def _error(message: str) -> bytes:
+    return json.dumps({'success': False, 'cause': message,
+                       'message': message}).encode()
+
+
+class MockServer:
+    """
+    Stand-in of the Hypixel API, see the module documentation
+    """
+
+    def __init__(self, keys: Dict[str, int] = None,
+                 latency=None,
+                 errors: Dict[str, Dict[int, float]] = None,
+                 payloads: dict = None,
+                 window: float = 60.0,
+                 scale: float = 1,
+                 seed: int = 0,
+                 host: str = 'localhost',
+                 port: int = 0) -> None:
+        """
+        :param keys: Quota (requests by window) by valid API key,
+                     None to accept any key without quota
+        :param latency: Latency of every endpoint, or dict of Latency by
+                        endpoint ('*' for the others)
+        :param errors: Probability of each injected status by endpoint
+                       ('*' for the others), ex: {'*': {500: 0.01}}
+        :param payloads: Json object (or bytes) by endpoint, generated
+                         from tests/payloads.py if missing
+        :param window: Quota window in seconds
+        :param scale: Size of the generated payloads
+        :param seed: Seed of the payloads, latencies and errors
+        :param host: Listening address
+        :param port: Listening port, 0 for any free one
+        """
+        if not isinstance(latency, dict):
+            latency = {'*': latency or Latency()}
+
+        self._keys = None if keys is None else {
+            k: _Quota(v, window) for k, v in keys.items()
+        }
+        self._latency = latency
+        self._errors = errors or {}
+        self._payloads = {k: v if isinstance(v, bytes) else
+                          json.dumps(v).encode()
+                          for k, v in (payloads or {}).items()}
+        self._generator = Payloads(seed)
+        self._scale = scale
+        self._random = random.Random(seed)
+
+        self._address = (host, port)
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._connections = {}
+
+        # Number of responses by endpoint and status code
+        self.stats = {}
+
+    @property
+    def host(self) -> str:
+        """
+        Get the url of the server (once started)
+        :return: url, ex: http://localhost:8000
+        """
+        port = self._server.sockets[0].getsockname()[1]
+        return f'http://{self._address[0]}:{port}'
+
+    def _payload(self, path: str) -> bytes:
+        body = self._payloads.get(path)
+        if body is None and path in ENDPOINTS:
+            body = self._payloads[path] = json.dumps(
+                self._generator.endpoint(path, self._scale)
+            ).encode()
+        return body
+
+    def _injected(self, path: str) -> int:
+        for status, p in self._errors.get(path,
+                                          self._errors.get('*', {})).items():
+            if self._random.random() < p:
+                return status
+        return None
+
+    async def respond(self, target: str) -> tuple:
+        """
+        Build the response to a GET request
+        :param target: Request target (path and query)
+        :return: (status, headers, body)
+        """
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        key = parse_qs(url.query).get('key', [None])[0]
+
+        latency = self._latency.get(path, self._latency.get('*'))
+        if latency is not None:
+            await asyncio.sleep(latency.sample(self._random))
+
+        status, headers, body = self._answer(path, key)
+
+        stats = self.stats.setdefault(path, Counter())
+        stats[status] += 1
+
+        return status, headers, body
+
+    def _answer(self, path: str, key: str) -> tuple:
+        headers = {}
+
+        if not path.startswith('/resources/') and self._keys is not None:
+            quota = self._keys.get(key)
+            if quota is None:
+                return 403, headers, _error("Invalid API key")
+
+            now = time.monotonic()
+            allowed = quota.take(now)
+            headers.update(quota.headers(now))
+
+            if not allowed:
+                headers['Retry-After'] = headers['RateLimit-Reset']
+                return 429, headers, _error("Key throttle")
+
+        status = self._injected(path)
+        if status is not None:
+            if status == 429:
+                headers['Retry-After'] = '1'
+            return status, headers, _error("Injected error")
+
+        body = self._payload(path)
+        if body is None:
+            return 404, headers, _error("Unknown endpoint")
+
+        return 200, headers, body
+
+    async def _handle(self, reader, writer) -> None:
+        task = asyncio.current_task()
+        self._connections[task] = writer
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                method, target, version = line.decode('latin-1').split()
+
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b'\r\n', b'\n', b''):
+                        break
+                    k, _, v = h.decode('latin-1').partition(':')
+                    headers[k.strip().lower()] = v.strip()
+
+                if method == 'GET':
+                    status, h, body = await self.respond(target)
+                else:
+                    status, h, body = 400, {}, _error("GET only")
+
+                close = version != 'HTTP/1.1' or \
+                    headers.get('connection', '').lower() == 'close'
+
+                h.update({'Content-Type': 'application/json',
+                          'Content-Length': str(len(body)),
+                          'Connection': 'close' if close else 'keep-alive'})
+                head = f'HTTP/1.1 {status} {REASONS.get(status, "")}\r\n' + \
+                    ''.join(f'{k}: {v}\r\n' for k, v in h.items()) + '\r\n'
+
+                writer.write(head.encode('latin-1') + body)
+                await writer.drain()
+
+                if close:
+                    break
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+            self._connections.pop(task, None)
+
+    async def _start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle, *self._address, backlog=4096
+        )
+
+    def serve_forever(self) -> None:
+        """
+        Run the server in the current thread
+        """
+        async def main():
+            await self._start()
+            print(f"Serving on {self.host}")
+            async with self._server:
+                await self._server.serve_forever()
+
+        asyncio.run(main())
+
+    def start(self) -> None:
+        """
+        Run the server in a background thread
+        """
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._start())
+            started.set()
+            self._loop.run_forever()
+
+            # Close the open connections before the loop
+            self._server.close()
+            for i in list(self._connections.values()):
+                i.close()
+            self._loop.run_until_complete(
+                asyncio.gather(*list(self._connections),
+                               return_exceptions=True)
+            )
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self) -> None:
+        """
+        Stop the background server
+        """
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _errors(text: str) -> Dict[int, float]:
+    status, _, p = text.partition('=')
+    return {int(status): float(p)}
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    p.add_argument('--host', default='localhost')
+    p.add_argument('--port', type=int, default=8001)
+    p.add_argument('--key', action='append', default=[],
+                   help="Valid API key and its quota, ex: test-key-ftw=120 "
+                        "(repeatable, default: any key, no quota)")
+    p.add_argument('--window', type=float, default=60.0,
+                   help="Quota window in seconds")
+    p.add_argument('--latency', type=Latency.parse, default=Latency(),
+                   help="Latency distribution, ex: lognormal:0.05,0.5")
+    p.add_argument('--error', type=_errors, action='append', default=[],
+                   help="Injected status and probability, ex: 503=0.01 "
+                        "(repeatable)")
+    p.add_argument('--scale', type=float, default=1,
+                   help="Size of the payloads")
+    p.add_argument('--seed', type=int, default=0)
+    args = p.parse_args()
+
+    keys = None
+    if args.key:
+        keys = {k: int(v) for k, _, v in
+                (i.partition('=') for i in args.key)}
+
+    errors = {}
+    for i in args.error:
+        errors.update(i)
+
+    MockServer(keys=keys, latency=args.latency, errors={'*': errors},
+               window=args.window, scale=args.scale, seed=args.seed,
+               host=args.host, port=args.port).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,481 @@
+"""
+Synthetic API payloads, for scale and stress testing
+
+Payloads follow the structure of the tests/test_server fixtures, with
+random (seeded) values and any number of entries:
+
+    p = Payloads(seed=42)
+    p.guild(members=125)
+    p.endpoint('/player', scale=10)
+"""
+
+import random
+import string
+
+from datetime import datetime, timezone
+from typing import List
+
+# Date of the generated payloads (Unix Epoch Milliseconds)
+NOW = 1605081641570
+DAY = 86400000
+
+# Game names, as used by the player stats
+STATS_GAMES = (
+    'HungerGames', 'SkyBlock', 'Arcade', 'Arena', 'GingerBread',
+    'VampireZ', 'Walls3', 'MCGO', 'Battleground', 'UHC', 'TNTGames',
+    'SuperSmash', 'Paintball', 'Quake', 'Walls', 'SkyWars', 'Bedwars',
+    'Duels', 'BuildBattle', 'MurderMystery', 'Housing', 'Legacy',
+    'SpeedUHC', 'Pit',
+)
+
+# Game types, as used by the other endpoints
+GAME_TYPES = (
+    'SKYWARS', 'BEDWARS', 'SKYBLOCK', 'DUELS', 'ARCADE', 'BUILD_BATTLE',
+    'MURDER_MYSTERY', 'UHC', 'TNTGAMES', 'HOUSING', 'PIT', 'WALLS3',
+    'SURVIVAL_GAMES', 'QUAKECRAFT', 'PAINTBALL', 'ARENA', 'MCGO',
+    'BATTLEGROUND', 'SUPER_SMASH', 'SPEED_UHC', 'GINGERBREAD', 'VAMPIREZ',
+    'WALLS', 'LEGACY', 'PROTOTYPE', 'MAIN_LOBBY',
+)
+
+MODES = ('solo_normal', 'solo_insane', 'teams_normal', 'teams_insane',
+         'ranked_normal', 'mega_doubles', 'dynamic', 'hub', 'dungeon',
+         'combat_1', 'farming_1', 'mining_1', 'foraging_1')
+
+MAPS = ('Aegis', 'Elven', 'Shire', 'Jinzhou', 'Lighthouse', 'Onionring',
+        'Pitfall', 'Siege', 'Submerged', 'Tribute', None)
+
+STATS = ('coins', 'kills', 'deaths', 'wins', 'losses', 'games_played',
+         'assists', 'blocks_broken', 'blocks_placed', 'shots_fired')
+
+GUILD_RANKS = ('Officer', 'Veteran', 'Member', 'Recruit', 'Famous')
+
+LEADERBOARD_PATHS = ('wins', 'kills', 'level', 'coins', 'weekly_wins',
+                     'monthly_wins', 'weekly_kills', 'monthly_kills')
+
+REWARDS = ('MultipliedExperienceReward', 'MultipliedCoinReward',
+           'SkyWarsSoulReward', 'PackageReward')
+
+SKILLS = ('MINING', 'FARMING', 'COMBAT', 'FORAGING', 'FISHING',
+          'ENCHANTING', 'ALCHEMY', 'TAMING', 'CARPENTRY', 'RUNECRAFTING')
+
+
+def names(pool, n: int) -> List[str]:
+    """
+    Get n distinct names, numbering the pool ones past its end
+    :param pool: Base names
+    :param n: Number of names
+    :return: List of names
+    """
+    return [pool[i % len(pool)] + (f'_{i // len(pool)}' if i >= len(pool)
+                                   else '') for i in range(n)]
+
+
+class Payloads:
+    """
+    Seeded generator of API payloads (json objects)
+
+    The same seed and calls give the same payloads. Each endpoint method
+    takes the size of its collections, endpoint() scales the defaults.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self.random = random.Random(seed)
+
+    # Values
+
+    def uuid(self) -> str:
+        return '%032x' % self.random.getrandbits(128)
+
+    def dashed_uuid(self) -> str:
+        u = self.uuid()
+        return f'{u[:8]}-{u[8:12]}-{u[12:16]}-{u[16:20]}-{u[20:]}'
+
+    def object_id(self) -> str:
+        return '%024x' % self.random.getrandbits(96)
+
+    def timestamp(self, days: int = 3650) -> int:
+        return NOW - self.random.randrange(days * DAY)
+
+    def word(self, size: int = 8) -> str:
+        return ''.join(self.random.choices(string.ascii_lowercase, k=size))
+
+    def sentence(self, words: int = 6) -> str:
+        return ' '.join(self.word(self.random.randint(2, 9))
+                        for _ in range(words)).capitalize()
+
+    def name(self) -> str:
+        return self.word(self.random.randint(3, 12)).capitalize()
+
+    # Endpoints
+
+    def status(self, online: bool = True) -> dict:
+        session = {'online': online}
+        if online:
+            session.update(gameType=self.random.choice(GAME_TYPES),
+                           mode=self.random.choice(MODES))
+        return {'success': True, 'session': session}
+
+    def watchdog(self) -> dict:
+        return {
+            'success': True,
+            'watchdog_lastMinute': self.random.randrange(10),
+            'staff_rollingDaily': self.random.randrange(5000),
+            'watchdog_total': self.random.randrange(10 ** 7),
+            'watchdog_rollingDaily': self.random.randrange(10000),
+            'staff_total': self.random.randrange(10 ** 7),
+        }
+
+    def key(self, key: str = 'test-key-ftw', limit: int = 120) -> dict:
+        return {'success': True, 'record': {
+            'key': key,
+            'owner': self.uuid(),
+            'limit': limit,
+            'queriesInPastMin': self.random.randrange(limit),
+            'totalQueries': self.random.randrange(10 ** 6),
+        }}
+
+    def player_count(self) -> dict:
+        return {'success': True, 'playerCount': self.random.randrange(10 ** 5)}
+
+    def find_guild(self) -> dict:
+        return {'success': True, 'guild': self.object_id()}
+
+    def boosters(self, count: int = 50, stacked: int = 10) -> dict:
+        boosters = []
+        for _ in range(count):
+            length = self.random.choice((3600, 7200))
+            b = {
+                '_id': self.object_id(),
+                'purchaserUuid': self.uuid(),
+                'amount': float(self.random.choice((2, 3))),
+                'originalLength': length,
+                'length': self.random.randrange(length),
+                'gameType': self.random.randrange(1, 65),
+                'dateActivated': self.timestamp(1),
+            }
+            s = self.random.randrange(stacked + 1)
+            if s:
+                b['stacked'] = [self.dashed_uuid() for _ in range(s)]
+            elif self.random.random() < 0.5:
+                b['stacked'] = True
+            boosters.append(b)
+
+        return {'success': True, 'boosters': boosters,
+                'boosterState': {'decrementing': True}}
+
+    def guild(self, members: int = 125, days: int = 7,
+              ranks: int = 4) -> dict:
+        rank_names = ['GUILDMASTER'] + names(GUILD_RANKS, ranks)
+        created = self.timestamp()
+        dates = [datetime.fromtimestamp((NOW - i * DAY) / 1000, timezone.utc)
+                 .strftime('%Y-%m-%d') for i in range(days)]
+
+        name = self.sentence(2)
+        exp = {i: self.random.randrange(10 ** 7) for i in GAME_TYPES}
+
+        return {'success': True, 'guild': {
+            '_id': self.object_id(),
+            'name': name,
+            'name_lower': name.lower(),
+            'coins': self.random.randrange(10 ** 6),
+            'coinsEver': self.random.randrange(10 ** 6, 10 ** 7),
+            'created': created,
+            'members': [{
+                'uuid': self.uuid(),
+                'rank': rank_names[0] if not i else
+                self.random.choice(rank_names[1:]),
+                'joined': self.random.randrange(created, NOW),
+                'questParticipation': self.random.randrange(1000),
+                'expHistory': {d: self.random.choice((0, 0, 1)) *
+                               self.random.randrange(10000) for d in dates},
+            } for i in range(members)],
+            'tag': self.word(4).upper(),
+            'tagColor': self.random.choice(('GRAY', 'GOLD', 'DARK_AQUA')),
+            'achievements': {'WINNERS': self.random.randrange(2000),
+                             'EXPERIENCE_KINGS': self.random.randrange(10**6),
+                             'ONLINE_PLAYERS': self.random.randrange(members)},
+            'exp': sum(exp.values()),
+            'legacyRanking': self.random.randrange(10000),
+            'ranks': [{
+                'name': i,
+                'default': i == rank_names[-1],
+                'tag': i[0] if self.random.random() < 0.5 else None,
+                'created': self.random.randrange(created, NOW),
+                'priority': len(rank_names) - n,
+            } for n, i in enumerate(rank_names[1:])],
+            'chatMute': 0,
+            'preferredGames': self.random.sample(GAME_TYPES, 2),
+            'publiclyListed': self.random.random() < 0.5,
+            'guildExpByGameType': exp,
+        }}
+
+    def friends(self, count: int = 100, uuid: str = None) -> dict:
+        uuid = uuid or self.uuid()
+        records = []
+        for _ in range(count):
+            pair = [uuid, self.uuid()]
+            self.random.shuffle(pair)
+            records.append({'_id': self.object_id(), 'uuidSender': pair[0],
+                            'uuidReceiver': pair[1],
+                            'started': self.timestamp()})
+
+        return {'success': True, 'records': records}
+
+    def game_counts(self, games: int = len(GAME_TYPES),
+                    modes: int = 8) -> dict:
+        r = {}
+        for i in names(GAME_TYPES, games):
+            m = {k: self.random.randrange(2000) for k in
+                 self.random.sample(MODES, min(len(MODES), modes))}
+            r[i] = {'players': sum(m.values()) or self.random.randrange(500)}
+            if m:
+                r[i]['modes'] = m
+
+        return {'success': True, 'games': r, 'playerCount':
+                sum(i['players'] for i in r.values())}
+
+    def recent_games(self, count: int = 100) -> dict:
+        games = []
+        for _ in range(count):
+            g = {'date': self.timestamp(3),
+                 'gameType': self.random.choice(GAME_TYPES),
+                 'mode': self.random.choice(MODES),
+                 'map': self.random.choice(MAPS)}
+            if self.random.random() < 0.95:
+                g['ended'] = g['date'] + self.random.randrange(60000,
+                                                               1800000)
+            games.append(g)
+
+        return {'success': True, 'games': games}
+
+    def leaderboards(self, games: int = len(GAME_TYPES),
+                     boards: int = 6) -> dict:
+        return {'success': True, 'leaderboards': {g: [{
+            'path': p,
+            'prefix': self.random.choice(('Overall', 'Weekly', 'Monthly')),
+            'title': p.replace('_', ' ').title(),
+            'location': ','.join(str(self.random.randrange(-200, 200))
+                                 for _ in range(3)),
+            'count': 10,
+            'leaders': [self.uuid() for _ in range(10)],
+        } for p in names(LEADERBOARD_PATHS, boards)]
+            for g in names(GAME_TYPES, games)}}
+
+    def player(self, games: int = len(STATS_GAMES),
+               achievements: int = 100, level: int = 50) -> dict:
+        uuid = self.uuid()
+        name = self.name()
+        login = self.timestamp(30)
+
+        stats = {}
+        for g in names(STATS_GAMES, games):
+            if g == 'SkyBlock':
+                ids = [self.uuid() for _ in range(self.random.randint(1, 5))]
+                stats[g] = {'profiles': {i: {'profile_id': i,
+                                             'cute_name': self.name()}
+                                         for i in ids}}
+            else:
+                stats[g] = {k: self.random.randrange(10 ** 5)
+                            for k in STATS}
+                stats[g]['lastTourneyAd'] = self.timestamp()
+
+        one_time = [f'{self.random.choice(STATS_GAMES).lower()}_'
+                    f'{self.word()}' for _ in range(achievements)]
+
+        p = {
+            '_id': self.object_id(),
+            'uuid': uuid,
+            'displayname': name,
+            'playername': name.lower(),
+            'knownAliases': [name],
+            'knownAliasesLower': [name.lower(), self.word()],
+            'firstLogin': self.timestamp(),
+            'lastLogin': login,
+            'lastLogout': login + self.random.randrange(DAY),
+            'networkExp': float(self.random.randrange(10 ** 7)),
+            'karma': self.random.randrange(10 ** 6),
+            'achievementPoints': self.random.randrange(10000),
+            'achievementsOneTime': one_time,
+            'achievementTracking': one_time[:3],
+            'achievements': {f'{self.random.choice(STATS_GAMES).lower()}_'
+                             f'{self.word()}': self.random.randrange(1000)
+                             for _ in range(achievements)},
+            'petConsumables': {self.word().upper():
+                               self.random.randrange(100)
+                               for _ in range(20)},
+            'newPackageRank': 'VIP_PLUS',
+            'mostRecentGameType': self.random.choice(GAME_TYPES),
+            'stats': stats,
+        }
+        p.update((f'levelingReward_{i}', True) for i in range(level))
+
+        return {'success': True, 'player': p}
+
+    # Resources
+
+    def _resource(self, **kwargs) -> dict:
+        return dict(success=True, lastUpdated=self.timestamp(30), **kwargs)
+
+    def _tiers(self, count: int, points: bool = True) -> list:
+        amount = 0
+        tiers = []
+        for i in range(1, count + 1):
+            amount += self.random.randrange(1, 1000)
+            tiers.append({'tier': i, 'amount': amount})
+            if points:
+                tiers[-1]['points'] = 5 * i
+        return tiers
+
+    def _rewards(self) -> list:
+        return [{'type': i, 'amount': self.random.randrange(1, 5000)}
+                for i in self.random.sample(REWARDS, 2)]
+
+    def achievements_resource(self, games: int = len(STATS_GAMES),
+                              achievements: int = 20) -> dict:
+        r = {}
+        for g in names(STATS_GAMES, games):
+            one_time = {}
+            for _ in range(achievements):
+                a = one_time[self.word().upper()] = {
+                    'points': self.random.choice((5, 10, 15, 20)),
+                    'name': self.sentence(3),
+                    'description': self.sentence(),
+                    'gamePercentUnlocked': self.random.uniform(0, 100),
+                    'globalPercentUnlocked': self.random.uniform(0, 100),
+                }
+                if self.random.random() < 0.1:
+                    a['secret'] = True
+            tiered = {self.word().upper(): {
+                'name': self.sentence(2),
+                'description': self.sentence() + ' %s',
+                'tiers': self._tiers(5),
+            } for _ in range(achievements // 2)}
+            r[g.lower()] = {'one_time': one_time, 'tiered': tiered,
+                            'total_points': 5 * achievements,
+                            'total_legacy_points': 0}
+
+        return self._resource(achievements=r)
+
+    def challenges_resource(self, games: int = len(STATS_GAMES),
+                            challenges: int = 4) -> dict:
+        r = {}
+        for g in names(STATS_GAMES, games):
+            r[g.lower()] = [{
+                'id': f'{g.upper()}__{i}_challenge',
+                'name': f'{i.capitalize()} Challenge',
+                'rewards': self._rewards(),
+            } for i in (self.word() for _ in range(challenges))]
+
+        return self._resource(challenges=r)
+
+    def quests_resource(self, games: int = len(STATS_GAMES),
+                        quests: int = 4) -> dict:
+        r = {}
+        for g in names(STATS_GAMES, games):
+            r[g.lower()] = []
+            for _ in range(quests):
+                id = f'{g.lower()}_{self.word()}'
+                daily = self.random.random() < 0.5
+                r[g.lower()].append({
+                    'id': id,
+                    'name': f"{'Daily' if daily else 'Weekly'} Quest: "
+                            f"{self.sentence(2)}",
+                    'description': self.sentence(),
+                    'rewards': self._rewards(),
+                    'objectives': [{'id': id, 'type': 'IntegerObjective',
+                                    'integer': self.random.randint(1, 20)}],
+                    'requirements': [{'type': 'DailyResetQuestRequirement'
+                                      if daily else
+                                      'WeeklyResetQuestRequirement'}],
+                })
+
+        return self._resource(quests=r)
+
+    def guild_achievements_resource(self, achievements: int = 10) -> dict:
+        return self._resource(one_time={}, tiered={
+            self.word().upper(): {
+                'name': self.sentence(2),
+                'description': self.sentence() + ' %s',
+                'tiers': self._tiers(self.random.randint(3, 7), False),
+            } for _ in range(achievements)
+        })
+
+    def permissions_resource(self, permissions: int = 12) -> dict:
+        return self._resource(permissions=[{'en_us': {
+            'name': self.sentence(3),
+            'description': self.sentence(),
+            'item': {'name': self.word()},
+        }} for _ in range(permissions)])
+
+    def skyblock_collections(self, collections: int = 5, items: int = 10,
+                             tiers: int = 9) -> dict:
+        r = {}
+        for c in names(SKILLS, collections):
+            r[c] = {'name': c.capitalize(), 'items': {}}
+            for _ in range(items):
+                t = self._tiers(tiers, False)
+                for i in t:
+                    i['amountRequired'] = i.pop('amount')
+                    i['unlocks'] = [self.sentence(3)]
+                r[c]['items'][f'{self.word().upper()}_ITEM'] = {
+                    'name': self.name(), 'maxTiers': tiers, 'tiers': t}
+
+        return self._resource(version='0.9.102', collections=r)
+
+    def skyblock_skills(self, skills: int = len(SKILLS),
+                        levels: int = 50) -> dict:
+        r = {}
+        for s in names(SKILLS, skills):
+            exp = 0.0
+            lv = []
+            for i in range(1, levels + 1):
+                exp += self.random.randrange(50, 10 ** 5)
+                lv.append({'level': i, 'totalExpRequired': exp,
+                           'unlocks': [self.sentence(4) for _ in range(4)]})
+            r[s] = {'name': s.capitalize(), 'description': self.sentence(),
+                    'maxLevel': levels, 'levels': lv}
+
+        return self._resource(version='0.9.102', collections=r)
+
+    def endpoint(self, path: str, scale: float = 1) -> dict:
+        """
+        Generate the payload of an endpoint
+        :param path: REST endpoint, ex: '/guild'
+        :param scale: Factor applied to the default collection sizes
+        :return: Json object
+        """
+        method, sizes = ENDPOINTS[path]
+        return getattr(self, method)(**{
+            k: max(1, round(v * scale)) for k, v in sizes.items()
+        })
+
+
+# Generator method and default collection sizes, by endpoint
+ENDPOINTS = {
+    '/status': ('status', {}),
+    '/watchdogstats': ('watchdog', {}),
+    '/key': ('key', {}),
+    '/playerCount': ('player_count', {}),
+    '/findGuild': ('find_guild', {}),
+    '/boosters': ('boosters', {'count': 50}),
+    '/guild': ('guild', {'members': 125}),
+    '/friends': ('friends', {'count': 100}),
+    '/gameCounts': ('game_counts', {'games': len(GAME_TYPES)}),
+    '/recentGames': ('recent_games', {'count': 100}),
+    '/leaderboards': ('leaderboards', {'games': len(GAME_TYPES)}),
+    '/player': ('player', {'games': len(STATS_GAMES),
+                           'achievements': 100}),
+    '/resources/achievements': ('achievements_resource',
+                                {'games': len(STATS_GAMES)}),
+    '/resources/challenges': ('challenges_resource',
+                              {'games': len(STATS_GAMES)}),
+    '/resources/quests': ('quests_resource', {'games': len(STATS_GAMES)}),
+    '/resources/guilds/achievements': ('guild_achievements_resource',
+                                       {'achievements': 10}),
+    '/resources/guilds/permissions': ('permissions_resource',
+                                      {'permissions': 12}),
+    '/resources/skyblock/collections': ('skyblock_collections',
+                                        {'collections': 5}),
+    '/resources/skyblock/skills': ('skyblock_skills',
+                                   {'skills': len(SKILLS)}),
+}
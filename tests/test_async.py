@@ -0,0 +1,115 @@
+from hypyxel import Api, AsyncApi, RetryPolicy
+from unittest import IsolatedAsyncioTestCase
+
+from .utils import StubServer
+
+import asyncio
+
+
+class AsyncEndpoints(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.api = AsyncApi(host='http://localhost:8000', key='test-key-ftw')
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    async def test_api_key(self):
+
+        async with AsyncApi(host='http://localhost:8000',
+                            key='invalid-key') as failure:
+            with self.assertRaises(AsyncApi.ApiException):
+                await failure.boosters
+
+    async def test_same_objects(self):
+
+        sync = Api(host='http://localhost:8000', key='test-key-ftw')
+
+        p = await self.api.get_player('some-random-id')
+        self.assertEqual(type(p), type(sync.get_player('some-random-id')))
+        self.assertEqual(p.raw, sync.get_player('some-random-id').raw)
+
+        s = await self.api.resources.skyblock.skills
+        self.assertEqual(s.version, sync.resources.skyblock.skills.version)
+
+        self.assertEqual(await self.api.player_count, sync.player_count)
+        self.assertEqual(await self.api.find_guild(name='test'),
+                         sync.find_guild(name='test'))
+
+    async def test_concurrent_requests(self):
+
+        r = await asyncio.gather(*(
+            self.api.status('not-supported') for _ in range(20)
+        ))
+
+        self.assertTrue(all(i.online for i in r))
+
+    async def test_players(self):
+
+        p = await self.api.get_players(['a', 'b', 'a'], concurrency=2)
+
+        self.assertEqual(list(p.keys()), ['a', 'b'])
+        self.assertTrue(all(i.display_name == 'xxNoScopexx'
+                            for i in p.values()))
+
+        async with AsyncApi(host='http://localhost:8000',
+                            key='invalid-key') as failure:
+            p = await failure.get_players(['a', 'b'])
+
+        self.assertTrue(all(isinstance(i, AsyncApi.ApiException)
+                            for i in p.values()))
+
+    async def test_connection_pool(self):
+
+        async with AsyncApi(host='http://localhost:8000', key='test-key-ftw',
+                            limit_per_host=2, timeout=(1, 5)) as api:
+            await api.warmup()
+
+            self.assertEqual(api.session.connector.limit_per_host, 2)
+            self.assertEqual(api.session.timeout.sock_read, 5)
+            self.assertTrue((await api.status('not-supported')).online)
+
+    async def test_coalescing(self):
+
+        with StubServer((200, {}, '{"success": true}'), delay=0.2) as s:
+            async with AsyncApi(host=s.host, key='test-key-ftw') as api:
+                r = await asyncio.gather(*(
+                    api.get('/player', {'uuid': i % 2}) for i in range(8)
+                ))
+
+            self.assertEqual(len(s.requests), 2)
+            self.assertIs(r[0], r[2])
+
+            # A cancelled caller does not cancel the shared request
+            async with AsyncApi(host=s.host, key='test-key-ftw') as api:
+                a = asyncio.ensure_future(api.key)
+                b = asyncio.ensure_future(api.key)
+                await asyncio.sleep(0.05)
+                a.cancel()
+
+                self.assertEqual((await b).raw, {'success': True})
+
+    async def test_metrics(self):
+
+        async with AsyncApi(host='http://localhost:8000', key='test-key-ftw',
+                            metrics=True) as api:
+            r = await api.status('not-supported')
+
+            m = api.metrics['/status']
+            self.assertEqual((m.requests, m.statuses), (1, {200: 1}))
+            self.assertEqual(m.parse.count, 0)
+
+            # Fields parse on first access only
+            r.online, r.online
+            self.assertEqual(m.parse.count, 1)
+
+        errors = []
+        with StubServer((503, {}, '{"success": false}'),
+                        (200, {}, '{"success": true}')) as s:
+            async with AsyncApi(host=s.host, key='test-key-ftw',
+                                metrics=True, retry=RetryPolicy(backoff=0),
+                                on_error=lambda *a: errors.append(a)) as api:
+                await api.get('/status')
+
+                self.assertEqual(api.metrics['/status'].errors, 1)
+                self.assertEqual(len(errors), 1)
@@ -0,0 +1,190 @@
+from hypyxel import Api, ResponseCache, SQLiteCache
+from unittest import TestCase
+
+from .utils import StubServer
+
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Process
+from tempfile import TemporaryDirectory
+
+import os
+import time
+
+
+class ResponseCacheTest(TestCase):
+
+    def test_ttl(self):
+        c = ResponseCache(ttl={'/resources/skyblock': 1}, default_ttl=5)
+
+        self.assertEqual(c.ttl('/resources/quests'), 6 * 3600)
+        self.assertEqual(c.ttl('/resources/skyblock/skills'), 1)
+        self.assertEqual(c.ttl('/status'), 10)
+        self.assertEqual(c.ttl('/unknown'), 5)
+
+    def test_key(self):
+        self.assertEqual(ResponseCache.key('/player', {'uuid': 'a',
+                                                       'key': 'secret'}),
+                         '/player?uuid=a')
+        self.assertEqual(ResponseCache.key('/watchdogstats', {'key': 'k'}),
+                         '/watchdogstats')
+
+    def test_expiration(self):
+        c = ResponseCache(ttl={'/status': 0.1, '/key': 0})
+
+        c.set('/status', {'uuid': 'a'}, {'success': True})
+        c.set('/key', {}, {'success': True})
+        self.assertEqual(c.get('/status', {'uuid': 'a'}), {'success': True})
+        self.assertIsNone(c.get('/key', {}))
+
+        time.sleep(0.1)
+        self.assertIsNone(c.get('/status', {'uuid': 'a'}))
+        self.assertEqual((c.hits, c.misses), (1, 2))
+
+    def test_lru(self):
+        c = ResponseCache(maxsize=2)
+
+        for i in 'abc':
+            c.set('/player', {'uuid': i}, i)
+            c.get('/player', {'uuid': 'a'})
+
+        self.assertEqual(len(c), 2)
+        self.assertEqual(c.get('/player', {'uuid': 'a'}), 'a')
+        self.assertIsNone(c.get('/player', {'uuid': 'b'}))
+
+    def test_threads(self):
+        c = ResponseCache()
+        c.set('/player', {'uuid': 'a'}, 'a')
+
+        def get():
+            for i in range(1000):
+                c.get('/player', {'uuid': 'ab'[i % 2]})
+
+        with ThreadPoolExecutor(8) as pool:
+            for _ in range(8):
+                pool.submit(get)
+
+        self.assertEqual((c.hits, c.misses), (4000, 4000))
+
+    def test_api_cache(self):
+        api = Api(host='http://localhost:8000', key='test-key-ftw',
+                  cache=True)
+
+        a = api.resources.achievements
+        b = api.resources.achievements
+
+        self.assertIs(a.raw, b.raw)
+        self.assertEqual((api.cache.hits, api.cache.misses), (1, 1))
+
+    def test_failure_not_cached(self):
+        error = (403, {}, '{"success": false, "cause": "Oops"}')
+        ok = (200, {}, '{"success": true}')
+
+        with StubServer(error, ok) as s:
+            api = Api(host=s.host, key='test-key-ftw', cache=True)
+
+            self.assertFalse(api.get('/status', except_on_failure=False)
+                             ['success'])
+            self.assertTrue(api.get('/status')['success'])
+            self.assertTrue(api.get('/status')['success'])
+            self.assertEqual(len(s.requests), 2)
+
+
+class RevalidationTest(TestCase):
+
+    def test_same_catalog(self):
+        api = Api(host='http://localhost:8000', key='test-key-ftw')
+
+        a = api.resources.skyblock.skills
+        self.assertIs(a, api.resources.skyblock.skills)
+        self.assertIsNot(a, Api(host='http://localhost:8000',
+                                key='test-key-ftw').resources.skyblock.skills)
+
+    def test_updated_catalog(self):
+        old = (200, {}, '{"success": true, "lastUpdated": 1, "quests": {}}')
+        new = (200, {}, '{"success": true, "lastUpdated": 2, "quests": {}}')
+
+        with StubServer(old, old, new) as s:
+            api = Api(host=s.host, key='test-key-ftw')
+            a, b, c = [api.resources.quests for _ in range(3)]
+
+        self.assertIs(a, b)
+        self.assertIsNot(b, c)
+        self.assertEqual(c.raw['lastUpdated'], 2)
+
+    def test_conditional_request(self):
+        ok = (200, {'ETag': '"v1"', 'Last-Modified': 'Sat, 10 Oct 2020'},
+              '{"success": true, "lastUpdated": 1, "quests": {}}')
+        not_modified = (304, {'ETag': '"v1"'}, '')
+
+        with StubServer(ok, not_modified) as s:
+            api = Api(host=s.host, key='test-key-ftw')
+            a, b = api.resources.quests, api.resources.quests
+
+            self.assertIs(a, b)
+            self.assertNotIn('If-None-Match', s.requests[0][1])
+            self.assertEqual(s.requests[1][1].get('If-None-Match'), '"v1"')
+            self.assertEqual(s.requests[1][1].get('If-Modified-Since'),
+                             'Sat, 10 Oct 2020')
+
+
+def _fill_sqlite_cache(path: str) -> None:
+    c = SQLiteCache(path)
+    c.set('/player', {'uuid': 'child'}, None, b'{"from": "child"}')
+
+
+class SQLiteCacheTest(TestCase):
+
+    def setUp(self):
+        self.dir = TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'cache.db')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_persistence(self):
+        c = SQLiteCache(self.path, ttl={'/status': 0.1})
+
+        c.set('/player', {'uuid': 'a', 'key': 'k'}, None, b'{"uuid": "a"}')
+        c.set('/gameCounts', {}, {'playerCount': 1})
+        c.set('/status', {}, {'online': True})
+
+        # Another instance, as after a restart
+        c = SQLiteCache(self.path, ttl={'/status': 0.1})
+        self.assertEqual(c.get('/player', {'uuid': 'a'}), {'uuid': 'a'})
+        self.assertEqual(c.get('/gameCounts', {}), {'playerCount': 1})
+
+        time.sleep(0.1)
+        self.assertIsNone(c.get('/status', {}))
+        self.assertEqual((c.hits, c.misses), (2, 1))
+
+    def test_size_limit(self):
+        c = SQLiteCache(self.path, maxsize=2)
+
+        for i in 'abc':
+            c.set('/player', {'uuid': i}, i)
+            time.sleep(0.01)
+
+        self.assertEqual(len(c), 2)
+        self.assertIsNone(c.get('/player', {'uuid': 'a'}))
+
+        c.clear()
+        self.assertEqual(len(c), 0)
+
+    def test_processes(self):
+        c = SQLiteCache(self.path)
+
+        p = Process(target=_fill_sqlite_cache, args=(self.path,))
+        p.start()
+        p.join()
+
+        self.assertEqual(c.get('/player', {'uuid': 'child'}),
+                         {'from': 'child'})
+
+    def test_api_cache(self):
+        api = Api(host='http://localhost:8000', key='test-key-ftw',
+                  cache=SQLiteCache(self.path))
+        api.watchdog
+
+        api = Api(host='http://invalid', key='test-key-ftw',
+                  cache=SQLiteCache(self.path))
+        self.assertEqual(api.watchdog.total, 5643086)
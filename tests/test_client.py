@@ -0,0 +1,447 @@
+from hypyxel import Api, KeyPool, Metrics, RateLimiter, RetryPolicy
+from hypyxel.metrics import Histogram
+from hypyxel.utils import json_decoder
+from unittest import TestCase
+
+from .utils import StubServer
+
+from concurrent.futures import ThreadPoolExecutor
+
+import json
+import os
+import re
+import requests
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class DecoderTest(TestCase):
+
+    def test_json_decoder(self):
+        self.assertIs(json_decoder('json'), json.loads)
+        self.assertEqual(json_decoder()(b'{"a": [1]}'), {'a': [1]})
+
+        with self.assertRaises(ValueError):
+            json_decoder('pickle')
+
+    def test_single_parse(self):
+        calls = []
+
+        def loads(b):
+            calls.append(type(b))
+            return json.loads(b)
+
+        api = Api(host='http://localhost:8000', key='test-key-ftw',
+                  decoder=loads)
+        self.assertEqual(api.key.limit, 120)
+
+        with self.assertRaises(Api.ApiException):
+            Api(host='http://localhost:8000', key='invalid-key',
+                decoder=loads).key
+
+        self.assertEqual(calls, [bytes, bytes])
+
+    def test_decoders(self):
+        for i in ('json', None):
+            api = Api(host='http://localhost:8000', key='test-key-ftw',
+                      decoder=i)
+            self.assertEqual(api.resources.skyblock.skills.version,
+                             '0.9.102')
+
+    def test_invalid_body(self):
+        with StubServer((502, {}, '<html>Bad Gateway</html>')) as s:
+            with self.assertRaises(Api.ApiException):
+                Api(host=s.host, key='test-key-ftw',
+                    retry=RetryPolicy(attempts=1)).get('/status')
+
+
+class ConnectionPoolTest(TestCase):
+
+    def test_pool(self):
+        api = Api(host='http://localhost:8000', key='test-key-ftw',
+                  pool_maxsize=4, pool_block=True)
+        api.warmup()
+
+        pools = api._session.get_adapter(api._host).poolmanager.pools
+        pool, = pools._container.values()
+
+        self.assertEqual(pool.pool.maxsize, 4)
+        self.assertGreaterEqual(pool.num_connections, 1)
+
+        api.status('not-supported')
+        self.assertLessEqual(pool.num_connections, 4)
+
+    def test_keep_alive(self):
+        with StubServer((200, {}, '{"success": true}')) as s:
+            Api(host=s.host, key='test-key-ftw', keep_alive=False).key
+
+            self.assertEqual(s.requests[0][1].get('Connection'), 'close')
+
+    def test_timeout(self):
+        with socket.socket() as mute:
+            mute.bind(('localhost', 0))
+            mute.listen()
+
+            api = Api(host=f'http://localhost:{mute.getsockname()[1]}',
+                      key='test-key-ftw', timeout=(1, 0.1),
+                      retry=RetryPolicy(attempts=1))
+
+            with self.assertRaises(requests.exceptions.Timeout):
+                api.key
+
+
+class RetryTest(TestCase):
+
+    OK = (200, {}, '{"success": true}')
+    UNAVAILABLE = (503, {}, '{"success": false, "cause": "Maintenance"}')
+
+    def test_delay(self):
+        r = RetryPolicy(backoff=1, max_backoff=5)
+
+        for i in range(100):
+            self.assertLessEqual(r.delay(0), 1)
+            self.assertLessEqual(r.delay(10), 5)
+
+        self.assertEqual(r.delay(3, '2'), 2.0)
+        self.assertLessEqual(r.delay(0, 'Wed, 21 Oct 2015'), 1)
+
+    def test_endpoints(self):
+        skills = RetryPolicy(attempts=10)
+        r = RetryPolicy(endpoints={'/resources/': RetryPolicy(attempts=1),
+                                   '/resources/skyblock': skills})
+
+        self.assertIs(r.for_path('/resources/skyblock/skills'), skills)
+        self.assertEqual(r.for_path('/resources/quests').attempts, 1)
+        self.assertIs(r.for_path('/player'), r)
+
+        with self.assertRaises(ValueError):
+            RetryPolicy(attempts=0)
+
+    def test_server_error(self):
+        with StubServer(self.UNAVAILABLE, self.UNAVAILABLE, self.OK) as s:
+            api = Api(host=s.host, key='test-key-ftw',
+                      retry=RetryPolicy(backoff=0.01))
+
+            self.assertTrue(api.get('/status')['success'])
+            self.assertEqual(len(s.requests), 3)
+
+    def test_give_up(self):
+        with StubServer(self.UNAVAILABLE) as s:
+            api = Api(host=s.host, key='test-key-ftw',
+                      retry=RetryPolicy(attempts=2, backoff=0.01))
+
+            with self.assertRaises(Api.ApiException):
+                api.get('/status')
+            self.assertEqual(len(s.requests), 2)
+
+            # Not retried
+            s.responses = [(404, {}, '{"success": false}')]
+            with self.assertRaises(Api.ApiException):
+                api.get('/status')
+            self.assertEqual(len(s.requests), 3)
+
+    def test_budget(self):
+        unavailable = (503, {'Retry-After': '0.3'}, '{"success": false}')
+
+        with StubServer(unavailable) as s:
+            api = Api(host=s.host, key='test-key-ftw',
+                      retry=RetryPolicy(attempts=10, budget=1))
+            start = time.monotonic()
+
+            with self.assertRaises(Api.ApiException):
+                api.get('/status')
+
+            self.assertLess(time.monotonic() - start, 1)
+            self.assertEqual(len(s.requests), 4)
+
+    def test_connection_error(self):
+        with socket.socket() as closed:
+            closed.bind(('localhost', 0))
+            port = closed.getsockname()[1]
+
+        api = Api(host=f'http://localhost:{port}', key='test-key-ftw',
+                  retry=RetryPolicy(attempts=3, backoff=0.01))
+
+        with self.assertRaises(requests.ConnectionError):
+            api.key
+
+    def test_rate_limited(self):
+        limiter = RateLimiter(60, burst=10)
+
+        with StubServer(self.UNAVAILABLE, self.UNAVAILABLE, self.OK) as s:
+            Api(host=s.host, key='test-key-ftw', rate_limit=limiter,
+                retry=RetryPolicy(backoff=0.01)).get('/status')
+
+        self.assertLess(limiter.available, 8)
+
+
+class CoalescingTest(TestCase):
+
+    def test_same_request(self):
+        with StubServer((200, {}, '{"success": true}'), delay=0.2) as s:
+            api = Api(host=s.host, key='test-key-ftw')
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                r = list(pool.map(
+                    lambda i: api.get('/player', {'uuid': i % 2}), range(8)
+                ))
+
+            self.assertEqual(len(s.requests), 2)
+            self.assertIs(r[0], r[2])
+            self.assertIsNot(r[0], r[1])
+
+    def test_shared_failure(self):
+        error = (403, {}, '{"success": false, "cause": "Invalid API key"}')
+
+        with StubServer(error, delay=0.2) as s:
+            api = Api(host=s.host, key='test-key-ftw')
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                r = [pool.submit(api.get, '/key') for _ in range(4)]
+
+            for i in r:
+                self.assertIsInstance(i.exception(), Api.ApiException)
+            self.assertEqual(len(s.requests), 1)
+
+    def test_disabled(self):
+        with StubServer((200, {}, '{"success": true}'), delay=0.2) as s:
+            api = Api(host=s.host, key='test-key-ftw', coalesce=False)
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(lambda _: api.key, range(4)))
+
+            self.assertEqual(len(s.requests), 4)
+
+
+class KeyPoolTest(TestCase):
+
+    OK = (200, {}, '{"success": true}')
+
+    @staticmethod
+    def keys(server):
+        return [m.group(1) for m in (re.search('key=([^&]+)', i[0])
+                                     for i in server.requests) if m]
+
+    def test_round_robin(self):
+        with StubServer(self.OK) as s:
+            api = Api(host=s.host, key=KeyPool(['a', 'b', 'c'],
+                                               strategy='round_robin'),
+                      coalesce=False)
+            for _ in range(6):
+                api.get('/key')
+
+            self.assertEqual(self.keys(s), ['a', 'b', 'c'] * 2)
+            self.assertEqual(api.key_stats['b'].total_queries, 2)
+
+    def test_least_used(self):
+        pool = KeyPool(['a', 'b'], rate_limit=60)
+        pool.limiter('a').reserve()
+
+        with StubServer(self.OK) as s:
+            api = Api(host=s.host, key=pool)
+            api.get('/key')
+            api.get('/status', public=True)
+
+            self.assertEqual(self.keys(s), ['b'])
+            self.assertEqual(api.key_stats['b'].queries, 1)
+            self.assertEqual(api.key_stats['a'].queries, 0)
+
+    def test_quota_headers(self):
+        quota = {'RateLimit-Limit': '120', 'RateLimit-Remaining': '7',
+                 'RateLimit-Reset': '30'}
+
+        with StubServer((200, quota, '{"success": true}')) as s:
+            api = Api(host=s.host, key=['a', 'b'])
+            api.get('/key')
+
+            key, = self.keys(s)
+            self.assertEqual(api.key_stats[key].remaining, 7)
+            self.assertEqual(api.key_pool.limiter(key).limit, 120)
+            self.assertIsNone(api.rate_limiter)
+
+    def test_invalid_key(self):
+        invalid = (403, {}, '{"success": false, "cause": "Invalid API key"}')
+
+        with StubServer(invalid, self.OK) as s:
+            api = Api(host=s.host, key=('a', 'b'),
+                      retry=RetryPolicy(attempts=1))
+
+            self.assertTrue(api.get('/key')['success'])
+            first, second = self.keys(s)
+            self.assertNotEqual(first, second)
+            self.assertFalse(api.key_stats[first].active)
+            self.assertEqual(api.key_stats[first].errors, 1)
+            self.assertEqual(api.key_pool.active, 1)
+
+            s.responses = [invalid]
+            with self.assertRaises(Api.ApiException):
+                api.get('/player', {'uuid': 'x'})
+            with self.assertRaises(Api.ApiException):
+                api.get('/player', {'uuid': 'y'})
+            self.assertEqual(len(s.requests), 3)
+
+    def test_single_key(self):
+        with StubServer(self.OK) as s:
+            api = Api(host=s.host, key='test-key-ftw')
+            api.get('/key')
+
+            self.assertEqual(self.keys(s), ['test-key-ftw'])
+            self.assertEqual(api.key_stats, {})
+
+        with self.assertRaises(ValueError):
+            KeyPool([])
+        with self.assertRaises(ValueError):
+            KeyPool(['a'], strategy='random')
+
+
+class RetentionTest(TestCase):
+
+    def test_keep(self):
+        api = Api(host='http://localhost:8000', key='test-key-ftw')
+        p = api.get_player('some-random-id')
+
+        self.assertIs(p.raw, p.raw)
+        self.assertNotIn('stats', vars(p))
+
+    def test_compress(self):
+        api = Api(host='http://localhost:8000', key='test-key-ftw',
+                  retention='compress')
+        p = api.get_player('some-random-id')
+
+        self.assertIn('stats', vars(p))
+        self.assertIsNone(p._raw)
+        self.assertEqual(p.raw['player']['displayname'], 'xxNoScopexx')
+        self.assertEqual(p.display_name, 'xxNoScopexx')
+
+    def test_drop(self):
+        api = Api(host='http://localhost:8000', key='test-key-ftw',
+                  retention='drop')
+        p = api.get_player('some-random-id')
+
+        with self.assertRaises(ValueError):
+            p.raw
+
+        self.assertEqual(p.network_level, 31)
+        self.assertFalse(p.is_online)
+        self.assertTrue(all(getattr(i, '_data', None) is None
+                            for i in p.stats.values()))
+
+        g = api.guild(name='unsupported-by-test-server')
+        self.assertEqual(g.name, 'Mini Squid')
+        self.assertEqual(g.created.year, 2015)
+
+        self.assertEqual(api.resources.skyblock.skills.version, '0.9.102')
+        self.assertIs(api.resources.skyblock.skills,
+                      api.resources.skyblock.skills)
+
+        with self.assertRaises(ValueError):
+            Api(host='http://localhost:8000', key='test-key-ftw',
+                retention='forget')
+
+
+class LazyImportTest(TestCase):
+
+    def test_import(self):
+        code = "import hypyxel, sys; print(sorted(sys.modules))"
+        out = subprocess.run([sys.executable, '-c', code], check=True,
+                             stdout=subprocess.PIPE, cwd=ROOT).stdout
+
+        for i in ('requests', 'asyncio', 'hypyxel.response'):
+            self.assertNotIn(repr(i), out.decode())
+
+        import hypyxel
+        self.assertIs(hypyxel.Api, Api)
+        self.assertIn('KeyPool', dir(hypyxel))
+        with self.assertRaises(AttributeError):
+            hypyxel.NotAClass
+
+    def test_import_submodules(self):
+        code = "import hypyxel; print(hypyxel.response.PlayerResponse, " \
+            "hypyxel.utils.request_key, hypyxel.api.Api)"
+        out = subprocess.run([sys.executable, '-c', code], check=True,
+                             stdout=subprocess.PIPE, cwd=ROOT).stdout
+
+        self.assertIn(b'PlayerResponse', out)
+
+
+class MetricsTest(TestCase):
+
+    OK = (200, {}, '{"success": true, "record": {"key": "k"}}')
+    UNAVAILABLE = (503, {}, '{"success": false, "cause": "Maintenance"}')
+    NOT_FOUND = (404, {}, '{"success": false, "cause": "Not found"}')
+
+    def test_metrics(self):
+        events = []
+
+        with StubServer(self.UNAVAILABLE, self.OK, self.NOT_FOUND) as s:
+            api = Api(host=s.host, key='test-key-ftw', metrics=True,
+                      retry=RetryPolicy(backoff=0),
+                      on_request=lambda *a: events.append(('request',) + a),
+                      on_response=lambda p, s, *a: events.append(
+                          ('response', p, s)),
+                      on_error=lambda *a: events.append(('error',) + a))
+
+            self.assertEqual(api.key.key, 'k')
+            with self.assertRaises(Api.ApiException):
+                api.get('/status')
+
+        self.assertEqual(events[:2] + events[3:5], [
+            ('request', '/key', {}, 0), ('response', '/key', 503),
+            ('request', '/key', {}, 1), ('response', '/key', 200),
+        ])
+
+        # Retried failed responses are errors too
+        self.assertEqual(events[2][:2], ('error', '/key'))
+        self.assertIsInstance(events[2][2], Api.ApiException)
+        self.assertEqual(events[-1][:2], ('error', '/status'))
+        self.assertIsInstance(events[-1][2], Api.ApiException)
+
+        m = api.metrics['/key']
+        self.assertEqual(m.requests, 2)
+        self.assertEqual(m.statuses, {503: 1, 200: 1})
+        self.assertEqual(m.bytes_received,
+                         len(self.OK[2]) + len(self.UNAVAILABLE[2]))
+        self.assertEqual(m.errors, 1)
+        self.assertEqual((m.network.count, m.decode.count, m.parse.count),
+                         (2, 1, 1))
+        self.assertEqual(api.metrics['/status'].errors, 1)
+        self.assertIn('/key', json.loads(json.dumps(api.metrics.as_dict())))
+
+        api.metrics.reset()
+        self.assertNotIn('/key', api.metrics)
+
+    def test_connection_error(self):
+        errors = []
+
+        with socket.socket() as s:
+            s.bind(('localhost', 0))
+            port = s.getsockname()[1]
+
+        metrics = Metrics()
+        api = Api(host=f'http://localhost:{port}', key='test-key-ftw',
+                  metrics=metrics, retry=RetryPolicy(attempts=2, backoff=0),
+                  on_error=lambda *a: errors.append(a))
+
+        with self.assertRaises(requests.ConnectionError):
+            api.key
+
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(metrics['/key'].errors, 2)
+        self.assertEqual(metrics['/key'].statuses, {})
+
+    def test_histogram(self):
+        h = Histogram((0.1, 1))
+        for i in (0.05, 0.1, 0.5, 2):
+            h._record(i)
+
+        self.assertEqual(h.counts, (2, 1, 1))
+        self.assertEqual(h.count, 4)
+        self.assertAlmostEqual(h.mean, 2.65 / 4)
+        self.assertEqual(h.quantile(0.5), 0.1)
+        self.assertEqual(h.quantile(0.75), 1)
+        self.assertEqual(h.quantile(1), float('inf'))
+        self.assertIsNone(Histogram().quantile(0.5))
@@ -0,0 +1,128 @@
+from hypyxel.fields import Field, JsonObject, Timestamp, compile_getter
+from hypyxel.response_objects import GuildMember, RecentGame
+from hypyxel.response import APIResponse, GameCountsResponse
+from hypyxel.utils import timestamps_to_datetime64
+from importlib.util import find_spec
+from unittest import TestCase, skipUnless
+
+from datetime import datetime
+
+import json
+
+
+class Member(JsonObject):
+
+    id = Field('uuid', doc="Get member UUID")
+    rank = Field(('rank', 'name'), 'Member')
+    joined = Timestamp('joined')
+    games = Field('games', (), tuple)
+
+
+class Officer(Member):
+    __slots__ = ('_guild',)
+
+    power = Field('power', 0, int)
+
+    def __init__(self, guild: str, data: dict) -> None:
+        self._guild = guild
+        self._parse_fields(data)
+
+
+class MemberResponse(APIResponse):
+
+    _SOURCE = 'member'
+
+    id = Field('uuid')
+    joined = Timestamp('joined')
+
+
+class FieldTest(TestCase):
+
+    def test_object(self):
+        m = Member({'uuid': 'abc', 'rank': {'name': 'Officer'},
+                    'joined': 1000, 'games': ['UHC']})
+
+        self.assertEqual(m.id, 'abc')
+        self.assertEqual(m.rank, 'Officer')
+        self.assertEqual(m.joined, datetime.fromtimestamp(1))
+        self.assertEqual(m.games, ('UHC',))
+        self.assertEqual(Member.id.__doc__, "Get member UUID")
+        self.assertFalse(hasattr(m, '__dict__'))
+
+        m = Member({})
+        self.assertEqual((m.id, m.rank, m.joined, m.games),
+                         (None, 'Member', None, ()))
+
+    def test_inheritance(self):
+        o = Officer('guild', {'uuid': 'abc', 'power': '3'})
+
+        self.assertEqual((o.id, o.power, o._guild), ('abc', 3, 'guild'))
+        self.assertEqual(list(Officer._FIELDS),
+                         ['id', 'rank', 'joined', 'games', 'power'])
+
+    def test_response(self):
+        r = MemberResponse({'member': {'uuid': 'abc', 'joined': 1000}})
+
+        self.assertEqual(r.id, 'abc')
+        self.assertEqual(r.joined, datetime.fromtimestamp(1))
+        self.assertIsNone(MemberResponse({}).id)
+
+        r = MemberResponse({'member': {'uuid': 'abc'}}, fields=['joined'])
+        self.assertIsNone(r.joined)
+        with self.assertRaises(AttributeError):
+            r.id
+
+        r = MemberResponse({'member': {'joined': 1000}}, fields=['id'])
+        with self.assertRaises(AttributeError):
+            r.joined
+        r._parse_all()
+
+    def test_getter(self):
+        get = compile_getter('name', Field(('a', 'b'), 0), 'root')
+
+        class Raw:
+            _raw = {'root': {'a': {'b': 1}}}
+
+        self.assertEqual(get.__name__, 'name')
+        self.assertEqual(get(Raw()), 1)
+
+    def test_interned(self):
+        games = [RecentGame(json.loads('{"gameType": "SKYWARS", "map": 1}'))
+                 for _ in range(2)]
+        members = [GuildMember(json.loads('{"rank": "Member"}'))
+                   for _ in range(2)]
+
+        self.assertIs(games[0].game, games[1].game)
+        self.assertIs(members[0].rank, members[1].rank)
+        self.assertEqual(games[0].map, 1)
+        self.assertIsNone(games[0].mode)
+
+    def test_shared_defaults(self):
+        m = GuildMember({})
+        m.exp_history['2020-01-01'] = 5
+
+        self.assertEqual(type(GuildMember({}).exp_history), dict)
+        self.assertEqual(GuildMember({}).exp_history, {})
+        self.assertEqual(json.dumps(GuildMember({}).exp_history), '{}')
+        self.assertEqual(GameCountsResponse({}).games, {})
+
+    def test_timestamp_memo(self):
+        m = Member({'joined': 1000})
+        r = MemberResponse({'member': {'joined': 1000}})
+
+        self.assertIs(m.joined, m.joined)
+        self.assertIs(r.joined, r.joined)
+        self.assertIsNone(Member({}).joined)
+
+    @skipUnless(find_spec('numpy'), 'numpy is not installed')
+    def test_datetime64(self):
+        import numpy as np
+
+        members = [Member({'joined': 1000}), Member({}),
+                   GuildMember({'joined': 1599641684473})]
+        a = timestamps_to_datetime64(members, 'joined')
+
+        self.assertEqual(a.dtype, np.dtype('datetime64[ms]'))
+        self.assertEqual(a[0], np.datetime64(1000, 'ms'))
+        self.assertTrue(np.isnat(a[1]))
+        self.assertEqual(a[2], np.datetime64('2020-09-09T08:54:44.473'))
@@ -97,6 +97,8 @@ class GeneralEndpoints(HypyxelTestCase):
                 "started": datetime.fromtimestamp(1599641684473/1000)
         })
 
+        self.assertFalse(hasattr(f.friends[0], '__dict__'))
+
     def test_game_count(self):
 
         g = self.api.game_counts
@@ -308,6 +310,67 @@ class GeneralEndpoints(HypyxelTestCase):
         self.assertTrue(p.is_achievement_unlocked(ot[0]))
         self.assertFalse(p.is_achievement_unlocked(ot[1]))
 
+    def test_lazy_parsing(self):
+
+        p = self.api.get_player('some-random-id')
+        self.assertNotIn('stats', vars(p))
+
+        self.assertIs(p.stats, p.stats)
+        self.assertIn('stats', vars(p))
+        self.assertNotIn('network_level', vars(p))
+
+    def test_fields(self):
+
+        p = self.api.get_player(
+            'some-random-id', fields=['uuid', 'last_login', 'stats.SkyBlock']
+        )
+
+        self.assertEqual(p.uuid, 'some-random-uuid')
+        self.assertEqual(p.last_login,
+                         datetime.fromtimestamp(1605081279473/1000))
+        self.assertEqual(list(p.stats.keys()), ['SkyBlock'])
+
+        with self.assertRaises(AttributeError):
+            p.network_exp
+        with self.assertRaises(AttributeError):
+            p.last_logout
+
+        with self.assertRaises(ValueError):
+            self.api.get_player('some-random-id', fields=['uuid.x'])
+        with self.assertRaises(ValueError):
+            self.api.get_player('some-random-id', fields=['_raw'])
+        with self.assertRaises(ValueError):
+            self.api.get_player('some-random-id', fields=['is_online'])
+
+        p = self.api.get_player('some-random-id',
+                                fields=['last_login', 'last_logout'])
+        self.assertFalse(p.is_online)
+
+        g = self.api.guild(name='unsupported-by-test-server',
+                           fields=['name'])
+        self.assertEqual(g.name, 'Mini Squid')
+        with self.assertRaises(AttributeError):
+            g.members
+        with self.assertRaises(AttributeError):
+            g.created
+
+        f = self.api.friends('uuid', fields=['friends'])
+        self.assertEqual(len(f.friends), len(self.api.friends('uuid').friends))
+
+    def test_players(self):
+
+        p = self.api.get_players(['a', 'b', 'a'], concurrency=2)
+
+        self.assertEqual(list(p.keys()), ['a', 'b'])
+        self.assertTrue(all(i.display_name == 'xxNoScopexx'
+                            for i in p.values()))
+
+        failure = Api(host='http://localhost:8000', key='invalid-key')
+        p = failure.get_players(['a', 'b'])
+
+        self.assertTrue(all(isinstance(i, Api.ApiException)
+                            for i in p.values()))
+
     def test_player_count(self):
 
         self.assertTrue(self.api.player_count == 49567,
@@ -0,0 +1,75 @@
+from hypyxel import Api, RetryPolicy
+from unittest import TestCase
+
+from .mock_server import Latency, MockServer
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import time
+
+
+class MockServerTest(TestCase):
+
+    def test_quota(self):
+        with MockServer(keys={'key': 2}) as s:
+            r = [requests.get(f'{s.host}/key', params={'key': 'key'})
+                 for _ in range(3)]
+
+            self.assertEqual([i.status_code for i in r], [200, 200, 429])
+            self.assertEqual(r[0].headers['RateLimit-Limit'], '2')
+            self.assertEqual(r[1].headers['RateLimit-Remaining'], '0')
+            self.assertIn('Retry-After', r[2].headers)
+
+            invalid = requests.get(f'{s.host}/key', params={'key': 'x'})
+            self.assertEqual(invalid.status_code, 403)
+
+            public = requests.get(f'{s.host}/resources/quests')
+            self.assertEqual(public.status_code, 200)
+
+        self.assertEqual(s.stats['/key'], {200: 2, 429: 1, 403: 1})
+
+    def test_errors(self):
+        errors = {'/player': {503: 1.0}, '*': {500: 0.5}}
+        no_retry = RetryPolicy(attempts=1)
+
+        with MockServer(errors=errors, seed=1) as s:
+            api = Api(host=s.host, key='key', retry=no_retry)
+
+            with self.assertRaises(Api.ApiException):
+                api.get_player('uuid')
+
+            for _ in range(40):
+                api.get('/boosters', except_on_failure=False)
+
+            api = Api(host=s.host, key='key',
+                      retry=RetryPolicy(attempts=20, backoff=0))
+            self.assertTrue(api.boosters.success)
+
+        self.assertEqual(s.stats['/player'], {503: 1})
+        self.assertTrue(10 < s.stats['/boosters'][500] < 40)
+
+    def test_latency(self):
+        latency = {'/key': Latency('constant', 0.2), '*': None}
+
+        with MockServer(latency=latency) as s:
+            start = time.monotonic()
+            with ThreadPoolExecutor(50) as pool:
+                r = list(pool.map(
+                    lambda _: requests.get(f'{s.host}/key').status_code,
+                    range(50)
+                ))
+            elapsed = time.monotonic() - start
+
+            self.assertEqual(r, [200] * 50)
+            self.assertTrue(0.2 <= elapsed < 2, elapsed)
+
+            start = time.monotonic()
+            requests.get(f'{s.host}/status')
+            self.assertLess(time.monotonic() - start, 0.2)
+
+        with self.assertRaises(ValueError):
+            Latency('gamma', 1)
+        with self.assertRaises(TypeError):
+            Latency.parse('uniform:0.1')
+        self.assertEqual(Latency.parse('constant:0.5').sample(None), 0.5)
@@ -0,0 +1,57 @@
+from hypyxel import Api
+from hypyxel.response import GuildResponse, PlayerResponse
+from unittest import TestCase
+
+from .payloads import ENDPOINTS, Payloads
+from .utils import StubServer
+
+import json
+
+
+class PayloadsTest(TestCase):
+
+    def test_seed(self):
+        self.assertEqual(Payloads(1).endpoint('/guild'),
+                         Payloads(1).endpoint('/guild'))
+        self.assertNotEqual(Payloads(1).endpoint('/guild'),
+                            Payloads(2).endpoint('/guild'))
+
+    def test_sizes(self):
+        p = Payloads()
+
+        g = GuildResponse(p.guild(members=125, days=30))
+        self.assertEqual(len(g.members), 125)
+        self.assertEqual(len(g.members[0].exp_history), 30)
+        self.assertEqual(g.members[0].rank, 'GUILDMASTER')
+
+        r = PlayerResponse(p.endpoint('/player', scale=2))
+        self.assertEqual(len(r.stats), 48)
+        self.assertEqual(len(r.achievements_one_time), 200)
+
+    def test_endpoints(self):
+        p = Payloads()
+        bodies = [json.dumps(p.endpoint(i)) for i in ENDPOINTS]
+
+        responses = [(200, {}, i) for i in bodies]
+        with StubServer(*responses) as s:
+            api = Api(host=s.host, key='test-key-ftw')
+
+            parsed = [
+                api.status('uuid'), api.watchdog, api.key,
+                api.player_count, api.find_guild(name='guild'),
+                api.boosters, api.guild(name='guild'), api.friends('uuid'),
+                api.game_counts, api.recent_games('uuid'),
+                api.leaderboards, api.get_player('uuid'),
+                api.resources.achievements, api.resources.challenges,
+                api.resources.quests, api.resources.guilds.achievements,
+                api.resources.guilds.permissions,
+                api.resources.skyblock.collections,
+                api.resources.skyblock.skills,
+            ]
+
+        self.assertEqual([i[0].split('?')[0] for i in s.requests],
+                         list(ENDPOINTS))
+
+        for i in parsed:
+            if hasattr(i, '_retain'):
+                i._retain('drop')
@@ -0,0 +1,203 @@
+from hypyxel import Api, AsyncApi, RateLimiter, RetryPolicy
+from hypyxel.response import KeyResponse
+from unittest import TestCase
+
+from .mock_server import MockServer
+from .utils import StubServer
+
+import asyncio
+import requests
+import threading
+import time
+
+
+class RateLimiterTest(TestCase):
+
+    def test_burst_then_wait(self):
+        r = RateLimiter(61, period=60, burst=1)
+
+        self.assertEqual(r.reserve(), 0.0)
+        # Bucket refill one token per second
+        self.assertAlmostEqual(r.reserve(), 1.0, places=1)
+        self.assertAlmostEqual(r.reserve(), 2.0, places=1)
+
+    def test_never_exceed_limit(self):
+        r = RateLimiter(10, period=1, burst=5)
+        start = time.monotonic()
+
+        threads = [threading.Thread(target=r.acquire) for _ in range(10)]
+        for i in threads:
+            i.start()
+        for i in threads:
+            i.join()
+
+        # 5 tokens at start, 5 others refilled at 5 tokens / second
+        self.assertGreaterEqual(time.monotonic() - start, 0.9)
+
+    def test_window(self):
+        r = RateLimiter(120)
+        r.update(1, 30)
+
+        # One request left, the others wait for the window reset
+        delays = [r.reserve() for _ in range(5)]
+        self.assertEqual(delays[0], 0.0)
+        self.assertAlmostEqual(delays[1], 30.0, places=1)
+        self.assertAlmostEqual(delays[4] - delays[1], 1.5, places=1)
+
+        r = RateLimiter(120)
+        r.update(120, 60)
+        self.assertEqual(r.reserve(), 0.0)
+        self.assertAlmostEqual(r.reserve(), 0.5, places=1)
+
+    def test_window_reset(self):
+        r = RateLimiter(10, period=0.5)
+        start = time.monotonic()
+        r.update(1, 0.5)
+
+        delays = [r.reserve() + time.monotonic() - start for _ in range(25)]
+
+        # Never more than the quota in a server window
+        for start in (0.0, 0.5, 1.0, 1.5):
+            self.assertLessEqual(
+                len([i for i in delays if start <= i < start + 0.5]),
+                10 if start else 1
+            )
+
+        # The rate is back to 9 tokens by period after the reset
+        self.assertLess(delays[-1], 2.0)
+        self.assertAlmostEqual(delays[-1] - delays[-2], 0.5 / 9, places=2)
+
+    def test_from_key(self):
+        k = KeyResponse({'success': True, 'record': {'limit': 120}})
+        r = RateLimiter.from_key(k)
+
+        self.assertEqual((r.limit, r.period), (120, 60))
+
+        with self.assertRaises(ValueError):
+            RateLimiter.from_key(KeyResponse({'success': False}))
+
+    def test_api_limiter(self):
+        shared = RateLimiter(120)
+
+        a = Api(host='http://localhost:8000', key='test-key-ftw',
+                rate_limit=shared)
+        b = Api(host='http://localhost:8000', key='test-key-ftw',
+                rate_limit=60)
+
+        self.assertIs(a.rate_limiter, shared)
+        self.assertEqual(b.rate_limiter.limit, 60)
+
+        a.status('not-supported')
+        self.assertLess(shared.available, 1)
+
+        with self.assertRaises(ValueError):
+            Api(key='test-key-ftw', rate_limit='fast')
+
+
+class AdaptiveThrottlingTest(TestCase):
+
+    OK = (200, {'RateLimit-Limit': '120', 'RateLimit-Remaining': '60',
+                'RateLimit-Reset': '30'}, '{"success": true}')
+
+    THROTTLED = (429, {'RateLimit-Limit': '120', 'RateLimit-Remaining': '0',
+                       'RateLimit-Reset': '0.2'},
+                 '{"success": false, "cause": "Key throttle"}')
+
+    def test_headers(self):
+        late = (200, {'RateLimit-Limit': '120', 'RateLimit-Remaining': '100',
+                      'RateLimit-Reset': '5'}, '{"success": true}')
+
+        with StubServer(late) as s:
+            api = Api(host=s.host, key='test-key-ftw')
+            api.get('/status')
+
+        # Limiter created from the headers: the reset is only the end of
+        # the window, the period starts at 60s
+        r = api.rate_limiter
+        self.assertEqual((r.limit, r.period, r.remaining), (120, 60, 100))
+        self.assertLessEqual(r.reset, 5)
+
+        delays = [r.reserve() for _ in range(600)]
+        self.assertEqual(delays[0], 0.0)
+        self.assertLessEqual(len([i for i in delays if i < 60]), 220)
+
+    def test_public_and_disabled(self):
+
+        with StubServer(self.OK) as s:
+            Api(host=s.host, key='test-key-ftw').get('/resources/quests',
+                                                     public=True)
+            api = Api(host=s.host, key='test-key-ftw', adaptive=False)
+            api.get('/status')
+
+        self.assertIsNone(api.rate_limiter)
+
+    def test_throttled(self):
+
+        with StubServer(self.THROTTLED, self.OK) as s:
+            start = time.monotonic()
+            r = Api(host=s.host, key='test-key-ftw').get('/status')
+
+            self.assertTrue(r['success'])
+            self.assertEqual(len(s.requests), 2)
+            self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_throttled_retry_after(self):
+
+        throttled = (429, {'Retry-After': '0'}, '{"success": false}')
+
+        with StubServer(throttled, self.OK) as s:
+            r = Api(host=s.host, key='test-key-ftw', adaptive=False)
+
+            self.assertTrue(r.get('/status')['success'])
+
+    def test_still_throttled(self):
+
+        with StubServer((429, {'Retry-After': '0'},
+                         '{"success": false, "cause": "Key throttle"}')) as s:
+            with self.assertRaises(Api.ApiException):
+                Api(host=s.host, key='test-key-ftw',
+                    retry=RetryPolicy(attempts=3)).get('/status')
+
+            self.assertEqual(len(s.requests), 3)
+
+    def test_quota_windows(self):
+
+        async def status(host: str) -> list:
+            async with AsyncApi(host=host, key='key') as api:
+                r = await asyncio.gather(
+                    *(api.status(f'uuid-{i}') for i in range(30))
+                )
+                return r, api.rate_limiter.period
+
+        with MockServer(keys={'key': 10}, window=2) as s:
+            # First requests sent late in the window
+            requests.get(f'{s.host}/status', params={'key': 'key'})
+            time.sleep(1.5)
+
+            start = time.monotonic()
+            r, period = asyncio.run(status(s.host))
+
+            self.assertTrue(all(i.success for i in r))
+            self.assertLess(time.monotonic() - start, 10)
+
+        # Period learned from the window resets (rounded up)
+        self.assertTrue(2 <= period < 3)
+
+        # Only the first burst, sent before any quota header, is throttled
+        self.assertEqual(s.stats['/status'], {200: 31, 429: 21})
+
+    def test_learn(self):
+        r = RateLimiter(10, period=60, learn=True)
+
+        r.update(5, 1)
+        self.assertEqual(r.period, 60)
+
+        # Window reset 1s ago, ending in 10s: at most 11s (rounding)
+        r._reported -= 1
+        r._reset_at -= 1
+        r.update(9, 10)
+        self.assertAlmostEqual(r.period, 11, places=1)
+
+        # Longer reset reported
+        r.update(8, 30)
+        self.assertEqual(r.period, 30)
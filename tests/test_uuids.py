@@ -0,0 +1,112 @@
+from hypyxel import Api, AsyncApi, CompactUUID, compact_uuids
+from hypyxel.response import FriendResponse
+from hypyxel.response_objects import Friend, Leaderboard
+from hypyxel.uuids import to_compact, to_hex
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from .utils import StubServer
+
+import json
+import sys
+import uuid
+
+HEX = '46c2bebc24ee44585894a73bd029f637'
+DASHED = '46c2bebc-24ee-4458-5894-a73bd029f637'
+
+
+class CompactUUIDTest(TestCase):
+
+    def tearDown(self):
+        compact_uuids(False)
+
+    def test_conversions(self):
+
+        u = CompactUUID(HEX)
+
+        self.assertEqual(u, CompactUUID(DASHED))
+        self.assertEqual(u, CompactUUID(u.bytes))
+        self.assertEqual(u, CompactUUID(uuid.UUID(HEX)))
+        self.assertEqual(u.to_uuid(), uuid.UUID(HEX))
+        self.assertEqual((u.hex, str(u)), (HEX, HEX))
+        self.assertEqual(len(u.bytes), 16)
+        self.assertEqual(hash(u), hash(CompactUUID(HEX)))
+        self.assertLess(sys.getsizeof(u), sys.getsizeof(HEX))
+
+        self.assertEqual(to_hex(DASHED), HEX)
+        self.assertEqual(to_compact(HEX), u)
+        self.assertIsNone(to_compact(None))
+
+        for i in ('not-an-uuid', b'short', -1, 1 << 128):
+            with self.assertRaises(ValueError):
+                CompactUUID(i)
+
+    def test_objects(self):
+
+        data = {'uuidSender': HEX, 'uuidReceiver': 'invalid'}
+
+        self.assertEqual(Friend(data).sender, HEX)
+
+        compact_uuids()
+        f = Friend(data)
+        self.assertIsInstance(f.sender, CompactUUID)
+        self.assertEqual(f.sender, CompactUUID(HEX))
+        self.assertEqual(f.receiver, 'invalid')
+        self.assertIsNone(Friend({}).sender)
+
+        leaders = Leaderboard({'location': '0,0,0',
+                               'leaders': [DASHED, HEX]}).leaders
+        self.assertEqual(leaders, (CompactUUID(HEX),) * 2)
+
+    def test_setting_captured(self):
+        data = {'success': True, 'records': [{'uuidSender': HEX}]}
+
+        # Setting of the time the response was built, parsed or not
+        before = FriendResponse(data)
+        compact_uuids()
+        after = FriendResponse(data)
+        compact_uuids(False)
+
+        self.assertEqual(before.friends[0].sender, HEX)
+        self.assertEqual(after.friends[0].sender, CompactUUID(HEX))
+
+    def test_api_setting(self):
+        body = json.dumps({'success': True,
+                           'records': [{'uuidSender': HEX}]})
+
+        with StubServer((200, {}, body)) as s:
+            compact = Api(host=s.host, key='test-key-ftw',
+                          compact_uuids=True)
+            sender = compact.friends('uuid').friends[0].sender
+            self.assertIsInstance(sender, CompactUUID)
+
+            compact_uuids()
+            hex_api = Api(host=s.host, key='test-key-ftw',
+                          compact_uuids=False)
+            self.assertEqual(hex_api.friends('uuid').friends[0].sender, HEX)
+
+
+class CompactUUIDRequestTest(IsolatedAsyncioTestCase):
+
+    GUILD = (200, {}, json.dumps({'success': True, 'guild': {
+        'members': [{'uuid': HEX, 'rank': 'Member'}]
+    }}))
+    FRIENDS = (200, {}, '{"success": true, "records": []}')
+
+    def tearDown(self):
+        compact_uuids(False)
+
+    async def test_round_trip(self):
+        compact_uuids()
+
+        with StubServer(self.GUILD, self.FRIENDS) as s:
+            async with AsyncApi(host=s.host, key='test-key-ftw') as api:
+                member = (await api.guild(name='guild')).members[0]
+                self.assertIsInstance(member.id, CompactUUID)
+
+                await api.friends(member.id)
+
+            Api(host=s.host, key='test-key-ftw').friends(member.id)
+
+        # Sent as hex strings, not as 128-bit ints
+        self.assertIn(f'uuid={HEX}', s.requests[1][0])
+        self.assertIn(f'uuid={HEX}', s.requests[2][0])
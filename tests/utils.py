@@ -1,7 +1,10 @@
 from unittest import TestCase
 from typing import List
 
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from os import getenv
+from threading import Thread
+from time import sleep
 
 
 if not getenv('HYPYXEL_TEST_DEBUG', None):
@@ -56,3 +59,56 @@ class HypyxelTestCase(TestCase):
                               base: List[str] = None):
         self.check_properties(o, list(e.keys()) + (base if base else []))
         self.check_properties_values(o, e)
+
+
+class StubServer:
+    """
+    Local HTTP server answering with scripted responses
+    Used to test client behaviours the test_server can not reproduce
+
+    Each response is a (status, headers, body) tuple, the last one is
+    repeated once the script is exhausted. Responses are sent after
+    `delay` seconds.
+    """
+
+    def __init__(self, *responses, delay: float = 0):
+        self.responses = list(responses)
+        self.requests = []
+        self.delay = delay
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                stub.requests.append((self.path, dict(self.headers)))
+
+                status, headers, body = stub.responses[0]
+                if len(stub.responses) > 1:
+                    stub.responses.pop(0)
+
+                if isinstance(body, str):
+                    body = body.encode()
+
+                sleep(stub.delay)
+
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *a):
+                pass
+
+        self._server = ThreadingHTTPServer(('localhost', 0), Handler)
+        self.host = f'http://localhost:{self._server.server_port}'
+
+    def __enter__(self):
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()